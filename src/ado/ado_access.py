@@ -117,6 +117,7 @@ class AzureDevOpsClient:
         
         # Load team area paths configuration
         self.team_area_paths_config = self._load_team_area_paths_config()
+        self._team_area_path_index = self._index_team_area_paths(self.team_area_paths_config)
     
     def _load_team_area_paths_config(self):
         """Load team area paths configuration from JSON file."""
@@ -134,6 +135,15 @@ class AzureDevOpsClient:
             logger.error(f"Error loading team area paths configuration: {e}")
             return {}
     
+    @staticmethod
+    def _index_team_area_paths(config):
+        """Map lowercased configured team names to (team name, first area path)."""
+        index = {}
+        for config_team_name, area_paths in config.get('team_area_path_mappings', {}).items():
+            if area_paths:
+                index.setdefault(config_team_name.lower(), (config_team_name, area_paths[0]))
+        return index
+    
     def _get_team_area_paths(self, team_name, project):
         """Get area paths for a team using configuration or fallback to default construction."""
         if not self.team_area_paths_config:
@@ -152,17 +162,16 @@ class AzureDevOpsClient:
         
         # Try partial matching if enabled - use more precise matching
         if self.team_area_paths_config.get('area_path_patterns', {}).get('partial_matching', False):
-            # Sort by length (longest first) to prefer more specific matches
-            sorted_teams = sorted(team_mappings.items(), key=lambda x: len(x[0]), reverse=True)
-            
-            for config_team_name, area_paths in sorted_teams:
-                # More precise partial matching - check if team name starts with config name
-                # This prevents "Practical Law" from matching "Practical Law - Accessibility-Tigers"
-                # but allows "Practical Law - Accessibility" to match "Practical Law - Accessibility-Tigers"
-                if team_name.lower().startswith(config_team_name.lower()):
-                    if area_paths and len(area_paths) > 0:
-                        logger.info(f"Found partial match for team '{team_name}' -> '{config_team_name}'")
-                        return area_paths[0]
+            # Probe prefixes of the team name, longest first, to prefer more specific matches.
+            # This still lets "Practical Law - Accessibility" match "Practical Law - Accessibility-Tigers"
+            # ahead of "Practical Law", with a dict lookup per prefix instead of a sort and scan
+            team_name_lower = team_name.lower()
+            for end in range(len(team_name_lower), 0, -1):
+                match = self._team_area_path_index.get(team_name_lower[:end])
+                if match:
+                    config_team_name, area_path = match
+                    logger.info(f"Found partial match for team '{team_name}' -> '{config_team_name}'")
+                    return area_path
         
         # Fallback to simple construction
         logger.info(f"No configuration found for team '{team_name}', using default construction")
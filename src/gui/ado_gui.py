@@ -14,26 +14,42 @@ import os
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, OrderedDict
 import io
 import sys
+import traceback
 from contextlib import redirect_stdout
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import quote
 import json
-import subprocess
+import hashlib
+import inspect
+import random
+import math
+import re
+import textwrap
+import pickle
+import shelve
+import dbm
 import time
 from websockets.sync.client import connect
 import base64
 import logging
 
-# Set up logging
+# Set up logging (silent unless the application configures a handler)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ado.ado_access import AzureDevOpsClient
 from openarena.websocket_client import OpenArenaWebSocketClient
+from openarena.config.settings import get_config
 from llm.ado_analysis_prompt import ADOWorkItemAnalysisPrompt
 
 # Import icon helper
@@ -46,22 +62,264 @@ except ImportError:
         def set_application_icon(root):
             print("⚠️ Icon helper not available, using default icon")
 
+# OpenArena configuration, loaded on first use by _config()
+_CONFIG = None
+
+def _config():
+    """Return the OpenArena configuration, loading it once."""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = get_config()
+    return _CONFIG
+
+# Model descriptions shown by show_model_configuration
+_MODEL_INFO = {
+    "claude4opus": "Claude 4 Opus - Advanced reasoning and analysis capabilities",
+    "gpt5": "GPT-5 - Latest OpenAI model with enhanced language understanding",
+    "gemini2pro": "Gemini 2 Pro - Google's advanced multimodal AI model"
+}
+
+# Sample AI-related queries offered by generate_ai_query, and their status bar previews
+_AI_QUERIES = (
+    "Explain how machine learning can improve software development workflows",
+    "What are the best practices for implementing AI in enterprise applications?",
+    "How can natural language processing help with code documentation?",
+    "What are the ethical considerations when deploying AI systems?",
+    "Explain the difference between supervised and unsupervised learning",
+    "How can AI assist in identifying related work items in project management?",
+    "What are the challenges of implementing AI in legacy systems?",
+    "How can AI improve code quality and reduce technical debt?",
+    "Explain the concept of transfer learning in machine learning",
+    "What are the security implications of AI-powered applications?",
+    "How can AI help with automated testing and quality assurance?",
+    "What are the key metrics for measuring AI system performance?",
+    "Explain the concept of explainable AI and its importance",
+    "How can AI assist in project estimation and planning?",
+    "What are the best practices for AI model versioning and deployment?",
+    "How can AI help identify patterns in user behavior and requirements?",
+    "Explain the concept of reinforcement learning in AI",
+    "What are the considerations for AI model bias and fairness?",
+    "How can AI improve collaboration in distributed teams?",
+    "What are the emerging trends in AI for software development?"
+)
+_AI_QUERIES_TRUNC = tuple(q[:50] for q in _AI_QUERIES)
+
+# ADO Operations sub-tabs, built by _build_operation_tab. Each field is
+# (label, StringVar attribute, default, entry width); "action" names the button's method,
+# and "extra" names a method that builds custom output instead of "output"'s text area.
+_ADO_OPERATION_TABS = (
+    {
+        "title": "Query Work Items",
+        "about": "This section allows you to query work items from Azure DevOps using various criteria. "
+                 "You can search by work item type, state, assigned to, or custom queries.",
+        "input_title": "Query Work Items",
+        "fields": (
+            ("Work Item Type:", "query_type_var", "User Story", 20),
+            ("State:", "query_state_var", "", 20),
+            ("Limit:", "query_limit_var", "10", 10),
+        ),
+        "action": ("Query Work Items", "query_work_items"),
+        "output": ("Query Results", "query_output"),
+    },
+    {
+        "title": "Get Work Item",
+        "about": "This section allows you to retrieve a specific work item by its ID from Azure DevOps.",
+        "input_title": "Get Work Item by ID",
+        "fields": (
+            ("Work Item ID:", "get_item_id_var", "", 20),
+        ),
+        # Force refresh bypasses the work item cache
+        "checks": (("Force refresh", "get_item_force_refresh_var"),),
+        "action": ("Get Work Item", "get_work_item"),
+        "output": ("Work Item Details", "get_item_output"),
+    },
+    {
+        "title": "Create Work Item",
+        "about": "This section allows you to create new work items in Azure DevOps.",
+        "input_title": "Create New Work Item",
+        "fields": (
+            ("Work Item Type:", "create_type_var", "User Story", 20),
+            ("Title:", "create_title_var", "", 50),
+            ("Description:", "create_desc_var", "", 50),
+            ("Assigned To:", "create_assigned_var", "", 30),
+            ("Tags (semicolon-separated):", "create_tags_var", "", 50),
+        ),
+        "action": ("Create Work Item", "create_work_item"),
+        "output": ("Result", "create_output"),
+    },
+    {
+        "title": "Update Work Item",
+        "about": "This section allows you to update existing work items in Azure DevOps.",
+        "input_title": "Update Existing Work Item",
+        "fields": (
+            ("Work Item ID:", "update_id_var", "", 20),
+            ("New Title:", "update_title_var", "", 50),
+            ("New Description:", "update_desc_var", "", 50),
+            ("New State:", "update_state_var", "", 20),
+            ("New Assigned To:", "update_assigned_var", "", 30),
+            ("New Tags (semicolon-separated):", "update_tags_var", "", 50),
+        ),
+        "action": ("Update Work Item", "update_work_item"),
+        "output": ("Result", "update_output"),
+    },
+    {
+        "title": "Refine Work Item",
+        "about": "This section allows you to refine work items using AI analysis.",
+        "input_title": "Refine Work Item",
+        "fields": (
+            ("Work Item ID:", "refine_id_var", "", 20),
+        ),
+        "action": ("Refine Work Item", "refine_work_item"),
+        "extra": "_build_refine_output",
+    },
+)
+
+# Static text of the enhanced team filtering info window (show_enhanced_filtering_info)
+_FILTERING_STRATEGY_TEXT = """
+The enhanced team filtering strategy uses multiple fallback methods to ensure you get team-specific work items:
+
+1️⃣ TEAM BACKLOG QUERY (Most Reliable)
+   • Directly queries the team's backlog
+   • Returns only work items assigned to the team
+   • Requires team to have backlog configured
+
+2️⃣ TEAM AREA PATH QUERY (If Configured)
+   • Uses the team's configured area path in Azure DevOps
+   • Searches for work items in the team's area path
+   • Falls back to constructed area paths if not configured
+
+3️⃣ MANUAL AREA PATH MAPPING (Fallback)
+   • Uses custom area path mappings from configuration
+   • Allows you to specify team-specific area paths
+   • Provides fallback when ADO configuration is missing
+
+4️⃣ PROJECT-WIDE QUERY WITH TEAM FILTERING (Last Resort)
+   • Searches all work items in the project
+   • Filters by team-related indicators (area path, assigned to, tags)
+   • Less reliable but ensures you get some results
+        """
+
+_FILTERING_BENEFITS_TEXT = """
+• 🎯 More accurate team filtering
+• 🔄 Multiple fallback strategies
+• ⚙️ Configurable area path mappings
+• 📊 Better work item relevance
+• 🚀 Improved user experience
+        """
+
+_FILTERING_CONFIG_TEXT = """
+• Edit config/team_area_paths.json to customize team mappings
+• Add your team names and corresponding area paths
+• The system will automatically use these mappings
+• No code changes required for basic customization
+        """
+
+# Team area path mappings file opened by configure_area_path_mappings, and its messages
+_AREA_PATH_CONFIG_PATH = "config/team_area_paths.json"
+_AREA_PATH_CONFIG_CREATED_MESSAGE = (
+    f"Default configuration file created at:\n{_AREA_PATH_CONFIG_PATH}\n\n"
+    "Please edit this file to customize your team mappings, then restart the application "
+    "for your changes to take effect."
+)
+_AREA_PATH_CONFIG_OPENED_STATUS = (
+    f"Opened {_AREA_PATH_CONFIG_PATH} for editing; restart the application after making changes"
+)
+
+# Written to the mappings file by configure_area_path_mappings when it is missing
+_DEFAULT_AREA_PATH_CONFIG = r"""{
+    "team_area_path_mappings": {
+        "Practical Law": [
+            "Project\\Practical Law\\Features",
+            "Project\\Practical Law\\Core"
+        ],
+        "Westlaw": [
+            "Project\\Westlaw\\Core",
+            "Project\\Westlaw\\Search"
+        ]
+    },
+    "area_path_patterns": {
+        "team_name_in_path": true,
+        "case_sensitive": false,
+        "partial_matching": true
+    },
+    "fallback_strategies": {
+        "use_team_backlog": true,
+        "use_constructed_paths": true,
+        "use_manual_mapping": true,
+        "use_project_query": true
+    }
+}"""
+
+def _env_int(name, default):
+    """Return the integer value of environment variable name, or default if unset or invalid."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %d", name, value, default)
+        return default
+
+# How many refinement answers _query_refinement keeps (least recently used first); 0 disables it
+_REFINE_CACHE_SIZE = _env_int('OPENARENA_RESPONSE_CACHE_SIZE', 256)
+
+# Prompt sent to OpenArena by refine_work_item
+_REFINE_TEMPLATE = """
+Please help refine this Azure DevOps work item:
+
+Work Item Type: {work_item_type}
+Title: {title}
+Current State: {state}
+Assigned To: {assigned_to}
+Tags: {tags}
+
+Description:
+{description}
+
+Please provide:
+1. A refined and improved title that is clear and actionable
+2. A comprehensive description that includes:
+   - Clear acceptance criteria
+   - Business value and context
+   - Technical considerations
+   - Dependencies and blockers
+3. Suggested tags for better categorization
+4. Recommendations for next steps
+5. Any potential risks or issues to consider
+
+Format your response in a clear, structured manner.
+"""
+
 class RedirectText:
-    """Class to redirect stdout to a tkinter Text widget."""
+    """Class to redirect stdout to a tkinter Text widget.
+    
+    Writes are only queued here, so they are safe from worker threads. The
+    application drains the queues on the Tk main thread and applies each
+    widget's pending text with a single insert.
+    """
+    # One queue per text widget, shared by every redirect that targets it
+    pending = {}
+    
     def __init__(self, text_widget):
         self.text_widget = text_widget
-        self.buffer = ""
+        self.queue = RedirectText.pending.setdefault(text_widget, queue.Queue())
 
     def write(self, string):
-        self.buffer += string
-        self.text_widget.configure(state="normal")
-        self.text_widget.insert(tk.END, string)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state="disabled")
+        self.queue.put_nowait(string)
 
     def flush(self):
         pass
 
+class TextPeer(tk.Text):
+    """A Text widget sharing another Text widget's content through Tk's ``peer create``.
+    
+    The peer has its own view and options (wrap, state, scrolling) but no copy of the text.
+    """
+    def __init__(self, master, source, cnf={}, **kw):
+        tk.BaseWidget._setup(self, master, {})
+        source.tk.call(source._w, "peer", "create", self._w, *self._options(cnf, kw))
+
 class ADOBoardViewerApp:
     """Main application class for the Azure DevOps AI Studio."""
     
@@ -75,6 +333,7 @@ class ADOBoardViewerApp:
             print(f"Warning: Could not load environment variables: {e}")
         
         self.root = root
+        self.root.report_callback_exception = self._report_exception
         self.root.title("Azure DevOps AI Studio")
         self.root.geometry("1200x700")  # Increased width to accommodate wider columns
         self.root.minsize(1000, 600)   # Increased minimum width
@@ -89,6 +348,27 @@ class ADOBoardViewerApp:
         # Create client variable
         self.client = None
         
+        # OpenArena client shared by refinement and model tests (see _get_openarena_client)
+        self._openarena_client = None
+        self._openarena_lock = threading.Lock()
+        
+        # Answers to repeated refinement prompts (see _query_refinement)
+        self._refine_cache = OrderedDict()
+        self._refine_cache_lock = threading.Lock()
+        
+        # Open Arena connectivity tester for the test tab (see _get_tester)
+        self._tester = None
+        self._tester_lock = threading.Lock()
+        
+        # Shared worker pool for background ADO calls (avoids a new OS thread per click)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ado-gui")
+        atexit.register(self._pool.shutdown, wait=False)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # In-flight background calls keyed by request, so identical concurrent calls share one future
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -99,13 +379,91 @@ class ADOBoardViewerApp:
         self.filter_data = {}
         self.enhanced_filter_manager = None
         self.current_work_items = []
+        self.load_hierarchy_var = tk.BooleanVar(value=False)  # Default to False for performance
         
-        # Add caching for related work items to prevent repeated API calls
-        self.related_items_cache = {}
+        # Add caching for related work items to prevent repeated API calls (least recently used first)
+        self.related_items_cache = OrderedDict()
+        self._related_cache_hits = 0
+        self._related_cache_misses = 0
+        
+        # Pending work items redisplay after a hierarchy toggle (see _schedule_hierarchy_redraw)
+        self._hierarchy_redraw_id = None
+        
+        # Full raw LLM response; the raw output tab shows at most raw_output_display_limit characters
+        self._raw_output_text = ""
+        self.raw_output_display_limit = 200_000
         
         # Add cache management methods
         self.cache_max_size = 50  # Limit cache size to prevent memory issues
         
+        # Team details are rendered in pages so large team lists don't block the UI
+        self.team_details_page_size = 100
+        self._teams_buffer = []
+        self._teams_buffer_urls = {}
+        self._teams_cursor = 0
+        self._teams_after_id = None
+        
+        # Area path breakdown rows are inserted a page at a time as the tree is scrolled
+        self.breakdown_page_size = 50
+        
+        # (client, project, team) last handled by on_team_selected
+        self._last_team_selection = None
+        
+        # Loaded teams and their casefolded names, in the same order (see update_team_dropdown)
+        self.all_teams = []
+        self._all_teams_casefold = []
+        
+        # Team backlog URLs cached per (organization URL, project); cleared on reconnect
+        self._team_urls = {}
+        
+        # get_team_info results cached per (project, team); cleared on reconnect
+        self._team_info_cache = {}
+        
+        # Team URL labels share one set of class bindings; the URL is looked up per widget
+        self._url_by_widget = {}
+        self.root.bind_class("TeamUrl", "<Button-1>", self._on_url_click)
+        self.root.bind_class("TeamUrl", "<Enter>", lambda e: e.widget.configure(foreground="purple"))
+        self.root.bind_class("TeamUrl", "<Leave>", lambda e: e.widget.configure(foreground="blue"))
+        
+        # Short-lived cache for work items fetched by ID (Get Work Item tab)
+        self._work_item_cache = {}
+        self._work_item_cache_lock = threading.Lock()
+        self.work_item_cache_max_size = 256
+        self.work_item_cache_ttl = 300  # seconds
+        
+        # On-disk cache of Open Arena single-model test results, keyed by model/workflow/query/persistence
+        self._response_cache_path = Path.home() / ".atlas" / "oa_cache"
+        self._response_cache_lock = threading.Lock()
+        self.response_cache_max_size = 256
+        self.response_cache_ttl = 3600  # seconds
+        
+        # Random source for generate_ai_query
+        self._rng = random.Random()
+        
+        # Session cache of test results for semantically similar queries: (key, vector, result)
+        self._sem_store = []
+        self._sem_lock = threading.Lock()
+        self._embed = None  # sentence-transformers model, loaded on first use (False if unavailable)
+        self._embed_lock = threading.Lock()
+        self.semantic_cache_max_size = 256
+        
+        # Answer tokens streamed by a running single-model test, flushed by _flush_oa_tick
+        self._oa_buf = []
+        self._oa_streaming = False
+        self._oa_streamed = False
+        
+        # Latest Open Arena test status, applied at most every 50 ms by _flush_test_status
+        self._test_status_msg = None
+        self._test_status_pending = False
+        
+        # Enhanced filtering info window, kept hidden between opens (see show_enhanced_filtering_info)
+        self._info_window = None
+        
+        # Filter comboboxes by role ('work_item_type', 'state'), registered as they are created
+        self._combos_by_role = {}
+        # Last values list applied to each filter combobox, to skip redundant Tcl updates
+        self._filter_values_applied = {}
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -118,18 +476,120 @@ class ADOBoardViewerApp:
         self.create_work_items_tab()
         self.create_ado_operations_tab()
         
+        # Tabs that need an ADO connection: Team Selection (2), AI Model Selection (3),
+        # Related Work Items (4) and ADO Operations (5). The Test Open Arena - AI Models
+        # tab (1) stays enabled as it doesn't require an ADO connection.
+        self._gated_tabs = (2, 3, 4, 5)
+        
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         self.status_bar = ttk.Label(self.main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, pady=(5, 0))
         
-        # Load saved settings if available
+        # Periodically move redirected output from worker threads into the text widgets
+        self.output_drain_batch_size = 200
+        self.root.after(50, self._drain_output_queues)
+        
+        # (key, getter) pairs written by save_settings, in file order
+        self._persistent_fields = [
+            ("organization_url", lambda: self.org_url_var.get().strip()),
+            ("project", lambda: self.project_var.get().strip()),
+            ("team", lambda: self.team_var.get().strip()),
+            ("pat", lambda: self.pat_var.get().strip()),
+        ]
+        if hasattr(self, 'llm_work_item_limit_var'):
+            self._persistent_fields.append(("llm_work_item_limit", self.llm_work_item_limit_var.get))
+        if hasattr(self, 'llm_strategy_var'):
+            self._persistent_fields.append(("llm_strategy", self.llm_strategy_var.get))
+        self._persistent_fields.append(("max_ado_work_item_limit", lambda: self.max_ado_work_item_limit))
+        if hasattr(self, 'auto_connect_var'):
+            self._persistent_fields.append(("auto_connect", self.auto_connect_var.get))
+        
+        # Load saved settings if available (the file's text is kept to detect unchanged saves)
+        self._settings_text = None
         self.load_settings()
         
         # Set default maximum ADO limit to prevent VS402337 errors
         self.max_ado_work_item_limit = 19000
     
+    def _submit(self, fn, *args):
+        """Run fn on the shared worker pool and report its outcome back on the Tk thread."""
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self.root.after(0, lambda: self._on_done(f)))
+        return future
+    
+    def _single_flight(self, key, fn):
+        """Submit fn unless an identical request (same key) is already running; return its future."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._submit(fn)
+            self._inflight[key] = future
+        # Registered outside the lock: an already finished future runs the callback immediately
+        future.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return future
+    
+    def _forget_inflight(self, key, future):
+        """Drop future from the in-flight requests once it has finished."""
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
+    def _on_close(self):
+        """Stop queued background work and close the main window."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def _on_done(self, future):
+        """Log any exception that escaped a background task.
+        
+        _submit schedules this on the Tk thread, so it can update the status bar directly.
+        """
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Background task failed: %s", exc)
+            self.status_var.set(f"Error: {exc}")
+    
+    def _report_exception(self, exc, val, tb):
+        """Log an exception raised by a Tk callback and show it in the status bar."""
+        logger.error("Unhandled error in UI callback: %s", val, exc_info=(exc, val, tb))
+        self.status_var.set(f"Error: {val}")
+    
+    def _drain_output_queues(self):
+        """Flush text queued by RedirectText into its widgets on the Tk main thread.
+        
+        If a widget still has queued text after a full batch, the next pass runs as
+        soon as Tk is idle rather than after the regular polling interval.
+        """
+        backlog = False
+        for text_widget, chunks_queue in list(RedirectText.pending.items()):
+            chunks = []
+            try:
+                while len(chunks) < self.output_drain_batch_size:
+                    chunks.append(chunks_queue.get_nowait())
+                backlog = True
+            except queue.Empty:
+                pass
+            
+            if chunks:
+                try:
+                    text_widget.configure(state="normal")
+                    text_widget.insert(tk.END, "".join(chunks))
+                    text_widget.yview_moveto(1.0)
+                    text_widget.configure(state="disabled")
+                except tk.TclError:
+                    # The widget has been destroyed; stop tracking it
+                    RedirectText.pending.pop(text_widget, None)
+        
+        if backlog:
+            self.root.after_idle(self._drain_output_queues)
+        else:
+            self.root.after(50, self._drain_output_queues)
+    
     def create_connection_tab(self):
         """Create the connection tab."""
         connection_frame = ttk.Frame(self.notebook, padding="10")
@@ -374,7 +834,6 @@ class ADOBoardViewerApp:
         perf_settings_button.pack(side=tk.LEFT, padx=(0, 10))
         
         # Hierarchy loading toggle checkbox
-        self.load_hierarchy_var = tk.BooleanVar(value=False)  # Default to False for performance
         hierarchy_checkbox = ttk.Checkbutton(controls_frame, text="📊 Load Hierarchy for All Items", 
                                            variable=self.load_hierarchy_var,
                                            command=self.on_hierarchy_toggle_changed)
@@ -648,6 +1107,9 @@ The analysis will provide insights about:
         columns = ('ID', 'Type', 'State', 'Title', 'Assigned To', 'Created Date', 'Show Related Work Items', 'Analyze with LLM', 'Open in Azure DevOps')
         self.work_items_tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=15)
         
+        # Column names by display id ('#1', '#2', ...) so tooltips need no heading lookups
+        self._tooltip_columns = {f"#{i}": col for i, col in enumerate(columns, 1)}
+        
         # Initialize sorting state
         self.sort_column = None
         self.sort_reverse = False
@@ -705,8 +1167,14 @@ The analysis will provide insights about:
         # Style the action columns to look more clickable
         self.style_action_columns()
         
-        # Add tooltip support for better text visibility
-        self.tooltip = None
+        # Add tooltip support for better text visibility (one shared window, see _tooltip_window)
+        self._tooltip_win = None
+        self._tooltip_label = None
+        self._tooltip_after_id = None
+        self._last_hover = None  # (item, column) the pointer was last over
+        self._hover_after_id = None
+        self._suppress_motion = False  # set while area path discovery runs
+        self._tooltip_cache = {}  # (item, column name) -> shortened tooltip text, cleared when rows change
         self.work_items_tree.bind('<Motion>', self.on_tree_motion)
         self.work_items_tree.bind('<Leave>', self.on_tree_leave)
     
@@ -747,6 +1215,7 @@ The analysis will provide insights about:
                                                 values=["All"], state="readonly", width=15)
         self.work_item_type_combo.grid(row=row, column=1, sticky=tk.W, padx=(5, 10), pady=2)
         self.work_item_type_combo.bind('<<ComboboxSelected>>', self.on_work_item_type_changed)
+        self._combos_by_role['work_item_type'] = self.work_item_type_combo
         
         # State filter
         ttk.Label(main_filters_frame, text="State:").grid(row=row, column=2, sticky=tk.W, pady=2)
@@ -754,6 +1223,7 @@ The analysis will provide insights about:
         self.state_combo = ttk.Combobox(main_filters_frame, textvariable=self.state_filter, 
                                        values=["All"], state="readonly", width=15)
         self.state_combo.grid(row=row, column=3, sticky=tk.W, padx=(5, 10), pady=2)
+        self._combos_by_role['state'] = self.state_combo
         
         # Sub-State filter
         ttk.Label(main_filters_frame, text="Sub-State:").grid(row=row, column=4, sticky=tk.W, pady=2)
@@ -865,7 +1335,6 @@ The analysis will provide insights about:
                 error_msg = f"Error populating filters: {e}"
                 print(f"❌ {error_msg}")
                 logger.error(error_msg)
-                import traceback
                 traceback.print_exc()
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to populate filters: {e}"))
                 self.root.after(0, progress_window.destroy)
@@ -911,7 +1380,6 @@ The analysis will provide insights about:
                 error_msg = f"Error auto-populating filters: {e}"
                 print(f"❌ {error_msg}")
                 logger.error(error_msg)
-                import traceback
                 traceback.print_exc()
         
         # Start async operation in background thread
@@ -930,7 +1398,7 @@ The analysis will provide insights about:
             # Update work item types
             if 'work_item_types' in self.filter_data and hasattr(self, 'work_item_type_combo'):
                 types = ["All"] + self.filter_data['work_item_types']
-                self.work_item_type_combo['values'] = types
+                self._set_filter_values(self.work_item_type_combo, 'work_item_type', types)
                 print(f"✅ Updated work item types: {len(types)-1} types")
             else:
                 if 'work_item_types' not in self.filter_data:
@@ -941,7 +1409,7 @@ The analysis will provide insights about:
             # Update states
             if 'work_item_states' in self.filter_data and hasattr(self, 'state_combo'):
                 states = ["All"] + self.filter_data['work_item_states']
-                self.state_combo['values'] = states
+                self._set_filter_values(self.state_combo, 'state', states)
                 print(f"✅ Updated states: {len(states)-1} states")
             
             # Update sub-states
@@ -1071,6 +1539,7 @@ The analysis will provide insights about:
         # Clear table view
         for item in self.work_items_tree.get_children():
             self.work_items_tree.delete(item)
+        self._tooltip_cache.clear()
         
         # Clear current work items
         self.current_work_items = []
@@ -1872,7 +2341,6 @@ The analysis will provide insights about:
                     return True
                 
                 # Parse dates and compare
-                from datetime import datetime
                 try:
                     item_dt = datetime.strptime(item_date, '%Y-%m-%d')
                     
@@ -1891,7 +2359,6 @@ The analysis will provide insights about:
                     return True
             
             # Handle predefined date ranges
-            from datetime import datetime, timedelta
             item_date = item.get('created_date', '')
             if not item_date:
                 return True
@@ -1942,7 +2409,7 @@ The analysis will provide insights about:
                 self.refine_related_tree.delete(item)
             
             # Check if hierarchy loading is enabled
-            load_hierarchy = getattr(self, 'load_hierarchy_var', None) and self.load_hierarchy_var.get()
+            load_hierarchy = self.load_hierarchy_var.get()
             
             # Add filtered work items to treeview
             for item in work_items:
@@ -2293,7 +2760,6 @@ The analysis will provide insights about:
     
     def get_date_range_from_filter(self, filter_value):
         """Convert date filter selection to date range."""
-        from datetime import datetime, timedelta
         import calendar
         
         if filter_value == "All":
@@ -2458,6 +2924,7 @@ The analysis will provide insights about:
             # Clear existing items
             for item in self.work_items_tree.get_children():
                 self.work_items_tree.delete(item)
+            self._tooltip_cache.clear()
             
             if not self.current_work_items:
                 return
@@ -2555,7 +3022,6 @@ The analysis will provide insights about:
                 return False
             
             # Convert to date object
-            from datetime import datetime
             if hasattr(item_date, 'date'):
                 item_date = item_date.date()
             elif hasattr(item_date, 'strftime'):
@@ -2669,6 +3135,7 @@ The analysis will provide insights about:
         # Clear existing items
         for item in self.work_items_tree.get_children():
             self.work_items_tree.delete(item)
+        self._tooltip_cache.clear()
         
         if not work_items:
             return
@@ -2768,9 +3235,9 @@ The analysis will provide insights about:
             
             # Check cache first to avoid repeated API calls
             cache_key = f"{project_name}_{work_item.id}"
-            if cache_key in self.related_items_cache:
+            related_items = self._cache_get(cache_key)
+            if related_items is not None:
                 print(f"📋 Using cached results for work item {work_item.id}")
-                related_items = self.related_items_cache[cache_key]
                 if related_items:
                     print(f"✅ Found {len(related_items)} cached related work items, displaying in Refine Related Work Items tab...")
                     self.display_related_work_items_in_refine_tab(work_item, related_items)
@@ -2813,7 +3280,6 @@ The analysis will provide insights about:
         except Exception as e:
             error_msg = f"Error retrieving related work items: {str(e)}"
             print(f"❌ {error_msg}")
-            import traceback
             traceback.print_exc()
             messagebox.showerror("Error", error_msg)
     
@@ -3155,11 +3621,7 @@ The analysis will provide insights about:
                 OPENARENA_LLAMA3_70B_WORKFLOW_ID = "llama3_70b_workflow"
             
             # Get selected model and workflow ID for display
-            selected_model = getattr(self, 'current_model_var', None)
-            if selected_model:
-                model_name = selected_model.get()
-            else:
-                model_name = 'gemini25pro'  # fallback
+            model_name = getattr(self, '_current_workflow_id', 'gemini25pro')
             
             # Map model names to display names
             model_display_names = {
@@ -3304,11 +3766,7 @@ The analysis will provide insights about:
                 )
                 
                 # Get selected model and workflow ID
-                selected_model = getattr(self, 'current_model_var', None)
-                if selected_model:
-                    model_name = selected_model.get()
-                else:
-                    model_name = 'gemini2pro'  # fallback
+                model_name = getattr(self, '_current_workflow_id', 'gemini2pro')
                 
                 # Update status with model and workflow info
                 update_status(f"Using AI Model: {model_display_names.get(model_name, model_name.title())}")
@@ -3757,7 +4215,6 @@ Note: The system will not fall back to mock responses to ensure you're aware of
             
         except Exception as e:
             print(f"Error preparing analysis data: {e}")
-            import traceback
             traceback.print_exc()
             # Return a minimal structure instead of empty dict
             return {
@@ -4450,7 +4907,6 @@ Note: The system will not fall back to mock responses to ensure you're aware of
             created_date = item.fields.get('System.CreatedDate', '')
             if created_date:
                 try:
-                    from datetime import datetime
                     # Simple date comparison - more recent = higher score
                     if '2025' in created_date:
                         score += 30
@@ -4796,7 +5252,6 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         try:
             from tkinter import filedialog
             import os
-            from datetime import datetime
             
             # Generate filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -4976,7 +5431,6 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                     created_date = created_date.strftime('%Y-%m-%d')
                 elif isinstance(created_date, str) and created_date != 'Unknown':
                     try:
-                        from datetime import datetime
                         created_date = datetime.fromisoformat(created_date.replace('Z', '+00:00')).strftime('%Y-%m-%d')
                     except:
                         pass
@@ -5070,7 +5524,6 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                     created_date = created_date.strftime('%Y-%m-%d')
                 elif isinstance(created_date, str) and created_date != 'Unknown':
                     try:
-                        from datetime import datetime
                         created_date = datetime.fromisoformat(created_date.replace('Z', '+00:00')).strftime('%Y-%m-%d')
                     except:
                         pass
@@ -5132,6 +5585,10 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         self.get_item_id_var = tk.StringVar()
         ttk.Entry(input_frame, textvariable=self.get_item_id_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
+        # Force refresh checkbox (bypass the work item cache)
+        self.get_item_force_refresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(input_frame, text="Force refresh", variable=self.get_item_force_refresh_var).grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
+        
         # Get button
         get_button = ttk.Button(input_frame, text="Get Work Item", command=self.get_work_item)
         get_button.grid(row=1, column=0, columnspan=2, pady=10)
@@ -5345,12 +5802,12 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         
         # Copy raw output button
         copy_raw_button = ttk.Button(raw_controls_frame, text="Copy Raw Output", 
-                                   command=lambda: self.copy_to_clipboard(self.raw_output))
+                                   command=self.copy_raw_output)
         copy_raw_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Clear raw output button
         clear_raw_button = ttk.Button(raw_controls_frame, text="Clear Raw Output", 
-                                    command=lambda: self.clear_raw_output())
+                                    command=self.clear_raw_output)
         clear_raw_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         self.raw_output = scrolledtext.ScrolledText(raw_frame, wrap=tk.WORD, font=("Consolas", 9), 
@@ -5374,6 +5831,8 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         ttk.Label(current_model_frame, text="Current Model:", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W)
         
         self.current_model_var = tk.StringVar(value="claude4opus")
+        # Plain-Python copy of the current model so worker threads don't read the Tk variable
+        self._current_workflow_id = "claude4opus"
         self.current_model_label = ttk.Label(current_model_frame, textvariable=self.current_model_var, 
                                            font=("TkDefaultFont", 12), foreground="blue")
         self.current_model_label.pack(anchor=tk.W, pady=(5, 0))
@@ -5534,6 +5993,8 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 with redirect_stdout(redirect):
                     print(f"Connecting to {org_url}...")
                     self.client = AzureDevOpsClient(org_url, pat)
+                    self._team_info_cache.clear()
+                    self._team_urls.clear()
                     print(f"Connected successfully to {org_url}")
                     print(f"Project: {project}")
                     if team:
@@ -5548,11 +6009,8 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Connected to Azure DevOps")
                 
                 # Enable other tabs
-                self.notebook.tab(1, state="normal")  # Test Open Arena - AI Models tab
-                self.notebook.tab(2, state="normal")  # ADO Team Selection tab
-                self.notebook.tab(3, state="normal")  # Open Arena - AI Model Selection tab
-                self.notebook.tab(4, state="normal")  # Related Work Items tab
-                self.notebook.tab(5, state="normal")  # ADO Operations tab
+                for idx in self._gated_tabs:
+                    self.notebook.tab(idx, state="normal")
                 
                 # Automatically load teams after successful connection
                 self.root.after(1000, self.auto_load_teams)  # Delay by 1 second to ensure UI is ready
@@ -5566,11 +6024,8 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Connection failed")
                 
                 # Disable other tabs
-                self.notebook.tab(1, state="disabled")  # Test Open Arena - AI Models tab
-                self.notebook.tab(2, state="disabled")  # ADO Team Selection tab
-                self.notebook.tab(3, state="disabled")  # Open Arena - AI Model Selection tab
-                self.notebook.tab(4, state="disabled")  # Related Work Items tab
-                self.notebook.tab(5, state="disabled")  # ADO Operations tab
+                for idx in self._gated_tabs:
+                    self.notebook.tab(idx, state="disabled")
         
         # Start connection thread
         threading.Thread(target=connect_thread).start()
@@ -5889,25 +6344,19 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                         
                         # Analyze the results to determine how team-specific they are
                         print("[DEBUG] Analyzing Results:")
-                        area_paths = {}
-                        for item in work_items:
-                            area_path = item.fields.get("System.AreaPath", "Unknown")
-                            area_paths[area_path] = area_paths.get(area_path, 0) + 1
+                        area_paths = Counter(item.fields.get("System.AreaPath", "Unknown") for item in work_items)
                         
                         # Get team area path for comparison
-                        team_area_path = None
-                        try:
-                            team_info = self.client.get_team_info(project, selected_team)
-                            team_area_path = team_info.get('default_area_path') if team_info else None
-                        except:
-                            pass
+                        team_info = self._team_info(project, selected_team)
+                        team_area_path = team_info.get('default_area_path') if team_info else None
                         
                         # Calculate team-specific percentage
                         team_specific_count = 0
                         if team_area_path:
-                            for path, count in area_paths.items():
-                                if path.startswith(team_area_path):
-                                    team_specific_count += count
+                            # Match the team's own node and its children, not siblings sharing a prefix
+                            team_area_prefix = team_area_path.rstrip('\\') + '\\'
+                            team_specific_count = sum(count for path, count in area_paths.items()
+                                                      if path == team_area_path or path.startswith(team_area_prefix))
                             
                             team_specific_percentage = (team_specific_count / len(work_items) * 100)
                             
@@ -6492,339 +6941,310 @@ Note: The system will not fall back to mock responses to ensure you're aware of
     
     def filter_teams(self, event):
         """Filter teams based on user input in the combobox."""
-        try:
-            # Get the current input value
-            current_value = self.team_selection_var.get().lower()
-            
-            # Get all available teams
-            all_teams = self.team_combo['values']
-            
-            if not current_value:
-                # If no input, show all teams
-                self.team_combo['values'] = all_teams
+        # Get the current input value
+        needle = self.team_selection_var.get().casefold()
+        
+        if not needle:
+            # If no input, show all teams
+            self.team_combo['values'] = self.all_teams
+            return
+        
+        # Filter the loaded teams that contain the input value, using their precomputed casefolded names
+        filtered_teams = [team for team, key in zip(self.all_teams, self._all_teams_casefold) if needle in key]
+        
+        # Update the dropdown values
+        self.team_combo['values'] = filtered_teams
+        
+        # If there's only one match, select it
+        if len(filtered_teams) == 1:
+            self.team_combo.set(filtered_teams[0])
+            self.team_selection_var.set(filtered_teams[0])
+            self.on_team_selected(None)
+    
+    def on_team_selected(self, event):
+        """Handle team selection from dropdown."""
+        selected_team = self.team_selection_var.get()
+        
+        if selected_team and selected_team != "No teams available":
+            # Re-selecting the same team on the same connection and project changes nothing,
+            # so don't re-run the filter population requests
+            selection = (self.client, self.team_project_var.get().strip(), selected_team)
+            if selection == self._last_team_selection:
                 return
+            self._last_team_selection = selection
             
-            # Filter teams that contain the input value
-            filtered_teams = [team for team in all_teams if current_value in team.lower()]
+            # Update the team variable in the connection tab
+            self.team_var.set(selected_team)
             
-            # Update the dropdown values
-            self.team_combo['values'] = filtered_teams
+            # Update status
+            self.status_var.set(f"Team automatically set to: {selected_team}")
             
-            # If there's only one match, select it
-            if len(filtered_teams) == 1:
-                self.team_combo.set(filtered_teams[0])
-                self.team_selection_var.set(filtered_teams[0])
-                self.on_team_selected(None)
+            # Update filter frame title with selected team
+            self.update_filter_frame_title(selected_team)
             
-        except Exception as e:
-            print(f"Error filtering teams: {str(e)}")
-    
-    def on_team_selected(self, event):
-        """Handle team selection from dropdown."""
-        try:
-            selected_team = self.team_selection_var.get()
+            # Show confirmation in status bar (not popup to avoid interruption)
+            logger.debug("Team %r has been automatically set", selected_team)
             
-            if selected_team and selected_team != "No teams available":
-                # Update the team variable in the connection tab
-                self.team_var.set(selected_team)
-                
-                # Update status
-                self.status_var.set(f"Team automatically set to: {selected_team}")
-                
-                # Update filter frame title with selected team
-                self.update_filter_frame_title(selected_team)
-                
-                # Show confirmation in status bar (not popup to avoid interruption)
-                print(f"✅ Team '{selected_team}' has been automatically set!")
-                print(f"💡 You can now use this team in other tabs.")
-                
-                # Auto-populate enhanced filters in background thread
-                if self.client:
-                    print(f"🔄 Auto-populating enhanced filters for team '{selected_team}'...")
-                    self.auto_populate_enhanced_filters()
-                else:
-                    print("⚠️ No ADO connection available. Filters will be populated when connection is established.")
-                
-        except Exception as e:
-            print(f"Error handling team selection: {str(e)}")
+            # Auto-populate enhanced filters in background thread
+            if self.client:
+                logger.debug("Auto-populating enhanced filters for team %r", selected_team)
+                self.auto_populate_enhanced_filters()
+            else:
+                logger.debug("No ADO connection available; filters will be populated when connection is established")
     
     def populate_filters_dynamically(self):
         """Dynamically populate the work item type and state filters with actual values from the project."""
-        try:
-            if not self.client:
-                return
-            
-            project = self.team_project_var.get().strip()
-            if not project:
-                return
-            
-            # Get work item types and states in a separate thread to avoid blocking the UI
-            def populate_filters_thread():
-                try:
-                    # Get available work item types
-                    work_item_types = self.client.get_work_item_types(project)
-                    if work_item_types:
-                        # Update the work item type filter dropdown
-                        self.root.after(0, lambda: self.update_work_item_type_filter(work_item_types))
-                        
-                        # After updating work item types, trigger state filter update based on current selection
-                        self.root.after(100, self.on_work_item_type_changed)
-                    else:
-                        # Fallback: get available states for all work item types
-                        states = self.client.get_work_item_states(project)
-                        if states:
-                            # Update the state filter dropdown
-                            self.root.after(0, lambda: self.update_state_filter(states))
-                        
-                except Exception as e:
-                    print(f"Warning: Could not populate filters dynamically: {e}")
-                    print("Using default filter values instead.")
-            
-            # Start the thread
-            threading.Thread(target=populate_filters_thread, daemon=True).start()
-            
-        except Exception as e:
-            print(f"Error setting up dynamic filter population: {e}")
+        if not self.client:
+            return
+        
+        project = self.team_project_var.get().strip()
+        if not project:
+            return
+        
+        # Get work item types and states in a separate thread to avoid blocking the UI
+        def populate_filters_thread():
+            try:
+                # Get available work item types
+                work_item_types = self.client.get_work_item_types(project)
+                if work_item_types:
+                    # Update the work item type filter dropdown, then refresh the state
+                    # filter for the current selection once the new types are applied
+                    def apply_types(types=work_item_types):
+                        self.update_work_item_type_filter(types)
+                        self.on_work_item_type_changed()
+                    self.root.after(0, apply_types)
+                else:
+                    # Fallback: get available states for all work item types
+                    states = self.client.get_work_item_states(project)
+                    if states:
+                        # Update the state filter dropdown
+                        self.root.after(0, lambda: self.update_state_filter(states))
+                    
+            except Exception as e:
+                logger.warning("Could not populate filters dynamically, using default filter values: %s", e)
+        
+        # Start the thread
+        self._submit(populate_filters_thread)
     
     def update_work_item_type_filter(self, work_item_types):
         """Update the work item type filter dropdown with actual values."""
-        try:
-            # Add "All" at the beginning
-            all_types = ["All"] + sorted(work_item_types)
-            
-            # Update the combobox values
-            for widget in self.root.winfo_children():
-                if hasattr(widget, 'winfo_children'):
-                    for child in widget.winfo_children():
-                        if hasattr(child, 'winfo_children'):
-                            for grandchild in child.winfo_children():
-                                if hasattr(grandchild, 'winfo_children'):
-                                    for great_grandchild in grandchild.winfo_children():
-                                        if hasattr(great_grandchild, 'winfo_children'):
-                                            for filters_frame in great_grandchild.winfo_children():
-                                                if hasattr(filters_frame, 'grid_slaves'):
-                                                    # Find the work item type combobox
-                                                    for widget in filters_frame.grid_slaves():
-                                                        if hasattr(widget, 'cget') and widget.cget('textvariable') == str(self.work_item_type_filter):
-                                                            widget['values'] = all_types
-                                                            print(f"✅ Updated work item type filter with {len(work_item_types)} types")
-                                                            return
-            
-            # Fallback: try to find the combobox by searching through the notebook
-            for tab_id in range(self.notebook.index('end')):
-                tab_widget = self.notebook.nametowidget(tab_id)
-                self._find_and_update_combobox(tab_widget, 'work_item_type', all_types)
-                
-        except Exception as e:
-            print(f"Error updating work item type filter: {e}")
+        # Add "All" at the beginning
+        all_types = ["All"] + sorted(work_item_types)
+        self._find_and_update_combobox('work_item_type', all_types)
     
     def update_state_filter(self, states):
         """Update the state filter dropdown with actual values."""
-        try:
-            # Add "All" at the beginning
-            all_states = ["All"] + sorted(states)
-            
-            # Find and update the state filter combobox
-            for tab_id in range(self.notebook.index('end')):
-                tab_widget = self.notebook.nametowidget(tab_id)
-                self._find_and_update_combobox(tab_widget, 'state', all_states)
-                
-        except Exception as e:
-            print(f"Error updating state filter: {e}")
-    
-    def _find_and_update_combobox(self, parent_widget, filter_type, values):
-        """Recursively find and update a combobox widget."""
-        try:
-            for widget in parent_widget.winfo_children():
-                # Check if this is a combobox widget
-                if isinstance(widget, ttk.Combobox):
-                    try:
-                        # Get the textvariable safely
-                        textvar = widget.cget('textvariable')
-                        if textvar:
-                            if filter_type == 'work_item_type' and textvar == str(self.work_item_type_filter):
-                                widget['values'] = values
-                                print(f"✅ Updated {filter_type} filter with {len(values)-1} values")
-                                return True
-                            elif filter_type == 'state' and textvar == str(self.state_filter):
-                                widget['values'] = values
-                                print(f"✅ Updated {filter_type} filter with {len(values)-1} values")
-                                return True
-                    except Exception as e:
-                        # Skip this widget if we can't get textvariable
-                        continue
-                
-                # Recursively search children
-                if hasattr(widget, 'winfo_children'):
-                    if self._find_and_update_combobox(widget, filter_type, values):
-                        return True
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error in _find_and_update_combobox: {e}")
+        # Add "All" at the beginning
+        all_states = ["All"] + sorted(states)
+        self._find_and_update_combobox('state', all_states)
+    
+    def _find_and_update_combobox(self, filter_type, values):
+        """Update the filter combobox registered for ``filter_type``; return whether one was found."""
+        combo = self._combos_by_role.get(filter_type)
+        if combo is None:
             return False
+        
+        self._set_filter_values(combo, filter_type, values)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated %s filter with %d values", filter_type, len(values) - 1)
+        return True
+
+    def _set_filter_values(self, combo, filter_type, values):
+        """Set a filter combobox's values unless the same list was already applied."""
+        values = tuple(values)
+        if self._filter_values_applied.get(filter_type) != values:
+            combo['values'] = values
+            self._filter_values_applied[filter_type] = values
 
     def on_work_item_type_changed(self, event=None):
         """Handle work item type selection change to update state filter."""
-        try:
-            if not self.client:
-                print("⚠️ No ADO client available for work item type change")
-                return
-            
-            project = self.team_project_var.get().strip()
-            if not project:
-                print("⚠️ No project selected for work item type change")
-                return
-            
-            selected_work_item_type = self.work_item_type_filter.get()
-            print(f"🔄 Work item type changed to: '{selected_work_item_type}'")
-            
-            # Get states based on selected work item type
-            def update_states_thread():
-                try:
-                    if selected_work_item_type == "All":
-                        # Get all unique states from all work item types
-                        all_states = self.client.get_work_item_states(project)
-                        print(f"📋 Getting all states for 'All' work item types: {len(all_states)} states")
-                    else:
-                        # Get states for specific work item type
-                        all_states = self.client.get_work_item_states_for_type(project, selected_work_item_type)
-                        print(f"📋 Getting states for '{selected_work_item_type}': {len(all_states)} states")
+        if not self.client:
+            logger.warning("No ADO client available for work item type change")
+            return
+        
+        project = self.team_project_var.get().strip()
+        if not project:
+            logger.warning("No project selected for work item type change")
+            return
+        
+        selected_work_item_type = self.work_item_type_filter.get()
+        logger.debug("Work item type changed to %r", selected_work_item_type)
+        
+        # Get states based on selected work item type
+        def update_states_thread():
+            try:
+                if selected_work_item_type == "All":
+                    # Get all unique states from all work item types
+                    all_states = self.client.get_work_item_states(project)
+                    logger.debug("Getting all states for 'All' work item types: %d states", len(all_states))
+                else:
+                    # Get states for specific work item type
+                    all_states = self.client.get_work_item_states_for_type(project, selected_work_item_type)
+                    logger.debug("Getting states for %r: %d states", selected_work_item_type, len(all_states))
+                
+                if all_states:
+                    # Add "All" at the beginning
+                    states_with_all = ["All"] + sorted(all_states)
                     
-                    if all_states:
-                        # Add "All" at the beginning
-                        states_with_all = ["All"] + sorted(all_states)
-                        
-                        # Update the state filter dropdown in the main thread
-                        self.root.after(0, lambda: self.update_state_filter_for_work_item_type(states_with_all, selected_work_item_type))
-                    else:
-                        print(f"⚠️ No states found for work item type '{selected_work_item_type}'")
-                        
-                except Exception as e:
-                    print(f"❌ Error getting states for work item type '{selected_work_item_type}': {e}")
-                    # Fallback to default states
-                    default_states = ["All", "Active", "Closed", "Resolved", "New", "In Progress", "Removed"]
-                    self.root.after(0, lambda: self.update_state_filter_for_work_item_type(default_states, selected_work_item_type))
-            
-            # Start the thread to avoid blocking the UI
-            threading.Thread(target=update_states_thread, daemon=True).start()
-            
-        except Exception as e:
-            print(f"❌ Error handling work item type change: {e}")
+                    # Update the state filter dropdown in the main thread
+                    self.root.after(0, lambda: self.update_state_filter_for_work_item_type(states_with_all, selected_work_item_type))
+                else:
+                    logger.warning("No states found for work item type '%s'", selected_work_item_type)
+                    
+            except Exception as e:
+                logger.error("Error getting states for work item type '%s': %s", selected_work_item_type, e)
+                # Fallback to default states
+                default_states = ["All", "Active", "Closed", "Resolved", "New", "In Progress", "Removed"]
+                self.root.after(0, lambda: self.update_state_filter_for_work_item_type(default_states, selected_work_item_type))
+        
+        # Run in the background; rapid toggles to the same type share one request
+        self._single_flight(("states", project, selected_work_item_type), update_states_thread)
 
     def update_state_filter_for_work_item_type(self, states, work_item_type):
         """Update the state filter dropdown with states relevant to the selected work item type."""
-        try:
-            # Find and update the state filter combobox
-            for tab_id in range(self.notebook.index('end')):
-                tab_widget = self.notebook.nametowidget(tab_id)
-                if self._find_and_update_combobox(tab_widget, 'state', states):
-                    print(f"✅ Updated state filter for '{work_item_type}' with {len(states)-1} states")
-                    
-                    # Reset state filter to "All" when work item type changes
-                    current_state = self.state_filter.get()
-                    if current_state not in states:
-                        self.state_filter.set("All")
-                        print(f"🔄 Reset state filter to 'All' (previous state '{current_state}' not available for '{work_item_type}')")
-                    else:
-                        print(f"✅ State filter '{current_state}' is still valid for '{work_item_type}'")
-                    return
-            
-            print(f"⚠️ Could not find state filter combobox to update for '{work_item_type}'")
-            
-        except Exception as e:
-            print(f"❌ Error updating state filter for work item type '{work_item_type}': {e}")
+        # Find and update the state filter combobox
+        if self._find_and_update_combobox('state', states):
+            logger.debug("Updated state filter for %r with %d states", work_item_type, len(states) - 1)
+            
+            # Reset state filter to "All" when work item type changes
+            current_state = self.state_filter.get()
+            if current_state not in states:
+                self.state_filter.set("All")
+                logger.debug("Reset state filter to 'All' (previous state %r not available for %r)", current_state, work_item_type)
+            else:
+                logger.debug("State filter %r is still valid for %r", current_state, work_item_type)
+            return
+        
+        logger.warning("Could not find state filter combobox to update for '%s'", work_item_type)
     
     def update_team_dropdown(self, teams):
         """Update the team selection dropdown with available teams."""
-        try:
-            # Sort teams alphabetically
-            sorted_teams = sorted(teams, key=str.lower)
-            
-            # Store all teams for filtering
-            self.all_teams = sorted_teams
-            
-            self.team_combo['values'] = sorted_teams
-            if sorted_teams:
-                # Use the first team as default
-                selected_team = sorted_teams[0]
-                print(f"✅ Setting default team to: {selected_team}")
-                
-                self.team_combo.set(selected_team)
-                # Automatically set the selected team
-                self.team_selection_var.set(selected_team)
-                self.on_team_selected(None)
-            else:
-                self.team_combo.set("No teams available")
-                self.team_selection_var.set("")
-        except Exception as e:
-            print(f"Error updating team dropdown: {str(e)}")
+        # Sort teams alphabetically (case-insensitive), computing each key only once
+        decorated = sorted(zip(map(str.casefold, teams), teams))
+        sorted_teams = [team for _, team in decorated]
+        
+        # Store all teams for filtering, with their casefolded names in the same order
+        self.all_teams = sorted_teams
+        self._all_teams_casefold = [key for key, _ in decorated]
+        
+        # Build the team backlog URLs once so re-renders only need dict lookups
+        self._cache_team_urls(sorted_teams)
+        
+        self.team_combo['values'] = sorted_teams
+        if sorted_teams:
+            # Use the first team as default
+            selected_team = sorted_teams[0]
+            logger.debug("Setting default team to: %s", selected_team)
+            
+            self.team_combo.set(selected_team)
+            # Automatically set the selected team
+            self.team_selection_var.set(selected_team)
+            self.on_team_selected(None)
+        else:
+            self.team_combo.set("No teams available")
+            self.team_selection_var.set("")
     
     def update_team_details(self, teams):
-        """Update the team details display with team information and URLs."""
-        try:
-            # Clear existing team details
-            for widget in self.team_details_frame.winfo_children():
-                widget.destroy()
-            
-            # Add summary header
-            summary_frame = ttk.Frame(self.team_details_frame)
-            summary_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            summary_label = ttk.Label(summary_frame, 
-                                    text=f"Total Teams: {len(teams)}", 
-                                    font=("TkDefaultFont", 12, "bold"),
-                                    foreground="green")
-            summary_label.pack(anchor=tk.W)
-            
-            # Add separator
-            separator = ttk.Separator(summary_frame, orient='horizontal')
-            separator.pack(fill=tk.X, pady=5)
-            
-            # Create team information display
-            for i, team in enumerate(teams):
-                team_frame = ttk.Frame(self.team_details_frame)
-                team_frame.pack(fill=tk.X, pady=2)
-                
-                # Team name with number
-                team_label = ttk.Label(team_frame, text=f"{i+1}. {team}", font=("TkDefaultFont", 9, "bold"))
-                team_label.pack(anchor=tk.W)
-                
-                # Generate team URL dynamically
-                project = self.team_project_var.get().strip()
-                org_url = getattr(self.client, 'organization_url', 'https://dev.azure.com/your-organization') if self.client else 'https://dev.azure.com/your-organization'
-                
-                # Create the team backlog URL
-                team_name_encoded = team.replace(' ', '%20').replace('-', '%20')
-                url = f"{org_url}/{project}/_backlogs/backlog/{team_name_encoded}/Epics"
-                
-                url_frame = ttk.Frame(team_frame)
-                url_frame.pack(fill=tk.X, padx=(20, 30))
-                
-                # Configure the URL frame to expand
-                url_frame.columnconfigure(0, weight=1)
-                url_frame.columnconfigure(1, weight=0)
-                
-                url_label = ttk.Label(url_frame, text=f"   URL: {url}", font=("TkDefaultFont", 8), foreground="blue", cursor="hand2")
-                url_label.grid(row=0, column=0, sticky="w")
-                
-                # Copy URL button
-                copy_button = ttk.Button(url_frame, text="📋 Copy", command=lambda u=url: self.copy_url_to_clipboard(u), width=8)
-                copy_button.grid(row=0, column=1, sticky="e", padx=(10, 0))
-                
-                # Make URL clickable (bind click event)
-                url_label.bind("<Button-1>", lambda e, u=url: self.open_url(u))
-                url_label.bind("<Enter>", lambda e: url_label.configure(foreground="purple"))
-                url_label.bind("<Leave>", lambda e: url_label.configure(foreground="blue"))
-                
-                # Add separator
-                if i < len(teams) - 1:
-                    separator = ttk.Separator(team_frame, orient='horizontal')
-                    separator.pack(fill=tk.X, pady=2)
-                    
-        except Exception as e:
-            print(f"Error updating team details: {str(e)}")
+        """Update the team details display with team information and URLs.
+        
+        Only the first page of teams is rendered immediately; the remaining rows are
+        inserted in batches from idle callbacks so the UI stays responsive.
+        """
+        # Cancel any batch insertion still pending from a previous refresh
+        if self._teams_after_id is not None:
+            self.root.after_cancel(self._teams_after_id)
+            self._teams_after_id = None
+        
+        # Clear existing team details
+        for widget in self.team_details_frame.winfo_children():
+            widget.destroy()
+        self._url_by_widget.clear()
+        
+        # Add summary header
+        summary_frame = ttk.Frame(self.team_details_frame)
+        summary_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        summary_label = ttk.Label(summary_frame, 
+                                text=f"Total Teams: {len(teams)}", 
+                                font=("TkDefaultFont", 12, "bold"),
+                                foreground="green")
+        summary_label.pack(anchor=tk.W)
+        
+        # Add separator
+        separator = ttk.Separator(summary_frame, orient='horizontal')
+        separator.pack(fill=tk.X, pady=5)
+        
+        # Render the first page now and schedule the rest
+        self._teams_buffer = list(teams)
+        self._teams_cursor = 0
+        self._teams_buffer_urls = self._cache_team_urls(self._teams_buffer)
+        self._insert_more_teams()
+    
+    def _insert_more_teams(self):
+        """Insert the next page of team rows and re-schedule until all are shown."""
+        self._teams_after_id = None
+        teams = self._teams_buffer
+        start = self._teams_cursor
+        end = min(start + self.team_details_page_size, len(teams))
+        urls = self._teams_buffer_urls
+        
+        for i in range(start, end):
+            self._add_team_detail_row(i, teams[i], len(teams), urls[teams[i]])
+        
+        self._teams_cursor = end
+        if self._teams_cursor < len(teams):
+            # Let keystrokes and other UI events interleave between pages
+            self._teams_after_id = self.root.after_idle(self._insert_more_teams)
+    
+    def _add_team_detail_row(self, i, team, total, url):
+        """Add a single team row (name, URL and copy button) to the team details display."""
+        team_frame = ttk.Frame(self.team_details_frame)
+        team_frame.pack(fill=tk.X, pady=2)
+        
+        # Team name with number
+        team_label = ttk.Label(team_frame, text=f"{i+1}. {team}", font=("TkDefaultFont", 9, "bold"))
+        team_label.pack(anchor=tk.W)
+        
+        url_frame = ttk.Frame(team_frame)
+        url_frame.pack(fill=tk.X, padx=(20, 30))
+        
+        # Configure the URL frame to expand
+        url_frame.columnconfigure(0, weight=1)
+        url_frame.columnconfigure(1, weight=0)
+        
+        url_label = ttk.Label(url_frame, text=f"   URL: {url}", font=("TkDefaultFont", 8), foreground="blue", cursor="hand2")
+        url_label.grid(row=0, column=0, sticky="w")
+        
+        # Copy URL button
+        copy_button = ttk.Button(url_frame, text="📋 Copy", command=lambda u=url: self.copy_url_to_clipboard(u), width=8)
+        copy_button.grid(row=0, column=1, sticky="e", padx=(10, 0))
+        
+        # Make URL clickable via the shared "TeamUrl" class bindings
+        url_label.bindtags(("TeamUrl",) + url_label.bindtags())
+        self._url_by_widget[str(url_label)] = url
+        
+        # Add separator
+        if i < total - 1:
+            separator = ttk.Separator(team_frame, orient='horizontal')
+            separator.pack(fill=tk.X, pady=2)
+    
+    def _cache_team_urls(self, teams):
+        """Return the team -> backlog URL mapping for the current org/project, filling in missing teams."""
+        project = self.team_project_var.get().strip()
+        org_url = getattr(self.client, 'organization_url', 'https://dev.azure.com/your-organization') if self.client else 'https://dev.azure.com/your-organization'
+        
+        urls = self._team_urls.setdefault((org_url, project), {})
+        for team in teams:
+            if team not in urls:
+                # Hyphens become spaces as before, so existing team URLs are unchanged
+                urls[team] = f"{org_url}/{project}/_backlogs/backlog/{quote(team.replace('-', ' '), safe='')}/Epics"
+        return urls
+    
+    def _on_url_click(self, event):
+        """Open the URL of the team URL label that was clicked."""
+        url = self._url_by_widget.get(str(event.widget))
+        if url:
+            self.open_url(url)
     
     def copy_url_to_clipboard(self, url):
         """Copy the team URL to clipboard."""
@@ -6832,16 +7252,16 @@ Note: The system will not fall back to mock responses to ensure you're aware of
             self.root.clipboard_clear()
             self.root.clipboard_append(url)
             self.status_var.set(f"URL copied to clipboard: {url[:50]}...")
-        except Exception as e:
+        except tk.TclError as e:
             self.status_var.set(f"Failed to copy URL: {str(e)}")
     
     def open_url(self, url):
         """Open the team URL in the default browser."""
+        import webbrowser
         try:
-            import webbrowser
             webbrowser.open(url)
             self.status_var.set(f"Opening URL: {url[:50]}...")
-        except Exception as e:
+        except webbrowser.Error as e:
             self.status_var.set(f"Failed to open URL: {str(e)}")
     
     def set_selected_team(self):
@@ -6873,9 +7293,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
     
     def get_work_item(self):
         """Get a work item by ID."""
-        print("🔍 DEBUG: ==========================================")
-        print("🔍 DEBUG: get_work_item() called")
-        print("🔍 DEBUG: ==========================================")
+        logger.debug("get_work_item() called")
         
         # Check if connected
         if not self.client:
@@ -6901,12 +7319,14 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         # Redirect stdout to the output text widget
         redirect = RedirectText(self.get_item_output)
         
+        force_refresh = self.get_item_force_refresh_var.get()
+        
         # Get work item in a separate thread
         def get_item_thread():
             try:
                 # Get work item
                 with redirect_stdout(redirect):
-                    work_item = self.client.get_work_item(work_item_id)
+                    work_item = self._cached_get_work_item(work_item_id, force_refresh)
                     self.client.print_work_item_details(work_item)
                 
                 # Update status
@@ -6921,13 +7341,31 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Failed to retrieve work item")
         
         # Start thread
-        threading.Thread(target=get_item_thread).start()
+        self._submit(get_item_thread)
+    
+    def _cached_get_work_item(self, work_item_id, force_refresh=False):
+        """Get a work item by ID, serving repeat requests from a bounded TTL cache."""
+        now = time.monotonic()
+        if not force_refresh:
+            with self._work_item_cache_lock:
+                cached = self._work_item_cache.get(work_item_id)
+            if cached and now - cached[0] < self.work_item_cache_ttl:
+                return cached[1]
+        
+        work_item = self.client.get_work_item(work_item_id)
+        
+        with self._work_item_cache_lock:
+            self._work_item_cache.pop(work_item_id, None)
+            if len(self._work_item_cache) >= self.work_item_cache_max_size:
+                # Remove the oldest entry
+                del self._work_item_cache[next(iter(self._work_item_cache))]
+            self._work_item_cache[work_item_id] = (now, work_item)
+        
+        return work_item
     
     def query_work_items(self):
         """Query work items."""
-        print("🔍 DEBUG: ==========================================")
-        print("🔍 DEBUG: query_work_items() called")
-        print("🔍 DEBUG: ==========================================")
+        logger.debug("query_work_items() called")
         
         # Check if connected
         if not self.client:
@@ -7013,7 +7451,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Query failed")
         
         # Start thread
-        threading.Thread(target=query_thread).start()
+        self._submit(query_thread)
     
     def get_board_columns(self):
         """Get board columns."""
@@ -7073,7 +7511,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Failed to retrieve board columns")
         
         # Start thread
-        threading.Thread(target=board_thread).start()
+        self._submit(board_thread)
     
     def create_work_item(self):
         """Create a new work item."""
@@ -7148,7 +7586,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Failed to create work item")
         
         # Start thread
-        threading.Thread(target=create_thread).start()
+        self._submit(create_thread)
     
     def update_work_item(self):
         """Update an existing work item."""
@@ -7217,6 +7655,10 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                     print(f"Updated work item {work_item_id}")
                     self.client.print_work_item_details(work_item)
                 
+                # Drop any cached copy so Get Work Item shows the updated fields
+                with self._work_item_cache_lock:
+                    self._work_item_cache.pop(work_item_id, None)
+                
                 # Update status
                 self.status_var.set(f"Updated work item {work_item_id}")
                 
@@ -7229,7 +7671,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                 self.status_var.set("Failed to update work item")
         
         # Start thread
-        threading.Thread(target=update_thread).start()
+        self._submit(update_thread)
     
     def refine_work_item(self):
         """Refine a work item using OpenArena LLM."""
@@ -7254,9 +7696,7 @@ Note: The system will not fall back to mock responses to ensure you're aware of
         self.refine_output.delete(1.0, tk.END)
         self.refine_output.configure(state="disabled")
         
-        self.raw_output.configure(state="normal")
-        self.raw_output.delete(1.0, tk.END)
-        self.raw_output.configure(state="disabled")
+        self._set_raw_output("")
         
         # Redirect stdout to the output text widget
         redirect = RedirectText(self.refine_output)
@@ -7291,77 +7731,44 @@ Note: The system will not fall back to mock responses to ensure you're aware of
                     
                     print(f"\n=== Refining with OpenArena LLM ===")
                     
-                    # Try to create OpenArena client, fall back to mock if it fails
+                    # Get the shared OpenArena client (validated on first use)
                     use_mock = False
+                    workflow_id = getattr(self, '_current_workflow_id', 'gemini2pro')
+                    
                     try:
-                        openarena_client = OpenArenaWebSocketClient()
-                        print("Connected to OpenArena WebSocket")
-                        
-                        # Test the connection with a simple query first
-                        selected_model = getattr(self, 'current_model_var', None)
-                        if selected_model:
-                            workflow_id = selected_model.get()
-                        else:
-                            workflow_id = 'gemini2pro'  # fallback
-                        
-                        test_answer, test_cost = openarena_client.query_workflow(
-                            workflow_id=workflow_id,
-                            query="Hello, test connection",
-                            is_persistence_allowed=False
-                        )
-                        
-                        if not test_answer or 'error' in test_cost:
-                            raise Exception(f"OpenArena test query failed: {test_cost}")
-                        
-                        print("OpenArena connection validated successfully")
+                        openarena_client = self._get_openarena_client(validate_workflow_id=workflow_id)
+                        print("OpenArena connection validated successfully")
+                        use_mock = True
                         
                     except Exception as e:
+                        connection_error = e
                         print(f"OpenArena connection/validation failed: {e}")
                         print("OpenArena connection failed - cannot proceed with refinement")
                         use_mock = False
                     
                     # Prepare the refinement prompt
-                    refinement_prompt = f"""
-Please help refine this Azure DevOps work item:
-
-Work Item Type: {work_item_type}
-Title: {title}
-Current State: {state}
-Assigned To: {assigned_to}
-Tags: {tags}
-
-Description:
-{description if description else 'No description provided'}
-
-Please provide:
-1. A refined and improved title that is clear and actionable
-2. A comprehensive description that includes:
-   - Clear acceptance criteria
-   - Business value and context
-   - Technical considerations
-   - Dependencies and blockers
-3. Suggested tags for better categorization
-4. Recommendations for next steps
-5. Any potential risks or issues to consider
-
-Format your response in a clear, structured manner.
-"""
+                    refinement_prompt = _REFINE_TEMPLATE.format(
+                        work_item_type=work_item_type,
+                        title=title,
+                        state=state,
+                        assigned_to=assigned_to,
+                        tags=tags,
+                        description=description if description else 'No description provided'
+                    )
                     
                     if use_mock:
                         print("Sending refinement request to OpenArena LLM...")
+                        print("\n=== Refined Work Item ===")
                         
-                        # Use selected model workflow for refinement
-                        selected_model = getattr(self, 'current_model_var', None)
-                        if selected_model:
-                            workflow_id = selected_model.get()
-                        else:
-                            workflow_id = 'gemini2pro'  # fallback
-                        
-                        refined_content, cost_tracker = openarena_client.query_workflow(
+                        # Stream the response into the output tab as it arrives
+                        refined_content, cost_tracker = self._query_refinement(
+                            openarena_client,
                             workflow_id=workflow_id,
                             query=refinement_prompt,
-                            is_persistence_allowed=False
+                            is_persistence_allowed=False,
+                            on_chunk=redirect.write
                         )
+                        print()
                     else:
                         # Show error message when OpenArena connection fails
                         error_msg = f"""OpenArena Connection Failed
@@ -7369,7 +7776,7 @@ Format your response in a clear, structured manner.
 The system was unable to connect to OpenArena for work item refinement.
 
 Error Details:
-{str(e)}
+{str(connection_error)}
 
 To resolve this issue:
 1. Check your OpenArena ESSO token in src/openarena/config/env_config.py
@@ -7384,32 +7791,26 @@ Work item refinement cannot proceed without a valid OpenArena connection."""
                         return
                     
                     if refined_content and use_mock:
-                        # Display formatted output in the main output tab
-                        print("\n=== Refined Work Item ===")
-                        print(refined_content)
-                        
                         # Display raw output in the raw output tab
-                        self.raw_output.configure(state="normal")
-                        self.raw_output.delete(1.0, tk.END)
-                        self.raw_output.insert(tk.END, f"=== Raw LLM Response (Received at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===\n\n")
-                        self.raw_output.insert(tk.END, str(refined_content))
-                        
-                        # Add metadata about the response
-                        self.raw_output.insert(tk.END, "\n\n=== Response Metadata ===\n")
-                        self.raw_output.insert(tk.END, f"Response Type: {type(refined_content).__name__}\n")
-                        self.raw_output.insert(tk.END, f"Response Length: {len(str(refined_content))} characters\n")
-                        self.raw_output.insert(tk.END, f"Model Used: {workflow_id}\n")
-                        self.raw_output.insert(tk.END, f"Status: Connected to OpenArena\n")
-                        
-                        # Add the prompt that was sent to the LLM
-                        self.raw_output.insert(tk.END, "\n\n=== Prompt Sent to LLM ===\n")
-                        self.raw_output.insert(tk.END, refinement_prompt)
+                        parts = [
+                            f"=== Raw LLM Response (Received at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===\n\n",
+                            str(refined_content),
+                            # Add metadata about the response
+                            "\n\n=== Response Metadata ===\n",
+                            f"Response Type: {type(refined_content).__name__}\n",
+                            f"Response Length: {len(str(refined_content))} characters\n",
+                            f"Model Used: {workflow_id}\n",
+                            "Status: Connected to OpenArena\n",
+                            # Add the prompt that was sent to the LLM
+                            "\n\n=== Prompt Sent to LLM ===\n",
+                            refinement_prompt,
+                        ]
                         
                         if cost_tracker and 'error' not in cost_tracker:
-                            self.raw_output.insert(tk.END, "\n\n=== Cost Information ===\n")
-                            self.raw_output.insert(tk.END, str(cost_tracker))
+                            parts.append("\n\n=== Cost Information ===\n")
+                            parts.append(str(cost_tracker))
                         
-                        self.raw_output.configure(state="disabled")
+                        self.root.after(0, self._set_raw_output, "".join(parts))
                         
                         if cost_tracker and 'error' not in cost_tracker:
                             print(f"\n=== Cost Information ===")
@@ -7420,13 +7821,12 @@ Work item refinement cannot proceed without a valid OpenArena connection."""
                         print("Failed to get refinement from OpenArena LLM")
                         
                         # Show error in raw output tab as well
-                        self.raw_output.configure(state="normal")
-                        self.raw_output.delete(1.0, tk.END)
-                        self.raw_output.insert(tk.END, f"=== Error: No Response Received (at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===\n\n")
-                        self.raw_output.insert(tk.END, "The OpenArena LLM did not return any content.\n")
-                        self.raw_output.insert(tk.END, f"Model Used: {workflow_id}\n")
-                        self.raw_output.insert(tk.END, f"Mock Mode: {use_mock}\n")
-                        self.raw_output.configure(state="disabled")
+                        self.root.after(0, self._set_raw_output, "".join([
+                            f"=== Error: No Response Received (at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===\n\n",
+                            "The OpenArena LLM did not return any content.\n",
+                            f"Model Used: {workflow_id}\n",
+                            f"Mock Mode: {use_mock}\n",
+                        ]))
                 
                 # Update status
                 self.status_var.set(f"Refined work item {work_item_id}")
@@ -7435,14 +7835,68 @@ Work item refinement cannot proceed without a valid OpenArena connection."""
                 # Show error
                 with redirect_stdout(redirect):
                     print(f"Error refining work item: {str(e)}")
-                    import traceback
                     traceback.print_exc()
                 
                 # Update status
                 self.status_var.set("Failed to refine work item")
         
         # Start thread
-        threading.Thread(target=refine_thread).start()
+        self._submit(refine_thread)
+    
+    def _query_refinement(self, client, workflow_id, query, is_persistence_allowed=False, on_chunk=None):
+        """Send a refinement prompt, answering exact repeats from memory.
+        
+        The cache key covers the client's endpoint and token, the workflow, the persistence
+        flag and the prompt. A repeat is passed to on_chunk in one piece and reported with
+        zero cost; only successful answers are stored.
+        """
+        if _REFINE_CACHE_SIZE <= 0:
+            return client.query_workflow(workflow_id=workflow_id, query=query,
+                                         is_persistence_allowed=is_persistence_allowed, on_chunk=on_chunk)
+        
+        key = hashlib.sha256(
+            f"{client.ws_url}\0{workflow_id}\0{is_persistence_allowed}\0{query}".encode('utf-8')
+        ).hexdigest()
+        with self._refine_cache_lock:
+            answer = self._refine_cache.get(key)
+            if answer is not None:
+                self._refine_cache.move_to_end(key)
+        if answer is not None:
+            logger.debug("Using cached refinement answer for workflow %s", workflow_id)
+            if on_chunk:
+                on_chunk(answer)
+            return answer, {'cached': True, 'cost': 0.0, 'tokens': 0}
+        
+        answer, cost_tracker = client.query_workflow(workflow_id=workflow_id, query=query,
+                                                     is_persistence_allowed=is_persistence_allowed,
+                                                     on_chunk=on_chunk)
+        if answer and isinstance(cost_tracker, dict) and 'error' not in cost_tracker:
+            with self._refine_cache_lock:
+                self._refine_cache[key] = answer
+                self._refine_cache.move_to_end(key)
+                while len(self._refine_cache) > _REFINE_CACHE_SIZE:
+                    self._refine_cache.popitem(last=False)
+        return answer, cost_tracker
+    
+    def _get_openarena_client(self, validate_workflow_id=None):
+        """Return the shared OpenArena client, creating it on first use.
+        
+        When ``validate_workflow_id`` is given and the client has not been created yet,
+        a short test query is sent first and the client is only cached if it succeeds.
+        """
+        with self._openarena_lock:
+            if self._openarena_client is None:
+                client = OpenArenaWebSocketClient()
+                if validate_workflow_id:
+                    test_answer, test_cost = client.query_workflow(
+                        workflow_id=validate_workflow_id,
+                        query="Hello, test connection",
+                        is_persistence_allowed=False
+                    )
+                    if not test_answer or 'error' in test_cost:
+                        raise Exception(f"OpenArena test query failed: {test_cost}")
+                self._openarena_client = client
+            return self._openarena_client
     
     def switch_ai_model(self):
         """Switch to the selected AI model."""
@@ -7450,6 +7904,7 @@ Work item refinement cannot proceed without a valid OpenArena connection."""
         
         # Update current model display
         self.current_model_var.set(selected_model)
+        self._current_workflow_id = selected_model
         
         # Update status
         self.model_status_var.set(f"Switched to {selected_model}")
@@ -7483,9 +7938,8 @@ Work item refinement cannot proceed without a valid OpenArena connection."""
                     
                     # Try to create OpenArena client
                     try:
-                        from openarena.websocket_client import OpenArenaWebSocketClient
-                        openarena_client = OpenArenaWebSocketClient()
-                        print("✅ OpenArena client created successfully")
+                        openarena_client = self._get_openarena_client()
+                        print("✅ OpenArena client ready")
                         
                         # Get workflow ID for the selected model
                         workflow_id = openarena_client.workflow_ids.get(selected_model)
@@ -7540,13 +7994,12 @@ Model testing cannot proceed without a valid OpenArena connection."""
             except Exception as e:
                 with redirect_stdout(redirect):
                     print(f"❌ Error testing connection: {str(e)}")
-                    import traceback
                     traceback.print_exc()
                 
                 self.model_status_var.set("Connection test failed")
         
         # Start test thread
-        threading.Thread(target=test_thread).start()
+        self._submit(test_thread)
     
     def show_model_configuration(self):
         """Show the configuration for the selected AI model."""
@@ -7572,8 +8025,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
                     
                     # Load configuration
                     try:
-                        from openarena.config.settings import get_config
-                        config = get_config()
+                        config = _config()
                         
                         print(f"🌐 WebSocket URL: {config.websocket_base_url}")
                         print(f"⏱️ Timeout: {config.timeout} seconds")
@@ -7593,13 +8045,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
                         print()
                         print("💡 Model Descriptions:")
                         print("-" * 30)
-                        model_info = {
-                            "claude4opus": "Claude 4 Opus - Advanced reasoning and analysis capabilities",
-                            "gpt5": "GPT-5 - Latest OpenAI model with enhanced language understanding",
-                            "gemini2pro": "Gemini 2 Pro - Google's advanced multimodal AI model"
-                        }
-                        
-                        for model, description in model_info.items():
+                        for model, description in _MODEL_INFO.items():
                             if model == selected_model:
                                 print(f"  {model:15} : {description} ← SELECTED")
                             else:
@@ -7613,7 +8059,6 @@ Model testing cannot proceed without a valid OpenArena connection."""
                         print("🔄 Trying to load from environment...")
                         
                         # Try to get basic info from environment
-                        import os
                         env_vars = {
                             "OPENARENA_WEBSOCKET_URL": os.getenv("OPENARENA_WEBSOCKET_URL", "Not set"),
                             "OPENARENA_TIMEOUT": os.getenv("OPENARENA_TIMEOUT", "Not set"),
@@ -7630,30 +8075,52 @@ Model testing cannot proceed without a valid OpenArena connection."""
             except Exception as e:
                 with redirect_stdout(redirect):
                     print(f"❌ Error showing configuration: {str(e)}")
-                    import traceback
                     traceback.print_exc()
                 
                 self.model_status_var.set("Failed to load configuration")
         
         # Start config thread
-        threading.Thread(target=config_thread).start()
+        self._submit(config_thread)
     
     def copy_to_clipboard(self, text_widget):
         """Copy the content of a text widget to clipboard."""
         try:
-            content = text_widget.get(1.0, tk.END)
+            # "end-1c" skips the newline Tk always keeps after the last line
+            content = text_widget.get(1.0, "end-1c")
             self.root.clipboard_clear()
             self.root.clipboard_append(content)
             self.status_var.set("Content copied to clipboard")
         except Exception as e:
             self.status_var.set(f"Failed to copy to clipboard: {str(e)}")
     
+    def _set_raw_output(self, text):
+        """Replace the raw output tab's content with text in a single insert.
+        
+        Tk's Text widget slows down badly on very large content, so only the first
+        raw_output_display_limit characters are shown; the full text is kept in
+        _raw_output_text for copy_raw_output.
+        """
+        self._raw_output_text = text
+        limit = self.raw_output_display_limit
+        if len(text) > limit:
+            text = (f"{text[:limit]}\n\n… {len(text) - limit:,} more characters not shown. "
+                    f"Use 'Copy Raw Output' to copy the full response.\n")
+        
+        self.raw_output.configure(state="normal")
+        self.raw_output.delete(1.0, tk.END)
+        self.raw_output.insert(tk.END, text)
+        self.raw_output.configure(state="disabled")
+    
+    def copy_raw_output(self):
+        """Copy the full raw LLM response, including any part not shown, to the clipboard."""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self._raw_output_text)
+        self.status_var.set("Content copied to clipboard")
+    
     def clear_raw_output(self):
         """Clear the raw output text widget."""
         try:
-            self.raw_output.configure(state="normal")
-            self.raw_output.delete(1.0, tk.END)
-            self.raw_output.configure(state="disabled")
+            self._set_raw_output("")
             self.status_var.set("Raw output cleared")
         except Exception as e:
             self.status_var.set(f"Failed to clear raw output: {str(e)}")
@@ -7664,72 +8131,69 @@ Model testing cannot proceed without a valid OpenArena connection."""
             # Check if settings file exists
             settings_file = Path("config/ado_settings.txt")
             if settings_file.exists():
-                with open(settings_file, "r") as f:
-                    settings = {}
-                    for line in f:
-                        if "=" in line:
-                            key, value = line.strip().split("=", 1)
-                            settings[key] = value
-                    
-                    # Apply settings
-                    if "organization_url" in settings:
-                        self.org_url_var.set(settings["organization_url"])
-                    if "project" in settings:
-                        self.project_var.set(settings["project"])
-                    if "team" in settings:
-                        self.team_var.set(settings["team"])
-                    if "pat" in settings:
-                        self.pat_var.set(settings["pat"])
-                    
-                    # Apply LLM configuration settings
-                    if "llm_work_item_limit" in settings:
-                        try:
-                            limit_value = int(settings["llm_work_item_limit"])
-                            if hasattr(self, 'llm_work_item_limit_var'):
-                                self.llm_work_item_limit_var.set(limit_value)
-                        except ValueError:
-                            pass
-                    
-                    # Load maximum ADO work item limit
-                    if "max_ado_work_item_limit" in settings:
-                        try:
-                            max_limit_value = int(settings["max_ado_work_item_limit"])
-                            self.max_ado_work_item_limit = max_limit_value
-                            print(f"Loaded max ADO work item limit: {max_limit_value}")
-                        except ValueError:
-                            print(f"Invalid max_ado_work_item_limit value: {settings['max_ado_work_item_limit']}")
-                            self.max_ado_work_item_limit = 19000  # Default fallback
-                    
-                    if "llm_strategy" in settings:
-                        if hasattr(self, 'llm_strategy_var'):
-                            self.llm_strategy_var.set(settings["llm_strategy"])
-                    
-                    # Load auto-connect setting
-                    if "auto_connect" in settings:
-                        auto_connect_value = settings["auto_connect"].lower() == "true"
-                        if hasattr(self, 'auto_connect_var'):
-                            self.auto_connect_var.set(auto_connect_value)
-                    
-                    # Disable other tabs until connected
-                    self.notebook.tab(1, state="disabled")  # Test Open Arena - AI Models tab
-                    self.notebook.tab(2, state="disabled")  # ADO Team Selection tab
-                    self.notebook.tab(3, state="disabled")  # Open Arena - AI Model Selection tab
-                    self.notebook.tab(4, state="disabled")  # Related Work Items tab
-                    self.notebook.tab(5, state="disabled")  # ADO Operations tab
-                    # Note: Test Open Arena - AI Models tab (tab 1) is always enabled as it doesn't require ADO connection
+                text = settings_file.read_text()
+                settings = dict(line.strip().split("=", 1) for line in text.splitlines() if "=" in line)
+                self._settings_text = text
+                
+                # Apply settings through the key -> setter table
+                setters = self._setting_setters()
+                for key, value in settings.items():
+                    setter = setters.get(key)
+                    if setter is not None:
+                        setter(value)
+                
+                # Disable other tabs until connected
+                for idx in self._gated_tabs:
+                    self.notebook.tab(idx, state="disabled")
+                
+                # Check if auto-connect is enabled and we have valid settings
+                if hasattr(self, 'auto_connect_var') and self.auto_connect_var.get():
+                    org_url = self.org_url_var.get().strip()
+                    pat = self.pat_var.get().strip()
+                    project = self.project_var.get().strip()
                     
-                    # Check if auto-connect is enabled and we have valid settings
-                    if hasattr(self, 'auto_connect_var') and self.auto_connect_var.get():
-                        org_url = self.org_url_var.get().strip()
-                        pat = self.pat_var.get().strip()
-                        project = self.project_var.get().strip()
-                        
-                        if org_url and pat and project:
-                            # Auto-connect after a short delay to ensure UI is ready
-                            self.root.after(1000, self.auto_connect_to_ado)
+                    if org_url and pat and project:
+                        # Auto-connect after a short delay to ensure UI is ready
+                        self.root.after(1000, self.auto_connect_to_ado)
         except Exception as e:
             print(f"Error loading settings: {str(e)}")
     
+    def _setting_setters(self):
+        """Return the setting key -> setter table used by load_settings.
+        
+        Only settings whose widgets exist are included.
+        """
+        setters = {
+            "organization_url": self.org_url_var.set,
+            "project": self.project_var.set,
+            "team": self.team_var.set,
+            "pat": self.pat_var.set,
+            "max_ado_work_item_limit": self._set_max_ado_work_item_limit,
+        }
+        if hasattr(self, 'llm_work_item_limit_var'):
+            setters["llm_work_item_limit"] = self._set_llm_work_item_limit
+        if hasattr(self, 'llm_strategy_var'):
+            setters["llm_strategy"] = self.llm_strategy_var.set
+        if hasattr(self, 'auto_connect_var'):
+            setters["auto_connect"] = lambda value: self.auto_connect_var.set(value.lower() == "true")
+        return setters
+    
+    def _set_llm_work_item_limit(self, value):
+        """Apply a saved LLM work item limit, ignoring invalid values."""
+        try:
+            self.llm_work_item_limit_var.set(int(value))
+        except ValueError:
+            pass
+    
+    def _set_max_ado_work_item_limit(self, value):
+        """Apply a saved maximum ADO work item limit, falling back to the default if invalid."""
+        try:
+            self.max_ado_work_item_limit = int(value)
+            print(f"Loaded max ADO work item limit: {self.max_ado_work_item_limit}")
+        except ValueError:
+            print(f"Invalid max_ado_work_item_limit value: {value}")
+            self.max_ado_work_item_limit = 19000  # Default fallback
+    
     def save_settings(self):
         """Save settings."""
         try:
@@ -7738,24 +8202,19 @@ Model testing cannot proceed without a valid OpenArena connection."""
             config_dir.mkdir(exist_ok=True)
             
             settings_file = config_dir / "ado_settings.txt"
-            with open(settings_file, "w") as f:
-                f.write(f"organization_url={self.org_url_var.get().strip()}\n")
-                f.write(f"project={self.project_var.get().strip()}\n")
-                f.write(f"team={self.team_var.get().strip()}\n")
-                f.write(f"pat={self.pat_var.get().strip()}\n")
-                
-                # Save LLM configuration settings
-                if hasattr(self, 'llm_work_item_limit_var'):
-                    f.write(f"llm_work_item_limit={self.llm_work_item_limit_var.get()}\n")
-                if hasattr(self, 'llm_strategy_var'):
-                    f.write(f"llm_strategy={self.llm_strategy_var.get()}\n")
-                
-                # Save maximum ADO work item limit
-                f.write(f"max_ado_work_item_limit={self.max_ado_work_item_limit}\n")
-                
-                # Save auto-connect setting
-                if hasattr(self, 'auto_connect_var'):
-                    f.write(f"auto_connect={self.auto_connect_var.get()}\n")
+            payload = "\n".join(f"{key}={getter()}" for key, getter in self._persistent_fields) + "\n"
+            
+            # Nothing to do if the file already holds these settings
+            if self._settings_text is None and settings_file.exists():
+                self._settings_text = settings_file.read_text()
+            if payload == self._settings_text:
+                return
+            
+            # Write to a temporary file and swap it in so a crash can't leave a partial file
+            tmp_file = settings_file.with_name(settings_file.name + ".tmp")
+            tmp_file.write_text(payload)
+            os.replace(tmp_file, settings_file)
+            self._settings_text = payload
                     
         except Exception as e:
             print(f"Error saving settings: {str(e)}")
@@ -7802,6 +8261,18 @@ Model testing cannot proceed without a valid OpenArena connection."""
         self.persistence_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(controls_frame, text="Allow Persistence", variable=self.persistence_var).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
         
+        # Force refresh checkbox (bypass the cached test results)
+        self.test_force_refresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls_frame, text="♻ Force refresh (bypass cache)", variable=self.test_force_refresh_var).grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
+        
+        # Similarity threshold for reusing results of semantically similar queries
+        threshold_frame = ttk.Frame(controls_frame)
+        threshold_frame.grid(row=2, column=3, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(threshold_frame, text="Similarity threshold:").pack(side=tk.LEFT)
+        self.semantic_threshold_var = tk.DoubleVar(value=0.92)
+        ttk.Spinbox(threshold_frame, from_=0.5, to=1.0, increment=0.01, width=6,
+                    textvariable=self.semantic_threshold_var).pack(side=tk.LEFT, padx=(5, 0))
+        
         # Test buttons frame
         buttons_frame = ttk.Frame(controls_frame)
         buttons_frame.grid(row=3, column=0, columnspan=2, pady=10)
@@ -7839,93 +8310,45 @@ Model testing cannot proceed without a valid OpenArena connection."""
         output_notebook = ttk.Notebook(output_frame)
         output_notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Real-time output tab
-        realtime_frame = ttk.Frame(output_notebook, padding="5")
-        output_notebook.add(realtime_frame, text="Real-time Output")
-        
-        # Add button frame for real-time output actions
-        realtime_buttons_frame = ttk.Frame(realtime_frame)
-        realtime_buttons_frame.pack(fill=tk.X, pady=(0, 5))
-        
-        # Copy real-time output button
-        copy_realtime_button = ttk.Button(realtime_buttons_frame, text="📋 Copy Output", command=lambda: self.copy_to_clipboard(self.openarena_output))
-        copy_realtime_button.pack(side=tk.LEFT)
-        
-        self.openarena_output = scrolledtext.ScrolledText(realtime_frame, wrap=tk.WORD, height=15)
-        self.openarena_output.pack(fill=tk.BOTH, expand=True)
-        self.openarena_output.configure(state="disabled")
-        
-        # Results summary tab
-        summary_frame = ttk.Frame(output_notebook, padding="5")
-        output_notebook.add(summary_frame, text="Results Summary")
+        # Real-time output, results summary and cost analysis tabs
+        self._make_output_tab(output_notebook, "Real-time Output", "openarena_output", "📋 Copy Output")
+        copy_summary_button = self._make_output_tab(output_notebook, "Results Summary", "results_summary", "📋 Copy Summary")
+        self._make_output_tab(output_notebook, "Cost Analysis", "cost_analysis", "📋 Copy Cost Analysis")
         
-        # Add button frame for summary actions
-        summary_buttons_frame = ttk.Frame(summary_frame)
-        summary_buttons_frame.pack(fill=tk.X, pady=(0, 5))
-        
-        # Show full response button
-        self.show_full_response_button = ttk.Button(summary_buttons_frame, text="📖 Show Full Response", command=self.show_full_response)
-        self.show_full_response_button.pack(side=tk.LEFT, padx=(0, 10))
-        
-        # Copy summary button
-        copy_summary_button = ttk.Button(summary_buttons_frame, text="📋 Copy Summary", command=lambda: self.copy_to_clipboard(self.results_summary))
-        copy_summary_button.pack(side=tk.LEFT)
-        
-        self.results_summary = scrolledtext.ScrolledText(summary_frame, wrap=tk.WORD, height=15)
-        self.results_summary.pack(fill=tk.BOTH, expand=True)
-        self.results_summary.configure(state="disabled")
+        # Show full response button (ahead of the summary's copy button)
+        self.show_full_response_button = ttk.Button(copy_summary_button.master, text="📖 Show Full Response", command=self.show_full_response)
+        self.show_full_response_button.pack(side=tk.LEFT, padx=(0, 10), before=copy_summary_button)
+    
+    def _make_output_tab(self, notebook, title, attr, copy_text):
+        """Add a tab with a copy button and a read-only ScrolledText stored as ``self.<attr>``.
         
-        # Cost analysis tab
-        cost_frame = ttk.Frame(output_notebook, padding="5")
-        output_notebook.add(cost_frame, text="Cost Analysis")
+        Returns the copy button so callers can add more buttons next to it.
+        """
+        frame = ttk.Frame(notebook, padding="5")
+        notebook.add(frame, text=title)
         
-        # Add button frame for cost analysis actions
-        cost_buttons_frame = ttk.Frame(cost_frame)
-        cost_buttons_frame.pack(fill=tk.X, pady=(0, 5))
+        # Add button frame for output actions
+        buttons_frame = ttk.Frame(frame)
+        buttons_frame.pack(fill=tk.X, pady=(0, 5))
         
-        # Copy cost analysis button
-        copy_cost_button = ttk.Button(cost_buttons_frame, text="📋 Copy Cost Analysis", command=lambda: self.copy_to_clipboard(self.cost_analysis))
-        copy_cost_button.pack(side=tk.LEFT)
+        copy_button = ttk.Button(buttons_frame, text=copy_text, command=lambda: self.copy_to_clipboard(getattr(self, attr)))
+        copy_button.pack(side=tk.LEFT)
         
-        self.cost_analysis = scrolledtext.ScrolledText(cost_frame, wrap=tk.WORD, height=15)
-        self.cost_frame = cost_frame
-        self.cost_analysis.pack(fill=tk.BOTH, expand=True)
-        self.cost_analysis.configure(state="disabled")
+        text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=15)
+        text_widget.pack(fill=tk.BOTH, expand=True)
+        text_widget.configure(state="disabled")
+        setattr(self, attr, text_widget)
+        return copy_button
     
     def generate_ai_query(self):
         """Generate a dynamic AI-related query"""
-        import random
-        
-        # Collection of AI-related queries
-        ai_queries = [
-            "Explain how machine learning can improve software development workflows",
-            "What are the best practices for implementing AI in enterprise applications?",
-            "How can natural language processing help with code documentation?",
-            "What are the ethical considerations when deploying AI systems?",
-            "Explain the difference between supervised and unsupervised learning",
-            "How can AI assist in identifying related work items in project management?",
-            "What are the challenges of implementing AI in legacy systems?",
-            "How can AI improve code quality and reduce technical debt?",
-            "Explain the concept of transfer learning in machine learning",
-            "What are the security implications of AI-powered applications?",
-            "How can AI help with automated testing and quality assurance?",
-            "What are the key metrics for measuring AI system performance?",
-            "Explain the concept of explainable AI and its importance",
-            "How can AI assist in project estimation and planning?",
-            "What are the best practices for AI model versioning and deployment?",
-            "How can AI help identify patterns in user behavior and requirements?",
-            "Explain the concept of reinforcement learning in AI",
-            "What are the considerations for AI model bias and fairness?",
-            "How can AI improve collaboration in distributed teams?",
-            "What are the emerging trends in AI for software development?"
-        ]
-        
-        # Generate a random query
-        new_query = random.choice(ai_queries)
+        # Pick a random query
+        index = self._rng.randrange(len(_AI_QUERIES))
+        new_query = _AI_QUERIES[index]
         self.custom_query_var.set(new_query)
         
         # Update status
-        self.status_var.set(f"Generated new AI query: {new_query[:50]}...")
+        self.status_var.set(f"Generated new AI query: {_AI_QUERIES_TRUNC[index]}...")
         
         # Also update the Open Arena output to show the new query
         self.update_openarena_output(f"🎲 Generated new AI query: {new_query}\n")
@@ -7933,10 +8356,8 @@ Model testing cannot proceed without a valid OpenArena connection."""
     def show_full_response(self):
         """Show the full response in a new window"""
         try:
-            # Get the current content of results summary
-            content = self.results_summary.get(1.0, tk.END)
-            
-            if not content.strip():
+            # Any non-whitespace in the results summary?
+            if not self.results_summary.search(r"\S", "1.0", tk.END, regexp=True):
                 messagebox.showinfo("No Content", "No results summary available to display.")
                 return
             
@@ -7954,13 +8375,14 @@ Model testing cannot proceed without a valid OpenArena connection."""
             title_label = ttk.Label(frame, text="📖 Full Response Details", font=("Arial", 14, "bold"))
             title_label.pack(pady=(0, 10))
             
-            # Add scrollable text area
-            text_area = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=25)
-            text_area.pack(fill=tk.BOTH, expand=True)
-            
-            # Insert the content
-            text_area.insert(tk.END, content)
-            text_area.configure(state="disabled")
+            # Add a scrollable, read-only view onto the results summary (shared, not copied)
+            text_frame = ttk.Frame(frame)
+            text_frame.pack(fill=tk.BOTH, expand=True)
+            text_area = TextPeer(text_frame, self.results_summary, wrap=tk.WORD, height=25, state="disabled")
+            scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_area.yview)
+            text_area.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             
             # Add copy button
             copy_button = ttk.Button(frame, text="📋 Copy to Clipboard", 
@@ -7981,58 +8403,86 @@ Model testing cannot proceed without a valid OpenArena connection."""
     def test_single_model(self):
         """Test a single Open Arena model."""
         try:
-            self.test_status_var.set("Testing single model...")
+            self._set_test_status("Testing single model...")
+            self.test_progress.configure(mode='indeterminate')
             self.test_progress.start()
             
             # Get test parameters
             model_name = self.test_model_var.get()
             query = self.custom_query_var.get()
             persistence = self.persistence_var.get()
+            force_refresh, threshold = self._test_cache_settings()
             
             # Update status
-            self.update_openarena_output(f"🧪 Testing {model_name.upper()} Model\n")
-            self.update_openarena_output(f"Query: {query}\n")
-            self.update_openarena_output(f"Persistence: {persistence}\n")
-            self.update_openarena_output("-" * 60 + "\n")
+            self.update_openarena_output(
+                f"🧪 Testing {model_name.upper()} Model\n"
+                f"Query: {query}\n"
+                f"Persistence: {persistence}\n"
+                + "-" * 60 + "\n"
+            )
             
-            # Run test in background thread
-            threading.Thread(target=self._run_single_test, args=(model_name, query, persistence), daemon=True).start()
+            # Show answer tokens as they arrive, then run the test in a background thread
+            self._oa_buf.clear()
+            self._oa_streaming = True
+            self._oa_streamed = False
+            self._flush_oa_tick()
+            self._submit(self._run_single_test, model_name, query, persistence, force_refresh, threshold)
             
         except Exception as e:
-            self.test_status_var.set(f"Error: {str(e)}")
+            self._set_test_status(f"Error: {str(e)}")
             self.test_progress.stop()
             self.update_openarena_output(f"❌ Error starting test: {str(e)}\n")
     
+    def _test_cache_settings(self):
+        """Return the (force_refresh, similarity threshold) test cache settings; call on the Tk thread."""
+        try:
+            threshold = self.semantic_threshold_var.get()
+        except tk.TclError:
+            threshold = 0.92  # Spinbox holds a non-number
+        return self.test_force_refresh_var.get(), threshold
+    
     def run_comprehensive_test(self):
         """Run comprehensive test across all models."""
         try:
-            self.test_status_var.set("Running comprehensive test...")
-            self.test_progress.start()
+            self._set_test_status("Running comprehensive test...")
+            # Progress advances as each model finishes (see _append_streamed_result)
+            self.test_progress.configure(mode='determinate', value=0)
             
             self.update_openarena_output("🚀 Starting Open Arena WebSocket Connectivity Test\n")
             self.update_openarena_output("=" * 80 + "\n")
             
+            # Read the test parameters here; the worker thread must not touch Tk variables
+            query = self.custom_query_var.get()
+            persistence = self.persistence_var.get()
+            force_refresh, threshold = self._test_cache_settings()
+            
             # Run test in background thread
-            threading.Thread(target=self._run_comprehensive_test, daemon=True).start()
+            self._submit(self._run_comprehensive_test, query, persistence, force_refresh, threshold)
             
         except Exception as e:
-            self.test_status_var.set(f"Error: {str(e)}")
+            self._set_test_status(f"Error: {str(e)}")
             self.test_progress.stop()
             self.update_openarena_output(f"❌ Error starting comprehensive test: {str(e)}\n")
     
-    def _run_single_test(self, model_name, query, persistence):
+    def _get_tester(self):
+        """Return the shared OpenArenaWebSocketTester, importing and creating it on first use."""
+        with self._tester_lock:
+            if self._tester is None:
+                from openarena.test_websocket_connectivity import OpenArenaWebSocketTester
+                self._tester = OpenArenaWebSocketTester()
+            return self._tester
+    
+    def _run_single_test(self, model_name, query, persistence, force_refresh=False, threshold=0.92):
         """Run single model test in background thread."""
         try:
-            # Import the tester
-            from openarena.test_websocket_connectivity import OpenArenaWebSocketTester
-            
-            tester = OpenArenaWebSocketTester()
+            tester = self._get_tester()
             
             # Get workflow ID for selected model
             workflow_id = tester.config['workflow_ids'][model_name]
             
-            # Run the test
-            result = tester.test_connection(model_name, workflow_id, query, persistence)
+            # Run the test (repeats are served from the response cache)
+            result = self._cached_test_connection(tester, model_name, workflow_id, query, persistence,
+                                                  force_refresh, threshold, on_token=self._oa_buf.append)
             
             # Update GUI in main thread
             self.root.after(0, lambda: self._handle_single_test_result(result))
@@ -8041,104 +8491,298 @@ Model testing cannot proceed without a valid OpenArena connection."""
             error_msg = f"Single test error: {str(e)}"
             self.root.after(0, lambda: self._handle_test_error(error_msg))
     
-    def _run_comprehensive_test(self):
-        """Run comprehensive test in background thread."""
+    @staticmethod
+    def _accepts_on_token(func):
+        """Return True if func can be called with an on_token keyword argument."""
         try:
-            # Import the tester
-            from openarena.test_websocket_connectivity import OpenArenaWebSocketTester
-            
-            tester = OpenArenaWebSocketTester()
-            
-            # Capture output by redirecting stdout
-            import io
-            import sys
-            from contextlib import redirect_stdout
-            
-            output_buffer = io.StringIO()
-            
-            with redirect_stdout(output_buffer):
-                tester.run_comprehensive_test()
-            
-            # Get captured output
-            captured_output = output_buffer.getvalue()
+            params = inspect.signature(func).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(p.name == 'on_token' or p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+    
+    def _cached_test_connection(self, tester, model_name, workflow_id, query, persistence,
+                                force_refresh=False, threshold=0.92, on_token=None):
+        """Run tester.test_connection, serving repeat tests from the on-disk TTL cache.
+        
+        Queries whose embedding is at least ``threshold`` similar to an earlier query for the
+        same model and persistence setting reuse that query's result. Only successful results
+        are cached; results served from a cache have ``cached`` set. ``on_token`` receives
+        answer fragments as they stream in, if the tester supports streaming, and is not
+        called for cached results.
+        """
+        key = hashlib.sha256(json.dumps(
+            {"m": model_name, "w": workflow_id, "q": query, "p": persistence}, sort_keys=True
+        ).encode()).hexdigest()
+        
+        sem_key = (model_name, workflow_id, persistence)
+        
+        if not force_refresh:
+            cached = self._response_cache_get(key)
+            if cached is not None:
+                return dict(cached, cached=True)
+        
+        # Only embed once the exact-match lookup has missed
+        vector = self._embed_query(query)
+        if not force_refresh:
+            similar = self._semantic_cache_get(sem_key, vector, threshold)
+            if similar is not None:
+                return dict(similar, cached=True)
+        
+        if on_token is not None and self._accepts_on_token(tester.test_connection):
+            result = tester.test_connection(model_name, workflow_id, query, persistence, on_token=on_token)
+        else:
+            result = tester.test_connection(model_name, workflow_id, query, persistence)
+        if result.get('success'):
+            self._response_cache_set(key, result)
+            self._semantic_cache_add(sem_key, vector, result)
+        return result
+    
+    def _embed_query(self, query):
+        """Return a unit-length embedding of query as a list of floats.
+        
+        Uses sentence-transformers (all-MiniLM-L6-v2) when it is installed and the model loads;
+        otherwise falls back to a hashed bag-of-words vector, which only matches queries
+        sharing most of their words. The model load is attempted once per session.
+        """
+        if self._embed is None:
+            with self._embed_lock:
+                if self._embed is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._embed = SentenceTransformer("all-MiniLM-L6-v2")
+                    except ImportError:
+                        logger.info("sentence-transformers not installed; using word-based query similarity")
+                        self._embed = False
+                    except Exception as e:
+                        logger.warning("Could not load the sentence-transformers model (%s); "
+                                       "using word-based query similarity", e)
+                        self._embed = False
+        
+        if self._embed:
+            return self._embed.encode(query, normalize_embeddings=True).tolist()
+        
+        vector = [0.0] * 384
+        for word in re.findall(r"\w+", query.casefold()):
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 384] += 1.0
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def _semantic_cache_get(self, sem_key, vector, threshold):
+        """Return the stored result of the most similar earlier query, if it meets threshold."""
+        best_score, best_result = 0.0, None
+        with self._sem_lock:
+            for key, stored_vector, result in self._sem_store:
+                if key != sem_key:
+                    continue
+                score = sum(a * b for a, b in zip(vector, stored_vector))
+                if score > best_score:
+                    best_score, best_result = score, result
+        return best_result if best_score >= threshold else None
+    
+    def _semantic_cache_add(self, sem_key, vector, result):
+        """Remember a successful result for later similar queries, dropping the oldest beyond the limit."""
+        with self._sem_lock:
+            self._sem_store.append((sem_key, vector, result))
+            del self._sem_store[:-self.semantic_cache_max_size]
+    
+    def _open_response_cache(self):
+        """Open the Open Arena response cache shelf, creating its directory if needed."""
+        self._response_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(self._response_cache_path))
+    
+    def _response_cache_get(self, key):
+        """Return the cached test result for key, or None if missing or expired."""
+        try:
+            with self._response_cache_lock, self._open_response_cache() as cache:
+                cached = cache.get(key)
+                if cached is None:
+                    return None
+                if time.time() - cached[0] >= self.response_cache_ttl:
+                    del cache[key]
+                    return None
+                return cached[1]
+        except (OSError, *dbm.error, pickle.UnpicklingError, EOFError) as e:
+            logger.warning("Could not read Open Arena response cache: %s", e)
+            return None
+    
+    def _response_cache_set(self, key, result):
+        """Store a test result, evicting the oldest entries beyond the size limit."""
+        try:
+            with self._response_cache_lock, self._open_response_cache() as cache:
+                cache[key] = (time.time(), result)
+                if len(cache) > self.response_cache_max_size:
+                    by_age = sorted(cache.keys(), key=lambda k: cache[k][0])
+                    for old_key in by_age[:len(cache) - self.response_cache_max_size]:
+                        del cache[old_key]
+        except (OSError, *dbm.error, TypeError, pickle.PicklingError, pickle.UnpicklingError, EOFError) as e:
+            # Eviction reads stored entries back, so unpickling errors can surface here too
+            logger.warning("Could not write Open Arena response cache: %s", e)
+    
+    def _run_comprehensive_test(self, query, persistence, force_refresh=False, threshold=0.92):
+        """Run comprehensive test in background thread, testing all models concurrently.
+        
+        Each model's test goes through _cached_test_connection, so repeat runs reuse cached results.
+        """
+        try:
+            tester = self._get_tester()
+            workflow_ids = tester.config['workflow_ids']
+            self.root.after(0, lambda: self.test_progress.configure(maximum=max(1, len(workflow_ids))))
+            
+            # Each test waits on its own WebSocket round trip, so run them side by side
+            results = []
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(workflow_ids)))) as executor:
+                futures = {
+                    executor.submit(self._cached_test_connection, tester, model_name, workflow_id, query,
+                                    persistence, force_refresh, threshold): model_name
+                    for model_name, workflow_id in workflow_ids.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'model': futures[future], 'success': False, 'error': str(e)}
+                    results.append(result)
+                    self.root.after(0, self._append_streamed_result, result)
             
             # Update GUI in main thread
-            self.root.after(0, lambda: self._handle_comprehensive_test_result(captured_output))
+            self.root.after(0, lambda: self._handle_comprehensive_test_result(results))
             
         except Exception as e:
             error_msg = f"Comprehensive test error: {str(e)}"
             self.root.after(0, lambda: self._handle_test_error(error_msg))
     
+    def _set_test_status(self, message):
+        """Show message in the test status label, coalescing updates made within 50 ms."""
+        self._test_status_msg = message
+        if not self._test_status_pending:
+            self._test_status_pending = True
+            self.root.after(50, self._flush_test_status)
+    
+    def _flush_test_status(self):
+        """Apply the latest status passed to _set_test_status."""
+        self._test_status_pending = False
+        self.test_status_var.set(self._test_status_msg)
+    
+    def _append_streamed_result(self, result):
+        """Show one model's comprehensive test result as soon as it completes."""
+        done = self.test_progress['value'] + 1
+        self.test_progress.configure(value=done)
+        self._set_test_status(f"Running comprehensive test... {int(done)}/{int(self.test_progress['maximum'])} models")
+        if result['success']:
+            cached = " (cached)" if result.get('cached') else ""
+            self.update_openarena_output(f"✅ {result['model'].upper()}: {result['response_time']:.2f}s{cached}\n")
+        else:
+            self.update_openarena_output(f"❌ {result['model'].upper()}: {result['error']}\n")
+    
+    def _flush_oa_tick(self):
+        """Write streamed answer tokens to the Open Arena output every 100 ms while a test runs."""
+        count = len(self._oa_buf)
+        if count:
+            # Take only what is buffered now; the worker may still be appending
+            tokens = self._oa_buf[:count]
+            del self._oa_buf[:count]
+            self.update_openarena_output("".join(tokens))
+            self._oa_streamed = True
+        if self._oa_streaming:
+            self.root.after(100, self._flush_oa_tick)
+    
+    def _stop_oa_stream(self):
+        """Stop the token flush tick, writing out any tokens still buffered."""
+        self._oa_streaming = False
+        self._flush_oa_tick()
+        if self._oa_streamed:
+            self.update_openarena_output("\n")
+            self._oa_streamed = False
+    
     def _handle_single_test_result(self, result):
         """Handle single test result in main thread."""
         try:
+            self._stop_oa_stream()
             self.test_progress.stop()
-            self.test_status_var.set("Single test completed")
+            self._set_test_status("Single test completed")
+            
+            # Collect each widget's text and write it once
+            output = []
+            summary = []
+            cost = []
             
             if result['success']:
-                self.update_openarena_output(f"✅ Test completed successfully!\n")
-                self.update_openarena_output(f"Response time: {result['response_time']:.2f}s\n")
-                self.update_openarena_output(f"Messages received: {result['connection_details']['message_count']}\n")
+                details = result['connection_details']
+                if result.get('cached'):
+                    output.append("♻ (cache hit) Showing a cached result; tick 'Force refresh' to re-run\n")
+                output.append(
+                    f"✅ Test completed successfully!\n"
+                    f"Response time: {result['response_time']:.2f}s\n"
+                    f"Messages received: {details['message_count']}\n"
+                )
                 
                 # Update results summary
-                self.update_results_summary(f"📋 SINGLE TEST RESULT: {result['model'].upper()}\n")
-                self.update_results_summary("=" * 60 + "\n")
-                self.update_results_summary(f"✅ Status: SUCCESS\n")
-                self.update_results_summary(f"⏱️  Response Time: {result['response_time']:.2f}s\n")
-                self.update_results_summary(f"🔗 Connection Time: {result['connection_details']['connection_time']:.2f}s\n")
-                self.update_results_summary(f"📤 Send Time: {result['connection_details']['send_time']:.2f}s\n")
-                self.update_results_summary(f"📨 Messages: {result['connection_details']['message_count']}\n")
-                self.update_results_summary(f"🤖 Query: {result['query']}\n")
-                self.update_results_summary(f"📝 Response: {result['answer']}\n")
+                summary.append(
+                    f"📋 SINGLE TEST RESULT: {result['model'].upper()}\n"
+                    f"{'=' * 60}\n"
+                    f"✅ Status: SUCCESS\n"
+                    f"⏱️  Response Time: {result['response_time']:.2f}s\n"
+                    f"🔗 Connection Time: {details['connection_time']:.2f}s\n"
+                    f"📤 Send Time: {details['send_time']:.2f}s\n"
+                    f"📨 Messages: {details['message_count']}\n"
+                    f"🤖 Query: {result['query']}\n"
+                    f"📝 Response: {result['answer']}\n"
+                )
                 
                 # Update cost analysis
-                if result['cost_tracker']:
-                    self.update_cost_analysis(f"💰 COST ANALYSIS: {result['model'].upper()}\n")
-                    self.update_cost_analysis("=" * 60 + "\n")
-                    self.update_cost_analysis(f"Input Tokens: {result['cost_tracker'].get('input_token_count', 0):,}\n")
-                    self.update_cost_analysis(f"Output Tokens: {result['cost_tracker'].get('output_token_count', 0):,}\n")
-                    self.update_cost_analysis(f"Input Cost: ${result['cost_tracker'].get('input_token_cost', 0):.6f}\n")
-                    self.update_cost_analysis(f"Output Cost: ${result['cost_tracker'].get('output_token_cost', 0):.6f}\n")
-                    self.update_cost_analysis(f"Total Cost: ${result['cost_tracker'].get('total_cost', 0):.6f}\n")
-                    self.update_cost_analysis(f"Cost per Token: ${result['cost_tracker'].get('total_cost', 0) / (result['cost_tracker'].get('input_token_count', 0) + result['cost_tracker'].get('output_token_count', 0)):.8f}\n")
+                cost_tracker = result['cost_tracker']
+                if cost_tracker:
+                    input_tokens = cost_tracker.get('input_token_count', 0)
+                    output_tokens = cost_tracker.get('output_token_count', 0)
+                    total_cost = cost_tracker.get('total_cost', 0)
+                    total_tokens = input_tokens + output_tokens
+                    cost_per_token = total_cost / total_tokens if total_tokens else 0.0
+                    cost.append(
+                        f"💰 COST ANALYSIS: {result['model'].upper()}\n"
+                        f"{'=' * 60}\n"
+                        f"Input Tokens: {input_tokens:,}\n"
+                        f"Output Tokens: {output_tokens:,}\n"
+                        f"Input Cost: ${cost_tracker.get('input_token_cost', 0):.6f}\n"
+                        f"Output Cost: ${cost_tracker.get('output_token_cost', 0):.6f}\n"
+                        f"Total Cost: ${total_cost:.6f}\n"
+                        f"Cost per Token: ${cost_per_token:.8f}\n"
+                    )
             else:
-                self.update_openarena_output(f"❌ Test failed: {result['error']}\n")
-                self.update_results_summary(f"❌ Test failed: {result['error']}\n")
+                output.append(f"❌ Test failed: {result['error']}\n")
+                summary.append(f"❌ Test failed: {result['error']}\n")
             
-            self.update_openarena_output("\n" + "=" * 60 + "\n\n")
+            output.append("\n" + "=" * 60 + "\n\n")
+            
+            self.update_openarena_output("".join(output))
+            self.update_results_summary("".join(summary))
+            if cost:
+                self.update_cost_analysis("".join(cost))
             
         except Exception as e:
             self._handle_test_error(f"Error handling single test result: {str(e)}")
     
-    def _handle_comprehensive_test_result(self, captured_output):
-        """Handle comprehensive test result in main thread."""
+    def _handle_comprehensive_test_result(self, results):
+        """Handle comprehensive test results in main thread."""
         try:
-            self.test_progress.stop()
-            self.test_status_var.set("Comprehensive test completed")
-            
-            # Update real-time output
-            self.update_openarena_output(captured_output)
-            
-            # Parse results for summary (simplified parsing)
-            lines = captured_output.split('\n')
-            summary_lines = []
-            cost_lines = []
+            self._set_test_status("Comprehensive test completed")
+            
+            # Build both tabs in one pass over the results, headers included
+            summary_lines = ["📊 COMPREHENSIVE TEST SUMMARY", "=" * 60]
+            cost_lines = ["💰 COMPREHENSIVE COST ANALYSIS", "=" * 60]
+            for result in sorted(results, key=lambda r: r['model']):
+                model = result['model'].upper()
+                if result['success']:
+                    summary_lines.append(f"TEST RESULT: {model} - Status: SUCCESS - Response Time: {result['response_time']:.2f}s")
+                else:
+                    summary_lines.append(f"TEST RESULT: {model} - Status: FAILED - {result['error']}")
+                if result.get('cost_tracker'):
+                    cost_lines.append(f"{model} Cost Tracking: {result['cost_tracker']}")
             
-            for line in lines:
-                if 'TEST RESULT:' in line or 'Status:' in line or 'Response Time:' in line:
-                    summary_lines.append(line)
-                elif 'Cost Tracking:' in line or 'input_token_count' in line or 'total_cost' in line:
-                    cost_lines.append(line)
-            
-            # Update summary tabs
-            if summary_lines:
-                self.update_results_summary("📊 COMPREHENSIVE TEST SUMMARY\n")
-                self.update_results_summary("=" * 60 + "\n")
+            # Update summary tabs with a single write each
+            if len(summary_lines) > 2:
                 self.update_results_summary('\n'.join(summary_lines))
             
-            if cost_lines:
-                self.update_cost_analysis("💰 COMPREHENSIVE COST ANALYSIS\n")
-                self.update_cost_analysis("=" * 60 + "\n")
+            if len(cost_lines) > 2:
                 self.update_cost_analysis('\n'.join(cost_lines))
             
         except Exception as e:
@@ -8146,8 +8790,9 @@ Model testing cannot proceed without a valid OpenArena connection."""
     
     def _handle_test_error(self, error_message):
         """Handle test errors in main thread."""
+        self._stop_oa_stream()
         self.test_progress.stop()
-        self.test_status_var.set("Test failed")
+        self._set_test_status("Test failed")
         self.update_openarena_output(f"❌ {error_message}\n")
     
     def update_openarena_output(self, text):
@@ -8155,7 +8800,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
         try:
             self.openarena_output.configure(state="normal")
             self.openarena_output.insert(tk.END, text)
-            self.openarena_output.see(tk.END)
+            self.openarena_output.yview_moveto(1.0)
             self.openarena_output.configure(state="disabled")
         except Exception as e:
             print(f"Error updating Open Arena output: {str(e)}")
@@ -8165,7 +8810,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
         try:
             self.results_summary.configure(state="normal")
             self.results_summary.insert(tk.END, text)
-            self.results_summary.see(tk.END)
+            self.results_summary.yview_moveto(1.0)
             self.results_summary.configure(state="disabled")
         except Exception as e:
             print(f"Error updating results summary: {str(e)}")
@@ -8175,7 +8820,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
         try:
             self.cost_analysis.configure(state="normal")
             self.cost_analysis.insert(tk.END, text)
-            self.cost_analysis.see(tk.END)
+            self.cost_analysis.yview_moveto(1.0)
             self.cost_analysis.configure(state="disabled")
         except Exception as e:
             print(f"Error updating cost analysis: {str(e)}")
@@ -8199,7 +8844,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
             self.cost_analysis.configure(state="disabled")
             
             # Reset status
-            self.test_status_var.set("Ready to test")
+            self._set_test_status("Ready to test")
             
             self.status_var.set("Open Arena output cleared")
         except Exception as e:
@@ -8311,7 +8956,17 @@ Model testing cannot proceed without a valid OpenArena connection."""
                 self.status_var.set("Failed to explain team query strategy")
         
         # Start thread
-        threading.Thread(target=explain_strategy_thread).start()
+        self._submit(explain_strategy_thread)
+    
+    def _team_info(self, project, team):
+        """Return get_team_info(project, team), fetching it at most once per connection."""
+        key = (project, team)
+        if key not in self._team_info_cache:
+            try:
+                self._team_info_cache[key] = self.client.get_team_info(project, team)
+            except Exception:
+                return None
+        return self._team_info_cache[key]
     
     def verify_team_specific_items(self):
         """Verify how team-specific the currently loaded work items are."""
@@ -8322,7 +8977,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
             return
         
         # Check if work items are loaded
-        if not hasattr(self, 'current_work_items') or not self.current_work_items:
+        if not self.current_work_items:
             messagebox.showerror("Error", "No work items loaded. Please get work items for a team first.")
             return
         
@@ -8361,30 +9016,24 @@ Model testing cannot proceed without a valid OpenArena connection."""
         project_label.pack(pady=(0, 10))
         
         # Analyze work items
-        area_paths = {}
+        area_paths = Counter(item.fields.get("System.AreaPath", "Unknown") for item in self.current_work_items)
         total_items = len(self.current_work_items)
         
-        for item in self.current_work_items:
-            area_path = item.fields.get("System.AreaPath", "Unknown")
-            area_paths[area_path] = area_paths.get(area_path, 0) + 1
-        
         # Sort by count (descending)
-        sorted_paths = sorted(area_paths.items(), key=lambda x: x[1], reverse=True)
+        sorted_paths = area_paths.most_common()
         
         # Determine verdict
-        team_area_path = None
-        try:
-            team_info = self.client.get_team_info(project, selected_team)
-            team_area_path = team_info.get('default_area_path') if team_info else None
-        except:
-            pass
+        team_info = self._team_info(project, selected_team)
+        team_area_path = team_info.get('default_area_path') if team_info else None
         
-        # Calculate team-specific percentage
-        team_specific_count = 0
+        # Area paths under the team's node; siblings sharing a name prefix don't count
+        team_paths = set()
         if team_area_path:
-            for path, count in area_paths.items():
-                if path.startswith(team_area_path):
-                    team_specific_count += count
+            team_area_prefix = team_area_path.rstrip('\\') + '\\'
+            team_paths = {path for path in area_paths if path == team_area_path or path.startswith(team_area_prefix)}
+        
+        # Calculate team-specific percentage
+        team_specific_count = sum(area_paths[path] for path in team_paths)
         
         team_specific_percentage = (team_specific_count / total_items * 100) if total_items > 0 else 0
         
@@ -8427,20 +9076,48 @@ Model testing cannot proceed without a valid OpenArena connection."""
             tree.heading(col, text=col)
             tree.column(col, width=150)
         
+        # Format every row up front; rows are inserted lazily as the tree is scrolled
+        # Many paths share a count, so format each distinct percentage once
+        percent_per_item = 100.0 / total_items if total_items else 0.0
+        percent_text = {count: f"{count * percent_per_item:.1f}%" for count in set(area_paths.values())}
+        if team_paths:
+            breakdown_rows = [(path, count, percent_text[count], "Yes" if path in team_paths else "No")
+                              for path, count in sorted_paths]
+        else:
+            breakdown_rows = [(path, count, percent_text[count], "No")
+                              for path, count in sorted_paths]
+        loaded = [0]
+        load_pending = [False]
+        
+        def load_more_rows():
+            """Insert the next page of breakdown rows."""
+            load_pending[0] = False
+            start = loaded[0]
+            end = min(start + self.breakdown_page_size, len(breakdown_rows))
+            # Call Tk directly; ttk.Treeview.insert re-formats its options on every row
+            call, widget = tree.tk.call, tree._w
+            for row in breakdown_rows[start:end]:
+                call(widget, "insert", "", "end", "-values", row)
+            loaded[0] = end
+        
+        def on_tree_scroll(first, last):
+            """Update the scrollbar and load more rows once the last loaded row is visible."""
+            scrollbar.set(first, last)
+            if float(last) >= 1.0 and loaded[0] < len(breakdown_rows) and not load_pending[0]:
+                load_pending[0] = True
+                tree.after_idle(load_more_rows)
+        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(breakdown_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        tree.configure(yscrollcommand=on_tree_scroll)
         
         # Pack tree and scrollbar
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate tree
-        for path, count in sorted_paths:
-            percentage = (count / total_items * 100) if total_items > 0 else 0
-            is_team_specific = "Yes" if (team_area_path and path.startswith(team_area_path)) else "No"
-            
-            tree.insert("", "end", values=(path, count, f"{percentage:.1f}%", is_team_specific))
+        # Populate the first page once the window is up; resizing or scrolling to the bottom loads the rest
+        load_pending[0] = True
+        tree.after_idle(load_more_rows)
         
         # Recommendations frame
         recommendations_frame = ttk.LabelFrame(frame, text="Recommendations", padding="10")
@@ -8478,52 +9155,109 @@ Model testing cannot proceed without a valid OpenArena connection."""
         verify_window.focus_set()
     
     def on_tree_motion(self, event):
-        """Handle mouse motion over treeview for tooltips."""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        """Handle mouse motion over treeview for tooltips.
+        
+        Nothing happens while the pointer stays within one cell. When it moves to another
+        cell the tooltip is rebuilt 50 ms later, so sweeping across many cells builds one.
+        """
+        if self._suppress_motion:
+            return
         
         # Get the item and column under the cursor
         item = self.work_items_tree.identify_row(event.y)
         column = self.work_items_tree.identify_column(event.x)
         
-        if item and column:
-            # Get column name
-            col_name = self.work_items_tree.heading(column)['text']
-            # Get cell value
-            cell_value = self.work_items_tree.item(item)['values']
-            col_index = int(column[1]) - 1  # column format is #1, #2, etc.
+        if (item, column) == self._last_hover:
+            return
+        self._last_hover = (item, column)
+        
+        self._hide_tooltip()
+        if self._hover_after_id is not None:
+            self.root.after_cancel(self._hover_after_id)
+        self._hover_after_id = self.root.after(
+            50, self._show_cell_tooltip, item, column, event.x_root, event.y_root)
+    
+    def _set_motion_suppressed(self, suppressed):
+        """Turn work item tooltips off (and hide any showing) or back on."""
+        self._suppress_motion = suppressed
+        if suppressed:
+            self.on_tree_leave(None)
+    
+    def _show_cell_tooltip(self, item, column, x_root, y_root):
+        """Show a tooltip for the hovered cell if its text is long or it is the Area Path."""
+        self._hover_after_id = None
+        col_name = self._tooltip_columns.get(column)
+        if not (item and col_name):
+            return
+        
+        key = (item, col_name)
+        text = self._tooltip_cache.get(key)
+        if text is None:
+            # The tree may have been refreshed since the pointer moved
+            if not self.work_items_tree.exists(item):
+                return
+            # Fetch only the hovered cell
+            cell_text = str(self.work_items_tree.set(item, col_name))
             
-            if col_index < len(cell_value):
-                cell_text = str(cell_value[col_index])
-                
-                # Show tooltip for long text, especially Area Path
-                if len(cell_text) > 30 or col_name == 'Area Path':
-                    self.show_tooltip(event.x_root, event.y_root, cell_text)
+            # Tooltip for long text, especially Area Path; "" marks cells without one
+            if len(cell_text) > 30 or col_name == 'Area Path':
+                text = textwrap.shorten(cell_text, width=400, placeholder="…")
+            else:
+                text = ""
+            self._tooltip_cache[key] = text
+        
+        if text:
+            self.show_tooltip(x_root, y_root, text)
     
     def on_tree_leave(self, event):
         """Handle mouse leave from treeview."""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        self._last_hover = None
+        if self._hover_after_id is not None:
+            self.root.after_cancel(self._hover_after_id)
+            self._hover_after_id = None
+        self._hide_tooltip()
+    
+    def _tooltip_window(self):
+        """Return the shared tooltip window and label, creating them (hidden) on first use.
+        
+        Only one tooltip is ever visible, so every tooltip reuses this pair and is shown
+        and hidden with deiconify/withdraw instead of creating a new Toplevel.
+        """
+        if self._tooltip_win is None:
+            self._tooltip_win = tk.Toplevel(self.root)
+            self._tooltip_win.wm_overrideredirect(True)
+            self._tooltip_win.withdraw()
+            self._tooltip_label = tk.Label(self._tooltip_win, justify=tk.LEFT,
+                                           background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                           font=("TkDefaultFont", 8, "normal"))
+            self._tooltip_label.pack()
+        return self._tooltip_win, self._tooltip_label
+    
+    def _place_tooltip(self, x, y, text, hide_after_ms):
+        """Show text in the shared tooltip at screen position (x, y), hiding it after hide_after_ms."""
+        window, label = self._tooltip_window()
+        label.configure(text=text)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        window.lift()
+        
+        # Restart the auto-hide timer so an earlier tooltip's timer can't hide this one
+        if self._tooltip_after_id is not None:
+            self.root.after_cancel(self._tooltip_after_id)
+        self._tooltip_after_id = self.root.after(hide_after_ms, self._hide_tooltip)
+    
+    def _hide_tooltip(self):
+        """Hide the shared tooltip window."""
+        if self._tooltip_after_id is not None:
+            self.root.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+        if self._tooltip_win is not None:
+            self._tooltip_win.withdraw()
     
     def show_tooltip(self, x, y, text):
         """Show a tooltip with the given text."""
-        if self.tooltip:
-            self.tooltip.destroy()
-        
-        self.tooltip = tk.Toplevel(self.root)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x+10}+{y+10}")
-        
-        # Create tooltip label
-        label = tk.Label(self.tooltip, text=text, justify=tk.LEFT,
-                        background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                        font=("TkDefaultFont", 8, "normal"))
-        label.pack()
-        
-        # Auto-destroy after 3 seconds
-        self.root.after(3000, lambda: self.tooltip.destroy() if self.tooltip else None)
+        # Auto-hide after 3 seconds
+        self._place_tooltip(x + 10, y + 10, text, 3000)
     
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget."""
@@ -8532,27 +9266,11 @@ Model testing cannot proceed without a valid OpenArena connection."""
             x += widget.winfo_rootx() + 25
             y += widget.winfo_rooty() + 20
             
-            # Create tooltip window
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
-            # Create tooltip label
-            label = tk.Label(tooltip, text=text, justify=tk.LEFT,
-                           background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                           font=("TkDefaultFont", 8, "normal"))
-            label.pack()
-            
-            # Auto-destroy after 2 seconds
-            tooltip.after(2000, tooltip.destroy)
-            
-            # Store tooltip reference to widget
-            widget.tooltip = tooltip
+            # Auto-hide after 2 seconds
+            self._place_tooltip(x, y, text, 2000)
         
         def hide_tooltip(event):
-            if hasattr(widget, 'tooltip') and widget.tooltip:
-                widget.tooltip.destroy()
-                widget.tooltip = None
+            self._hide_tooltip()
         
         # Bind events
         widget.bind('<Enter>', show_tooltip)
@@ -8613,8 +9331,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
                     
                     if team_area_paths:
                         print(f"✅ Found {len(team_area_paths)} team-specific area paths:")
-                        for i, path in enumerate(team_area_paths, 1):
-                            print(f"   {i}. {path}")
+                        print("\n".join(f"   {i}. {path}" for i, path in enumerate(team_area_paths, 1)))
                     else:
                         print("❌ No team-specific area paths found")
                         print("   This explains why team filtering is not working!")
@@ -8628,8 +9345,7 @@ Model testing cannot proceed without a valid OpenArena connection."""
                     if project_area_paths:
                         print(f"✅ Found {len(project_area_paths)} project-wide area paths:")
                         # Show first 20 to avoid overwhelming output
-                        for i, path in enumerate(project_area_paths[:20], 1):
-                            print(f"   {i}. {path}")
+                        print("\n".join(f"   {i}. {path}" for i, path in enumerate(project_area_paths[:20], 1)))
                         
                         if len(project_area_paths) > 20:
                             print(f"   ... and {len(project_area_paths) - 20} more")
@@ -8643,34 +9359,32 @@ Model testing cannot proceed without a valid OpenArena connection."""
                     
                     # Look for patterns in area paths
                     if project_area_paths:
-                        # Find area paths that might be team-related
+                        # Find area paths that might be team-related (containing the team name
+                        # or any word of it) and count the top-level patterns in the same walk
+                        team_lower = selected_team.lower()
+                        team_pattern = re.compile("|".join(re.escape(w) for w in [team_lower, *team_lower.split()]))
                         potential_team_paths = []
+                        path_patterns = Counter()
                         for path in project_area_paths:
-                            if selected_team.lower() in path.lower() or any(word in path.lower() for word in selected_team.lower().split()):
+                            if team_pattern.search(path.lower()):
                                 potential_team_paths.append(path)
+                            parts = path.split('\\', 2)
+                            if len(parts) >= 2:
+                                path_patterns[parts[0], parts[1]] += 1
                         
                         if potential_team_paths:
                             print(f"🎯 Found {len(potential_team_paths)} potential team-related area paths:")
-                            for path in potential_team_paths:
-                                print(f"   • {path}")
+                            print("\n".join(f"   • {path}" for path in potential_team_paths))
                         else:
                             print("❌ No obvious team-related area paths found")
                             print("   This suggests the team may not have area paths configured")
                         
-                        # Check for common patterns
-                        path_patterns = {}
-                        for path in project_area_paths:
-                            parts = path.split('\\')
-                            if len(parts) >= 2:
-                                pattern = f"{parts[0]}\\{parts[1]}"
-                                path_patterns[pattern] = path_patterns.get(pattern, 0) + 1
-                        
+                        # Report common patterns
                         if path_patterns:
                             print()
                             print("📊 Common Area Path Patterns:")
-                            sorted_patterns = sorted(path_patterns.items(), key=lambda x: x[1], reverse=True)
-                            for pattern, count in sorted_patterns[:10]:
-                                print(f"   {pattern}: {count} work items")
+                            print("\n".join(f"   {root}\\{node}: {count} work items"
+                                            for (root, node), count in path_patterns.most_common(10)))
                     
                     print()
                     print("=" * 80)
@@ -8698,6 +9412,11 @@ Model testing cannot proceed without a valid OpenArena connection."""
                 error_msg = f"Error discovering area paths: {str(e)}"
                 print(f"❌ {error_msg}")
                 self.status_var.set(f"Error: {error_msg}")
+            finally:
+                self.root.after(0, self._set_motion_suppressed, False)
+        
+        # Ignore pointer motion over the work items table until discovery finishes
+        self._set_motion_suppressed(True)
         
         # Start the thread
         thread = threading.Thread(target=discover_area_paths_thread)
@@ -8705,8 +9424,18 @@ Model testing cannot proceed without a valid OpenArena connection."""
         thread.start()
 
     def show_enhanced_filtering_info(self):
-        """Show information about the enhanced team filtering strategy."""
+        """Show information about the enhanced team filtering strategy.
+        
+        The window is built on first use and hidden rather than destroyed when closed.
+        """
+        if self._info_window is not None and self._info_window.winfo_exists():
+            self._info_window.deiconify()
+            self._info_window.lift()
+            return
+        
         info_window = tk.Toplevel(self.root)
+        self._info_window = info_window
+        info_window.protocol("WM_DELETE_WINDOW", info_window.withdraw)
         info_window.title("🚀 Enhanced Team Filtering Strategy")
         info_window.geometry("800x600")
         info_window.resizable(True, True)
@@ -8723,68 +9452,32 @@ Model testing cannot proceed without a valid OpenArena connection."""
         strategy_frame = ttk.LabelFrame(main_frame, text="📋 Strategy Overview", padding="15")
         strategy_frame.pack(fill=tk.X, pady=(0, 15))
         
-        strategy_text = """
-The enhanced team filtering strategy uses multiple fallback methods to ensure you get team-specific work items:
-
-1️⃣ TEAM BACKLOG QUERY (Most Reliable)
-   • Directly queries the team's backlog
-   • Returns only work items assigned to the team
-   • Requires team to have backlog configured
-
-2️⃣ TEAM AREA PATH QUERY (If Configured)
-   • Uses the team's configured area path in Azure DevOps
-   • Searches for work items in the team's area path
-   • Falls back to constructed area paths if not configured
-
-3️⃣ MANUAL AREA PATH MAPPING (Fallback)
-   • Uses custom area path mappings from configuration
-   • Allows you to specify team-specific area paths
-   • Provides fallback when ADO configuration is missing
-
-4️⃣ PROJECT-WIDE QUERY WITH TEAM FILTERING (Last Resort)
-   • Searches all work items in the project
-   • Filters by team-related indicators (area path, assigned to, tags)
-   • Less reliable but ensures you get some results
-        """
-        
-        strategy_label = ttk.Label(strategy_frame, text=strategy_text, justify=tk.LEFT, wraplength=700)
+        strategy_label = ttk.Label(strategy_frame, text=_FILTERING_STRATEGY_TEXT, justify=tk.LEFT, wraplength=700)
         strategy_label.pack(anchor=tk.W)
         
         # Benefits frame
         benefits_frame = ttk.LabelFrame(main_frame, text="✅ Benefits", padding="15")
         benefits_frame.pack(fill=tk.X, pady=(0, 15))
         
-        benefits_text = """
-• 🎯 More accurate team filtering
-• 🔄 Multiple fallback strategies
-• ⚙️ Configurable area path mappings
-• 📊 Better work item relevance
-• 🚀 Improved user experience
-        """
-        
-        benefits_label = ttk.Label(benefits_frame, text=benefits_text, justify=tk.LEFT, wraplength=700)
+        benefits_label = ttk.Label(benefits_frame, text=_FILTERING_BENEFITS_TEXT, justify=tk.LEFT, wraplength=700)
         benefits_label.pack(anchor=tk.W)
         
         # Configuration frame
         config_frame = ttk.LabelFrame(main_frame, text="⚙️ Configuration", padding="15")
         config_frame.pack(fill=tk.X, pady=(0, 15))
         
-        config_text = """
-• Edit config/team_area_paths.json to customize team mappings
-• Add your team names and corresponding area paths
-• The system will automatically use these mappings
-• No code changes required for basic customization
-        """
-        
-        config_label = ttk.Label(config_frame, text=config_text, justify=tk.LEFT, wraplength=700)
+        config_label = ttk.Label(config_frame, text=_FILTERING_CONFIG_TEXT, justify=tk.LEFT, wraplength=700)
         config_label.pack(anchor=tk.W)
         
         # Close button
-        close_button = ttk.Button(main_frame, text="Close", command=info_window.destroy)
+        close_button = ttk.Button(main_frame, text="Close", command=info_window.withdraw)
         close_button.pack(pady=(20, 0))
 
     def create_ado_operations_tab(self):
-        """Create the ADO Operations tab with sub-tabs for various ADO operations."""
+        """Create the ADO Operations tab with sub-tabs for various ADO operations.
+        
+        Only the first sub-tab is built now; the others are built the first time they are selected.
+        """
         ado_operations_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(ado_operations_frame, text="ADO Operations")
         
@@ -8792,249 +9485,71 @@ The enhanced team filtering strategy uses multiple fallback methods to ensure yo
         self.ado_operations_notebook = ttk.Notebook(ado_operations_frame)
         self.ado_operations_notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Query Work Items sub-tab
-        query_frame = ttk.Frame(self.ado_operations_notebook, padding="10")
-        self.ado_operations_notebook.add(query_frame, text="Query Work Items")
-        
-        # Copy content from create_query_items_tab method
-        self.create_query_items_content(query_frame)
-        
-        # Get Work Item sub-tab
-        get_item_frame = ttk.Frame(self.ado_operations_notebook, padding="10")
-        self.ado_operations_notebook.add(get_item_frame, text="Get Work Item")
-        
-        # Copy content from create_get_item_tab method
-        self.create_get_item_content(get_item_frame)
-        
-        # Create Work Item sub-tab
-        create_item_frame = ttk.Frame(self.ado_operations_notebook, padding="10")
-        self.ado_operations_notebook.add(create_item_frame, text="Create Work Item")
-        
-        # Copy content from create_create_item_tab method
-        self.create_create_item_content(create_item_frame)
-        
-        # Update Work Item sub-tab
-        update_item_frame = ttk.Frame(self.ado_operations_notebook, padding="10")
-        self.ado_operations_notebook.add(update_item_frame, text="Update Work Item")
-        
-        # Copy content from create_update_item_tab method
-        self.create_update_item_content(update_item_frame)
-        
-        # Refine Work Item sub-tab
-        refine_item_frame = ttk.Frame(self.ado_operations_notebook, padding="10")
-        self.ado_operations_notebook.add(refine_item_frame, text="Refine Work Item")
-        
-        # Copy content from create_refine_item_tab method
-        self.create_refine_item_content(refine_item_frame)
-
-    def create_query_items_content(self, parent_frame):
-        """Create the content for Query Work Items sub-tab."""
+        # Add an empty frame per sub-tab (see _ADO_OPERATION_TABS)
+        self._operation_tab_frames = []
+        for spec in _ADO_OPERATION_TABS:
+            frame = ttk.Frame(self.ado_operations_notebook, padding="10")
+            self.ado_operations_notebook.add(frame, text=spec["title"])
+            self._operation_tab_frames.append(frame)
+        self._built_operation_tabs = set()
+        
+        self._build_selected_operation_tab()
+        self.ado_operations_notebook.bind("<<NotebookTabChanged>>",
+                                          lambda event: self._build_selected_operation_tab())
+    
+    def _build_selected_operation_tab(self):
+        """Build the selected ADO Operations sub-tab if it hasn't been built yet."""
+        index = self.ado_operations_notebook.index("current")
+        if index not in self._built_operation_tabs:
+            self._built_operation_tabs.add(index)
+            self._build_operation_tab(self._operation_tab_frames[index], _ADO_OPERATION_TABS[index])
+    
+    def _build_operation_tab(self, parent_frame, spec):
+        """Create an ADO Operations sub-tab's widgets from its _ADO_OPERATION_TABS entry."""
         # Description frame
-        desc_frame = ttk.LabelFrame(parent_frame, text="About Query Work Items", padding="10")
+        desc_frame = ttk.LabelFrame(parent_frame, text=f"About {spec['title']}", padding="10")
         desc_frame.pack(fill=tk.X, pady=(0, 10))
         
-        desc_text = """This section allows you to query work items from Azure DevOps using various criteria. 
-        You can search by work item type, state, assigned to, or custom queries."""
-        
-        desc_label = ttk.Label(desc_frame, text=desc_text, wraplength=600, justify=tk.LEFT)
+        desc_label = ttk.Label(desc_frame, text=spec["about"], wraplength=600, justify=tk.LEFT)
         desc_label.pack(anchor=tk.W)
         
-        # Input frame
-        input_frame = ttk.LabelFrame(parent_frame, text="Query Work Items", padding="10")
+        # Input frame, one labelled entry per row
+        input_frame = ttk.LabelFrame(parent_frame, text=spec["input_title"], padding="10")
         input_frame.pack(fill=tk.X, pady=5)
         
-        # Work Item Type
-        ttk.Label(input_frame, text="Work Item Type:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.query_type_var = tk.StringVar(value="User Story")
-        ttk.Entry(input_frame, textvariable=self.query_type_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # State
-        ttk.Label(input_frame, text="State:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.query_state_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.query_state_var, width=20).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        for row, (label, attr, default, width) in enumerate(spec["fields"]):
+            ttk.Label(input_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+            var = tk.StringVar(value=default)
+            setattr(self, attr, var)
+            ttk.Entry(input_frame, textvariable=var, width=width).grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
         
-        # Limit
-        ttk.Label(input_frame, text="Limit:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.query_limit_var = tk.StringVar(value="10")
-        ttk.Entry(input_frame, textvariable=self.query_limit_var, width=10).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        # Checkboxes sit beside the first entry
+        for column, (text, attr) in enumerate(spec.get("checks", ()), 2):
+            var = tk.BooleanVar(value=False)
+            setattr(self, attr, var)
+            ttk.Checkbutton(input_frame, text=text, variable=var).grid(row=0, column=column, sticky=tk.W, padx=5, pady=5)
         
-        # Query button
-        query_button = ttk.Button(input_frame, text="Query Work Items", command=self.query_work_items)
-        query_button.grid(row=3, column=0, columnspan=2, pady=10)
+        # Action button
+        button_text, method = spec["action"]
+        action_button = ttk.Button(input_frame, text=button_text, command=getattr(self, method))
+        action_button.grid(row=len(spec["fields"]), column=0, columnspan=2, pady=10)
         
         # Output area
-        output_frame = ttk.LabelFrame(parent_frame, text="Query Results", padding="10")
-        output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        self.query_output = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD)
-        self.query_output.pack(fill=tk.BOTH, expand=True)
-        self.query_output.configure(state="disabled")
-        
-    def create_get_item_content(self, parent_frame):
-        """Create the content for Get Work Item sub-tab."""
-        # Description frame
-        desc_frame = ttk.LabelFrame(parent_frame, text="About Get Work Item", padding="10")
-        desc_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        desc_text = """This section allows you to retrieve a specific work item by its ID from Azure DevOps."""
-        
-        desc_label = ttk.Label(desc_frame, text=desc_text, wraplength=600, justify=tk.LEFT)
-        desc_label.pack(anchor=tk.W)
-        
-        # Input frame
-        input_frame = ttk.LabelFrame(parent_frame, text="Get Work Item by ID", padding="10")
-        input_frame.pack(fill=tk.X, pady=5)
-        
-        # Work Item ID
-        ttk.Label(input_frame, text="Work Item ID:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.get_item_id_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.get_item_id_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Get button
-        get_button = ttk.Button(input_frame, text="Get Work Item", command=self.get_work_item)
-        get_button.grid(row=1, column=0, columnspan=2, pady=10)
-        
-        # Output area
-        output_frame = ttk.LabelFrame(parent_frame, text="Work Item Details", padding="10")
-        output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        self.get_item_output = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD)
-        self.get_item_output.pack(fill=tk.BOTH, expand=True)
-        self.get_item_output.configure(state="disabled")
-        
-    def create_create_item_content(self, parent_frame):
-        """Create the content for Create Work Item sub-tab."""
-        # Description frame
-        desc_frame = ttk.LabelFrame(parent_frame, text="About Create Work Item", padding="10")
-        desc_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        desc_text = """This section allows you to create new work items in Azure DevOps."""
-        
-        desc_label = ttk.Label(desc_frame, text=desc_text, wraplength=600, justify=tk.LEFT)
-        desc_label.pack(anchor=tk.W)
-        
-        # Input frame
-        input_frame = ttk.LabelFrame(parent_frame, text="Create New Work Item", padding="10")
-        input_frame.pack(fill=tk.X, pady=5)
-        
-        # Work Item Type
-        ttk.Label(input_frame, text="Work Item Type:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.create_type_var = tk.StringVar(value="User Story")
-        ttk.Entry(input_frame, textvariable=self.create_type_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Title
-        ttk.Label(input_frame, text="Title:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.create_title_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.create_title_var, width=50).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Description
-        ttk.Label(input_frame, text="Description:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.create_desc_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.create_desc_var, width=50).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Assigned To
-        ttk.Label(input_frame, text="Assigned To:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.create_assigned_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.create_assigned_var, width=30).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Tags
-        ttk.Label(input_frame, text="Tags (semicolon-separated):").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.create_tags_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.create_tags_var, width=50).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Create button
-        create_button = ttk.Button(input_frame, text="Create Work Item", command=self.create_work_item)
-        create_button.grid(row=5, column=0, columnspan=2, pady=10)
-        
-        # Output area
-        output_frame = ttk.LabelFrame(parent_frame, text="Result", padding="10")
-        output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        self.create_output = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD)
-        self.create_output.pack(fill=tk.BOTH, expand=True)
-        self.create_output.configure(state="disabled")
-        
-    def create_update_item_content(self, parent_frame):
-        """Create the content for Update Work Item sub-tab."""
-        # Description frame
-        desc_frame = ttk.LabelFrame(parent_frame, text="About Update Work Item", padding="10")
-        desc_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        desc_text = """This section allows you to update existing work items in Azure DevOps."""
-        
-        desc_label = ttk.Label(desc_frame, text=desc_text, wraplength=600, justify=tk.LEFT)
-        desc_label.pack(anchor=tk.W)
-        
-        # Input frame
-        input_frame = ttk.LabelFrame(parent_frame, text="Update Existing Work Item", padding="10")
-        input_frame.pack(fill=tk.X, pady=5)
-        
-        # Work Item ID
-        ttk.Label(input_frame, text="Work Item ID:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.update_id_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_id_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Title
-        ttk.Label(input_frame, text="New Title:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.update_title_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_title_var, width=50).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Description
-        ttk.Label(input_frame, text="New Description:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.update_desc_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_desc_var, width=50).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # State
-        ttk.Label(input_frame, text="New State:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.update_state_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_state_var, width=20).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Assigned To
-        ttk.Label(input_frame, text="New Assigned To:").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.update_assigned_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_assigned_var, width=30).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Tags
-        ttk.Label(input_frame, text="New Tags (semicolon-separated):").grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.update_tags_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.update_tags_var, width=50).grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Update button
-        update_button = ttk.Button(input_frame, text="Update Work Item", command=self.update_work_item)
-        update_button.grid(row=6, column=0, columnspan=2, pady=10)
+        if "extra" in spec:
+            getattr(self, spec["extra"])(parent_frame)
+            return
         
-        # Output area
-        output_frame = ttk.LabelFrame(parent_frame, text="Result", padding="10")
+        output_title, output_attr = spec["output"]
+        output_frame = ttk.LabelFrame(parent_frame, text=output_title, padding="10")
         output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.update_output = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD)
-        self.update_output.pack(fill=tk.BOTH, expand=True)
-        self.update_output.configure(state="disabled")
-        
-    def create_refine_item_content(self, parent_frame):
-        """Create the content for Refine Work Item sub-tab."""
-        # Description frame
-        desc_frame = ttk.LabelFrame(parent_frame, text="About Refine Work Item", padding="10")
-        desc_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        desc_text = """This section allows you to refine work items using AI analysis."""
-        
-        desc_label = ttk.Label(desc_frame, text=desc_text, wraplength=600, justify=tk.LEFT)
-        desc_label.pack(anchor=tk.W)
-        
-        # Input frame
-        input_frame = ttk.LabelFrame(parent_frame, text="Refine Work Item", padding="10")
-        input_frame.pack(fill=tk.X, pady=5)
-        
-        # Work Item ID
-        ttk.Label(input_frame, text="Work Item ID:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.refine_id_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.refine_id_var, width=20).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Refine button
-        refine_button = ttk.Button(input_frame, text="Refine Work Item", command=self.refine_work_item)
-        refine_button.grid(row=1, column=0, columnspan=2, pady=10)
-        
+        output = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD)
+        output.pack(fill=tk.BOTH, expand=True)
+        output.configure(state="disabled")
+        setattr(self, output_attr, output)
+    
+    def _build_refine_output(self, parent_frame):
+        """Create the Refine Work Item sub-tab's formatted and raw output tabs."""
         # Output area with tabs for formatted and raw output
         output_notebook = ttk.Notebook(parent_frame)
         output_notebook.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -9059,12 +9574,12 @@ The enhanced team filtering strategy uses multiple fallback methods to ensure yo
         
         # Copy raw output button
         copy_raw_button = ttk.Button(raw_controls_frame, text="Copy Raw Output", 
-                                   command=lambda: self.copy_to_clipboard(self.raw_output))
+                                   command=self.copy_raw_output)
         copy_raw_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Clear raw output button
         clear_raw_button = ttk.Button(raw_controls_frame, text="Clear Raw Output", 
-                                    command=lambda: self.clear_raw_output())
+                                    command=self.clear_raw_output)
         clear_raw_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         self.raw_output = scrolledtext.ScrolledText(raw_frame, wrap=tk.WORD, font=("Consolas", 9), 
@@ -9075,93 +9590,93 @@ The enhanced team filtering strategy uses multiple fallback methods to ensure yo
     def configure_area_path_mappings(self):
         """Open the area path mappings configuration file for editing."""
         try:
-            config_path = "config/team_area_paths.json"
-            
-            if not os.path.exists(config_path):
-                # Create default config if it doesn't exist
-                default_config = {
-                    "team_area_path_mappings": {
-                        "Practical Law": [
-                            "Project\\Practical Law\\Features",
-                            "Project\\Practical Law\\Core"
-                        ],
-                        "Westlaw": [
-                            "Project\\Westlaw\\Core",
-                            "Project\\Westlaw\\Search"
-                        ]
-                    },
-                    "area_path_patterns": {
-                        "team_name_in_path": True,
-                        "case_sensitive": False,
-                        "partial_matching": True
-                    },
-                    "fallback_strategies": {
-                        "use_team_backlog": True,
-                        "use_constructed_paths": True,
-                        "use_manual_mapping": True,
-                        "use_project_query": True
-                    }
-                }
-                
-                with open(config_path, 'w') as f:
-                    json.dump(default_config, f, indent=4)
-                
-                messagebox.showinfo("Configuration Created", f"Default configuration file created at:\n{config_path}\n\nPlease edit this file to customize your team mappings.")
+            config_path = _AREA_PATH_CONFIG_PATH
             
-            # Try to open the file with the default system editor
+            # Create the default config unless the file already exists
+            try:
+                with open(config_path, 'x') as f:
+                    f.write(_DEFAULT_AREA_PATH_CONFIG)
+            except FileExistsError:
+                created = False
+            else:
+                created = True
+            
+            # Try to open the file with the default system editor (without waiting for it)
             if sys.platform.startswith('win'):
                 os.startfile(config_path)
-            elif sys.platform.startswith('darwin'):
-                subprocess.run(['open', config_path])
             else:
-                subprocess.run(['xdg-open', config_path])
-                
-            messagebox.showinfo("Configuration Opened", f"Configuration file opened for editing:\n{config_path}\n\nAfter making changes, restart the application for them to take effect.")
+                import subprocess
+                subprocess.Popen(['open' if sys.platform.startswith('darwin') else 'xdg-open', config_path],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 close_fds=True, start_new_session=True)
+            
+            self.status_var.set(_AREA_PATH_CONFIG_OPENED_STATUS)
+            if created:
+                messagebox.showinfo("Configuration Created", _AREA_PATH_CONFIG_CREATED_MESSAGE)
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not open configuration file:\n{str(e)}")
     
+    def _cache_get(self, cache_key):
+        """Return cached related items for cache_key (None if absent), marking them recently used."""
+        related_items = self.related_items_cache.get(cache_key)
+        if related_items is None:
+            self._related_cache_misses += 1
+        else:
+            self._related_cache_hits += 1
+            self.related_items_cache.move_to_end(cache_key)
+        return related_items
+    
     def _add_to_cache(self, cache_key, related_items):
-        """Add results to cache with size management."""
-        # Remove oldest entries if cache is too large
-        if len(self.related_items_cache) >= self.cache_max_size:
-            # Remove the first (oldest) entry
-            oldest_key = next(iter(self.related_items_cache))
-            del self.related_items_cache[oldest_key]
-            print(f"🗑️ Cache full, removed oldest entry: {oldest_key}")
-        
+        """Add results to cache, evicting the least recently used entry when full."""
         self.related_items_cache[cache_key] = related_items
+        self.related_items_cache.move_to_end(cache_key)
+        if len(self.related_items_cache) > self.cache_max_size:
+            oldest_key, _ = self.related_items_cache.popitem(last=False)
+            logger.debug("Related items cache full, removed least recently used entry %r", oldest_key)
     
     def clear_related_items_cache(self):
         """Clear the related items cache."""
         self.related_items_cache.clear()
-        print("🗑️ Related items cache cleared")
+        self._related_cache_hits = self._related_cache_misses = 0
+        logger.debug("Related items cache cleared")
     
     def get_cache_stats(self):
         """Get cache statistics for debugging."""
         return {
             'cache_size': len(self.related_items_cache),
             'max_size': self.cache_max_size,
-            'cached_items': list(self.related_items_cache.keys())
+            'hits': self._related_cache_hits,
+            'misses': self._related_cache_misses,
+            'cached_items': self.related_items_cache.keys()  # live view; list() it to keep a snapshot
         }
     
+    def _schedule_hierarchy_redraw(self):
+        """Redisplay the work items 150 ms from now, replacing any redisplay already scheduled.
+        
+        Toggling the hierarchy checkbox several times in quick succession redraws the table once.
+        """
+        if self._hierarchy_redraw_id is not None:
+            self.root.after_cancel(self._hierarchy_redraw_id)
+        self._hierarchy_redraw_id = self.root.after(150, self._redraw_for_hierarchy)
+    
+    def _redraw_for_hierarchy(self):
+        """Redisplay the current work items after a hierarchy toggle."""
+        self._hierarchy_redraw_id = None
+        if self.current_work_items:
+            self.display_work_items(self.current_work_items)
+    
     def on_hierarchy_toggle_changed(self):
         """Handle hierarchy toggle checkbox change."""
-        if hasattr(self, 'load_hierarchy_var'):
-            is_enabled = self.load_hierarchy_var.get()
-            if is_enabled:
-                print("📊 Hierarchy loading enabled - will load hierarchy for all work items (may be slower)")
-                # Refresh the current display if there are work items
-                if hasattr(self, 'current_work_items') and self.current_work_items:
-                    print("🔄 Refreshing display with hierarchy information...")
-                    self.display_work_items(self.current_work_items)
-            else:
-                print("⚡ Hierarchy loading disabled - faster performance, hierarchy only for selected work items")
-                # Refresh the current display without hierarchy
-                if hasattr(self, 'current_work_items') and self.current_work_items:
-                    print("🔄 Refreshing display without hierarchy information...")
-                    self.display_work_items(self.current_work_items)
-
+        if self.load_hierarchy_var.get():
+            logger.debug("Hierarchy loading enabled - will load hierarchy for all work items (may be slower)")
+        else:
+            logger.debug("Hierarchy loading disabled - hierarchy only for selected work items")
+        # Refresh the current display if there are work items
+        if not self.current_work_items:
+            return
+        logger.debug("Refreshing display after hierarchy toggle")
+        self._schedule_hierarchy_redraw()
 
 def main():
     """Main function to run the application."""
@@ -4,25 +4,37 @@ Icon Helper for Azure DevOps AI Studio
 Creates and manages the custom application icon
 """
 
+import os
 import tkinter as tk
-import base64
-from PIL import Image, ImageDraw, ImageTk
-import io
+
+# The robot icon drawn by create_ado_ai_icon, saved as a 32x32 grayscale PNG so startup
+# can load it with tk.PhotoImage without importing or drawing with PIL
+_ICON_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAAAAABWESUoAAAATklEQVR42uWTQQoAIAgEd6L/f3k7SdYhCAqCPAnKuKuItY6iLxpqJMwV7xLkREl5EHCnypLMaZsmOSFmDiKzTx69RV/TKHOHwCWR/PE4DcCZDEqMbMb5AAAAAElFTkSuQmCC"
+
+# The robot icon, drawn once by create_ado_ai_icon and reused for every window
+_ICON_CACHE = None
 
 def create_ado_ai_icon():
     """
     Create a simple black and white robot icon that fits perfectly in title bars.
-    Returns a PhotoImage object that can be used as the application icon.
+    Returns a PIL image; _ICON_PNG_B64 holds the same image prebuilt, and this is
+    only drawn as a fallback. The image is drawn once and reused afterwards.
     """
+    global _ICON_CACHE
+    if _ICON_CACHE is not None:
+        return _ICON_CACHE
+    
     try:
+        from PIL import Image, ImageDraw
+        
         # Create a 32x32 icon (perfect size for title bars)
         size = 32
-        img = Image.new('RGB', (size, size), (255, 255, 255))  # White background
+        img = Image.new('L', (size, size), 255)  # Grayscale, white background
         draw = ImageDraw.Draw(img)
         
         # Black and white colors only
-        black = (0, 0, 0)        # Pure black
-        white = (255, 255, 255)  # Pure white
+        black = 0        # Pure black
+        white = 255      # Pure white
         
         # Draw simple robot icon
         center_x, center_y = size // 2, size // 2
@@ -53,23 +65,49 @@ def create_ado_ai_icon():
         draw.line([center_x, center_y - head_size//2, center_x, center_y - head_size//2 - 4], 
                  fill=white, width=2)
         
+        _ICON_CACHE = img
         return img
         
     except Exception as e:
         print(f"Could not create custom icon: {e}")
         return None
 
+def _load_icon_photo(root):
+    """
+    Load the robot icon as a PhotoImage for root.
+    Uses the embedded PNG; falls back to drawing it with PIL if this Tk can't read PNG data.
+    """
+    try:
+        return tk.PhotoImage(master=root, data=_ICON_PNG_B64)
+    except tk.TclError:
+        pil_image = create_ado_ai_icon()
+        if pil_image is None:
+            return None
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(pil_image, master=root)
+
 def set_application_icon(root):
     """
     Set the custom icon for the application window.
     Args:
         root: The main Tkinter root window
     """
+    # Skip the icon entirely when disabled (e.g. headless/test runs) or the window is gone
+    if os.getenv('ADO_GUI_NO_ICON'):
+        return
     try:
-        # Create and set the custom robot icon
-        pil_image = create_ado_ai_icon()
-        if pil_image:
-            photo_image = ImageTk.PhotoImage(pil_image)
+        if not root.winfo_exists():
+            return
+        
+        # Create the custom robot icon once per root, keeping a strong reference
+        # so Tk doesn't lose the image
+        photo_image = getattr(root, '_ado_icon_photo', None)
+        if photo_image is None:
+            photo_image = _load_icon_photo(root)
+            if photo_image is not None:
+                root._ado_icon_photo = photo_image
+        
+        if photo_image is not None:
             # Set icon for this window and all future windows (including taskbar)
             root.iconphoto(True, photo_image)
             print("✅ Custom Azure DevOps AI Studio icon set successfully!")
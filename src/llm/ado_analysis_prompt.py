@@ -5,160 +5,27 @@ Azure DevOps Work Item Analysis - LLM System Prompt
 This module contains the comprehensive system prompt for OpenArena LLM to analyze
 Azure DevOps work items and identify relationships between them.
 """
+import heapq
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
-class ADOWorkItemAnalysisPrompt:
-    """System prompt generator for ADO work item analysis using OpenArena LLM."""
-    
-    @staticmethod
-    def work_item_to_dict(work_item):
-        """
-        Convert a WorkItem object to dictionary format.
-        
-        Args:
-            work_item: Azure DevOps WorkItem object
-            
-        Returns:
-            dict: Dictionary representation of the work item
-        """
-        if isinstance(work_item, dict):
-            return work_item  # Already a dictionary
-        
-        # Extract AssignedTo properly
-        assigned_to = work_item.fields.get('System.AssignedTo', 'Unassigned')
-        if isinstance(assigned_to, dict) and 'displayName' in assigned_to:
-            assigned_to = assigned_to['displayName']
-        elif not assigned_to or assigned_to == 'Unassigned':
-            assigned_to = 'Unassigned'
-        
-        # Extract CreatedBy properly
-        created_by = work_item.fields.get('System.CreatedBy', 'Unknown')
-        if isinstance(created_by, dict) and 'displayName' in created_by:
-            created_by = created_by['displayName']
-        elif not created_by:
-            created_by = 'Unknown'
-        
-        return {
-            'id': work_item.id,
-            'title': work_item.fields.get('System.Title', 'No Title'),
-            'work_item_type': work_item.fields.get('System.WorkItemType', 'Unknown'),
-            'state': work_item.fields.get('System.State', 'Unknown'),
-            'priority': work_item.fields.get('Microsoft.VSTS.Common.Priority', 'Not specified'),
-            'severity': work_item.fields.get('Microsoft.VSTS.Common.Severity', 'Not specified'),
-            'assigned_to': assigned_to,
-            'created_by': created_by,
-            'created_date': str(work_item.fields.get('System.CreatedDate', 'Unknown')),
-            'tags': work_item.fields.get('System.Tags', ''),
-            'area_path': work_item.fields.get('System.AreaPath', ''),
-            'iteration_path': work_item.fields.get('System.IterationPath', ''),
-            'effort': work_item.fields.get('Microsoft.VSTS.Scheduling.Effort', ''),
-            'story_points': work_item.fields.get('Microsoft.VSTS.Scheduling.StoryPoints', ''),
-            'description': work_item.fields.get('System.Description', 'No description available')
-        }
-    
-    @staticmethod
-    def create_system_prompt(selected_work_item_data, all_work_items_data):
-        """
-        Create a comprehensive system prompt for LLM analysis of ADO work items.
-        
-        Args:
-            selected_work_item_data (dict or WorkItem): Data of the selected work item to analyze
-            all_work_items_data (list): List of all available work items data (dicts or WorkItem objects)
-            
-        Returns:
-            str: Complete system prompt for the LLM
-        """
-        
-        # Convert WorkItem objects to dictionaries if needed
-        if not isinstance(selected_work_item_data, dict):
-            selected_work_item_data = ADOWorkItemAnalysisPrompt.work_item_to_dict(selected_work_item_data)
-        
-        # Convert all work items to dictionaries if needed
-        processed_all_work_items = []
-        for item in all_work_items_data:
-            if not isinstance(item, dict):
-                processed_all_work_items.append(ADOWorkItemAnalysisPrompt.work_item_to_dict(item))
-            else:
-                processed_all_work_items.append(item)
-        
-        # Debug: Log the number of work items being processed
-        print(f"DEBUG: Processing {len(processed_all_work_items)} work items for LLM analysis")
-        if len(processed_all_work_items) > 0:
-            print(f"DEBUG: First work item ID: {processed_all_work_items[0].get('id', 'N/A')}")
-            print(f"DEBUG: Last work item ID: {processed_all_work_items[-1].get('id', 'N/A')}")
-        
-        prompt = f"""You are an expert Azure DevOps work item analyst with deep knowledge of software development methodologies, project management, and technical architecture. Your task is to analyze a selected work item and a collection of all available work items to identify meaningful relationships and dependencies.
-
-## CONTEXT
-You are analyzing work items from an Azure DevOps project to help development teams understand dependencies, plan work effectively, and identify potential risks or opportunities for optimization.
-
-SELECTED WORK ITEM TO ANALYZE
-{ADOWorkItemAnalysisPrompt._format_selected_work_item(selected_work_item_data)}
-
-ALL AVAILABLE WORK ITEMS ({len(processed_all_work_items)} items)
-{ADOWorkItemAnalysisPrompt._format_all_work_items(processed_all_work_items)}
-
-ANALYSIS OBJECTIVES
-1. Primary Goal: Identify work items that are genuinely related to the selected work item
-2. Secondary Goal: Understand the nature and strength of these relationships
-3. Tertiary Goal: Provide insights that could help with project planning and risk management
-
-RELATIONSHIP TYPES TO CONSIDER
-
-1. FUNCTIONAL DEPENDENCIES
-- Prerequisites: Work items that must be completed before the selected item
-- Dependents: Work items that depend on the selected item
-- Blocking: Work items that block progress on the selected item
-
-2. BUSINESS LOGIC RELATIONSHIPS
-- Process Flow: Items that are part of the same business process
-- Feature Groups: Items that implement related features
-- User Journey: Items that affect the same user experience
-
-3. TECHNICAL DEPENDENCIES
-- Shared Components: Items that use the same libraries, APIs, or services
-- Data Dependencies: Items that share data models, databases, or data flows
-- Infrastructure: Items that depend on the same infrastructure or deployment
-
-4. HIERARCHICAL RELATIONSHIPS
-- Epic-Story: Parent-child relationships in agile planning
-- Story-Task: Breakdown relationships
-- Feature-Component: High-level to detailed implementation
-
-5. QUALITY & MAINTENANCE
-- Bug-Fix: Bugs and their corresponding fixes
-- Technical Debt: Items related to code quality improvements
-- Testing: Items related to testing the selected work
-
-6. CROSS-FUNCTIONAL RELATIONSHIPS
-- UI/UX: Items affecting the same user interface
-- Backend/Frontend: Items in different architectural layers
-- Integration: Items that need to work together
-
-ANALYSIS CRITERIA
-
-RELATIONSHIP STRENGTH ASSESSMENT
-- HIGH CONFIDENCE: Clear, direct relationship with strong evidence
-- MEDIUM CONFIDENCE: Probable relationship with some supporting evidence
-- LOW CONFIDENCE: Possible relationship with limited evidence
-
-EVIDENCE WEIGHTING
-- Title Similarity: Keywords, terminology, and naming conventions
-- Description Content: Shared concepts, requirements, or technical details
-- Tags & Categories: Common tags, area paths, or iteration paths
-- Assigned Teams: Same team or related team assignments
-- Timing: Items created or planned in similar timeframes
-- Priority/Effort: Similar business importance or complexity
-
-OUTPUT REQUIREMENTS
-
-STRUCTURED ANALYSIS FORMAT
-
-RELATED WORK ITEMS ANALYSIS
+# One entry in the ALL AVAILABLE WORK ITEMS block, filled by _format_all_work_items
+_ALL_ITEMS_TEMPLATE = """Item {i}:
+- ID: {id}
+- Title: {title}
+- Type: {work_item_type}
+- State: {state}
+- Priority: {priority}
+- Assigned To: {assigned_to}
+- Tags: {tags}
+- Area Path: {area_path}
+- Description: {description}
+---"""
 
-HIGH CONFIDENCE RELATIONSHIPS
+# Instruction blocks shared by the full and simplified prompts
+_RELATIONSHIP_OUTPUT_BLOCK = """HIGH CONFIDENCE RELATIONSHIPS
 For each high-confidence relationship, provide:
 - ID: [Work Item ID]
 - Title: [Full Title]
@@ -184,9 +51,9 @@ RELATIONSHIP PATTERNS ANALYSIS
 - Primary Patterns: [Most common types of relationships found]
 - Dependency Clusters: [Groups of items that form dependency chains]
 - Cross-Team Dependencies: [Relationships spanning multiple teams]
-- Technical Debt Indicators: [Items suggesting technical debt or refactoring needs]
+- Technical Debt Indicators: [Items suggesting technical debt or refactoring needs]"""
 
-DETAILED ANALYSIS SECTIONS
+_DETAILED_SECTIONS_INTRO = """DETAILED ANALYSIS SECTIONS
 
 CRITICAL REQUIREMENT: You MUST provide AT LEAST 2 points for EACH section below. If you cannot identify 2 distinct points for any section, you must think more deeply about potential risks, dependencies, recommendations, and opportunities. Each section is MANDATORY and requires multiple insights.
 
@@ -195,9 +62,9 @@ IMPORTANT FORMATTING REQUIREMENTS:
 - Use plain text with clear headings and structure
 - Use simple bullet points with dashes (-) for lists
 - Use clear section headers without markdown symbols
-- Format each point as: "Risk 1", "Risk 2", "Dependency 1", "Dependency 2", etc.
+- Format each point as: "Risk 1", "Risk 2", "Dependency 1", "Dependency 2", etc."""
 
-RISK ASSESSMENT (MANDATORY: Minimum 2, Maximum 5 points)
+_RISK_SECTION_BLOCK = """RISK ASSESSMENT (MANDATORY: Minimum 2, Maximum 5 points)
 Analyze the selected work item and related work items to identify potential risks. You MUST find at least 2 different types of risks:
 
 1. Technical Risks: Code quality, architecture, integration, performance, security
@@ -211,9 +78,9 @@ For each risk identified, provide:
 - Risk Level: [HIGH/MEDIUM/LOW]
 - Risk Description: [Specific, actionable description of the risk]
 - Impact: [Concrete impact on project success]
-- Mitigation: [Specific steps to address this risk]
+- Mitigation: [Specific steps to address this risk]"""
 
-DEPENDENCIES (MANDATORY: Minimum 2, Maximum 5 points)
+_DEPENDENCY_SECTION_BLOCK = """DEPENDENCIES (MANDATORY: Minimum 2, Maximum 5 points)
 Analyze dependencies that could affect the selected work item. You MUST identify at least 2 different types of dependencies:
 
 1. Technical Dependencies: Code, APIs, infrastructure, tools, libraries
@@ -227,9 +94,9 @@ For each dependency identified, provide:
 - Dependency Level: [CRITICAL/HIGH/MEDIUM/LOW]
 - Dependency Description: [Specific description of the dependency]
 - Impact: [How this affects the selected work item]
-- Action Required: [Specific actions needed to manage this dependency]
+- Action Required: [Specific actions needed to manage this dependency]"""
 
-RECOMMENDATIONS (MANDATORY: Minimum 2, Maximum 5 points)
+_RECOMMENDATION_SECTION_BLOCK = """RECOMMENDATIONS (MANDATORY: Minimum 2, Maximum 5 points)
 Provide actionable recommendations based on your analysis. You MUST suggest at least 2 different types of recommendations:
 
 1. Immediate Actions: What should be done right now
@@ -243,9 +110,9 @@ For each recommendation, provide:
 - Priority Level: [HIGH/MEDIUM/LOW]
 - Recommendation Description: [Specific, actionable recommendation]
 - Rationale: [Why this recommendation is critical]
-- Implementation: [Step-by-step implementation approach]
+- Implementation: [Step-by-step implementation approach]"""
 
-OPPORTUNITIES (MANDATORY: Minimum 2, Maximum 5 points)
+_OPPORTUNITY_SECTION_BLOCK = """OPPORTUNITIES (MANDATORY: Minimum 2, Maximum 5 points)
 Identify opportunities for improvement and optimization. You MUST find at least 2 different types of opportunities:
 
 1. Efficiency Opportunities: Process improvements, automation, optimization
@@ -259,9 +126,84 @@ For each opportunity identified, provide:
 - Opportunity Level: [HIGH/MEDIUM/LOW]
 - Opportunity Description: [Specific description of the opportunity]
 - Benefits: [Concrete benefits this opportunity provides]
-- Action Required: [Specific steps to capitalize on this opportunity]
+- Action Required: [Specific steps to capitalize on this opportunity]"""
+
+_REASONING_INSTRUCTIONS_BLOCK = """IMPORTANT: For the "Why This Work Item Is Relevant" section, write 2-4 clear, user-friendly bullet points that explain:
+1. The specific connection between the work items
+2. How one work item affects or depends on the other
+3. Shared context, requirements, or technical elements
+4. Business impact or timing considerations
+
+Make the reasoning clear and actionable for project managers and developers.
 
-ANALYSIS GUIDELINES
+FINAL REMINDER: You MUST provide AT LEAST 2 points for EACH of the four analysis sections (Risk Assessment, Dependencies, Recommendations, Opportunities). This is a MANDATORY requirement. If you cannot identify 2 distinct points for any section, you must think more deeply and creatively about potential issues and opportunities. Your analysis is incomplete if any section has fewer than 2 points."""
+
+# Static instructions that follow the work item blocks in each prompt, built once at import
+_SYSTEM_PROMPT_TAIL = "\n\n".join([
+    """ANALYSIS OBJECTIVES
+1. Primary Goal: Identify work items that are genuinely related to the selected work item
+2. Secondary Goal: Understand the nature and strength of these relationships
+3. Tertiary Goal: Provide insights that could help with project planning and risk management
+
+RELATIONSHIP TYPES TO CONSIDER
+
+1. FUNCTIONAL DEPENDENCIES
+- Prerequisites: Work items that must be completed before the selected item
+- Dependents: Work items that depend on the selected item
+- Blocking: Work items that block progress on the selected item
+
+2. BUSINESS LOGIC RELATIONSHIPS
+- Process Flow: Items that are part of the same business process
+- Feature Groups: Items that implement related features
+- User Journey: Items that affect the same user experience
+
+3. TECHNICAL DEPENDENCIES
+- Shared Components: Items that use the same libraries, APIs, or services
+- Data Dependencies: Items that share data models, databases, or data flows
+- Infrastructure: Items that depend on the same infrastructure or deployment
+
+4. HIERARCHICAL RELATIONSHIPS
+- Epic-Story: Parent-child relationships in agile planning
+- Story-Task: Breakdown relationships
+- Feature-Component: High-level to detailed implementation
+
+5. QUALITY & MAINTENANCE
+- Bug-Fix: Bugs and their corresponding fixes
+- Technical Debt: Items related to code quality improvements
+- Testing: Items related to testing the selected work
+
+6. CROSS-FUNCTIONAL RELATIONSHIPS
+- UI/UX: Items affecting the same user interface
+- Backend/Frontend: Items in different architectural layers
+- Integration: Items that need to work together
+
+ANALYSIS CRITERIA
+
+RELATIONSHIP STRENGTH ASSESSMENT
+- HIGH CONFIDENCE: Clear, direct relationship with strong evidence
+- MEDIUM CONFIDENCE: Probable relationship with some supporting evidence
+- LOW CONFIDENCE: Possible relationship with limited evidence
+
+EVIDENCE WEIGHTING
+- Title Similarity: Keywords, terminology, and naming conventions
+- Description Content: Shared concepts, requirements, or technical details
+- Tags & Categories: Common tags, area paths, or iteration paths
+- Assigned Teams: Same team or related team assignments
+- Timing: Items created or planned in similar timeframes
+- Priority/Effort: Similar business importance or complexity
+
+OUTPUT REQUIREMENTS
+
+STRUCTURED ANALYSIS FORMAT
+
+RELATED WORK ITEMS ANALYSIS""",
+    _RELATIONSHIP_OUTPUT_BLOCK,
+    _DETAILED_SECTIONS_INTRO,
+    _RISK_SECTION_BLOCK,
+    _DEPENDENCY_SECTION_BLOCK,
+    _RECOMMENDATION_SECTION_BLOCK,
+    _OPPORTUNITY_SECTION_BLOCK,
+    """ANALYSIS GUIDELINES
 
 1. Be Thorough: Review all work items carefully, don't miss potential relationships
 2. Be Specific: Provide concrete evidence and reasoning for each relationship
@@ -288,41 +230,281 @@ QUALITY STANDARDS
 - Consistency: Use consistent terminology and format
 - Actionability: Provide insights that teams can act upon
 
-Please conduct a comprehensive analysis following these guidelines and provide detailed, actionable insights that will help the development team make informed decisions about their work items."""
+Please conduct a comprehensive analysis following these guidelines and provide detailed, actionable insights that will help the development team make informed decisions about their work items.""",
+])
 
-        # Add user-friendly reasoning instruction
-        prompt += """
+# User-friendly reasoning instruction appended to the full system prompt
+_SYSTEM_PROMPT_REMINDER = "\n\n" + _REASONING_INSTRUCTIONS_BLOCK
 
-IMPORTANT: For the "Why This Work Item Is Relevant" section, write 2-4 clear, user-friendly bullet points that explain:
-1. The specific connection between the work items
-2. How one work item affects or depends on the other
-3. Shared context, requirements, or technical elements
-4. Business impact or timing considerations
+# Everything in the full system prompt that doesn't depend on the work items
+_SYSTEM_PROMPT_PREFIX = """You are an expert Azure DevOps work item analyst with deep knowledge of software development methodologies, project management, and technical architecture. Your task is to analyze a selected work item and a collection of all available work items to identify meaningful relationships and dependencies.
 
-Make the reasoning clear and actionable for project managers and developers.
+## CONTEXT
+You are analyzing work items from an Azure DevOps project to help development teams understand dependencies, plan work effectively, and identify potential risks or opportunities for optimization.
 
-FINAL REMINDER: You MUST provide AT LEAST 2 points for EACH of the four analysis sections (Risk Assessment, Dependencies, Recommendations, Opportunities). This is a MANDATORY requirement. If you cannot identify 2 distinct points for any section, you must think more deeply and creatively about potential issues and opportunities. Your analysis is incomplete if any section has fewer than 2 points."""
+""" + _SYSTEM_PROMPT_TAIL + _SYSTEM_PROMPT_REMINDER
 
-        # Debug: Log prompt length
-        print(f"DEBUG: Generated prompt length: {len(prompt)} characters")
-        print(f"DEBUG: Prompt preview (first 200 chars): {prompt[:200]}")
+# Header the batched prompt asks the LLM to start each item's analysis with
+_BATCH_ANALYSIS_HEADER = "=== ANALYSIS FOR ITEM {id} ==="
+_BATCH_ANALYSIS_HEADER_RE = re.compile(r"^=== ANALYSIS FOR ITEM (.+?) ===[ \t]*$", re.MULTILINE)
 
-        return prompt
+_OPTIMIZED_PROMPT_TAIL = """ANALYSIS OBJECTIVES
+1. Primary Goal: Identify the most relevant work items from the semantically similar set
+2. Secondary Goal: Understand the nature and strength of these relationships
+3. Tertiary Goal: Provide actionable insights for project planning
+
+RELATIONSHIP TYPES TO CONSIDER
+1. FUNCTIONAL DEPENDENCIES - Prerequisites, dependents, blocking relationships
+2. BUSINESS LOGIC RELATIONSHIPS - Process flow, feature groups, user journey
+3. TECHNICAL DEPENDENCIES - Shared components, data dependencies, infrastructure
+4. QUALITY & MAINTENANCE - Bug-fix relationships, technical debt, testing
+5. CROSS-FUNCTIONAL RELATIONSHIPS - UI/UX, backend/frontend, integration
+
+ANALYSIS CRITERIA
+- HIGH CONFIDENCE: Clear, direct relationship with strong evidence
+- MEDIUM CONFIDENCE: Probable relationship with some supporting evidence  
+- LOW CONFIDENCE: Possible relationship with limited evidence
+
+OUTPUT REQUIREMENTS
+Provide a structured analysis with:
+
+RELATED WORK ITEMS ANALYSIS
+- HIGH CONFIDENCE RELATIONSHIPS (with ID, Title, Type, State, Priority, Relationship Type, Description, Evidence, Impact)
+- MEDIUM CONFIDENCE RELATIONSHIPS (same format)
+- LOW CONFIDENCE RELATIONSHIPS (same format)
+
+RELATIONSHIP PATTERNS ANALYSIS
+- Primary Patterns: Most common relationship types
+- Dependency Clusters: Groups forming dependency chains
+- Cross-Team Dependencies: Relationships spanning teams
+- Technical Debt Indicators: Items suggesting refactoring needs
+
+RISK ASSESSMENT
+- High-Risk Dependencies: Items significantly impacting the selected work
+- Blocking Issues: Items preventing progress
+- Resource Conflicts: Potential resource allocation issues
+
+RECOMMENDATIONS
+- Immediate Actions: What should be done next
+- Planning Considerations: How this affects project planning
+- Risk Mitigation: Suggestions for reducing risks
+- Optimization Opportunities: Ways to improve efficiency
+
+Focus on the most impactful relationships and provide concise, actionable insights."""
+
+_SIMPLIFIED_PROMPT_TAIL = "\n\n".join([
+    """TASK: Find work items related to the selected item. Consider:
+- Functional dependencies
+- Technical relationships  
+- Business logic connections
+- Shared components or data
+- User experience relationships
+
+OUTPUT FORMAT:
+RELATED WORK ITEMS""",
+    _RELATIONSHIP_OUTPUT_BLOCK,
+    _DETAILED_SECTIONS_INTRO,
+    _RISK_SECTION_BLOCK,
+    _DEPENDENCY_SECTION_BLOCK,
+    _RECOMMENDATION_SECTION_BLOCK,
+    _OPPORTUNITY_SECTION_BLOCK,
+    _REASONING_INSTRUCTIONS_BLOCK,
+])
+
+class ADOWorkItemAnalysisPrompt:
+    """System prompt generator for ADO work item analysis using OpenArena LLM."""
     
     @staticmethod
-    def _format_selected_work_item(work_item_data):
-        """Format the selected work item data for the prompt."""
-        # Fix Created By mapping - extract displayName from the field
-        created_by = work_item_data['created_by']
-        if isinstance(created_by, dict) and 'displayName' in created_by:
-            created_by = created_by['displayName']
-        elif isinstance(created_by, str) and created_by != 'Unknown':
-            # If it's already a string, use it as is
-            pass
-        else:
-            created_by = 'Unknown'
+    def work_item_to_dict(work_item):
+        """
+        Convert a WorkItem object to dictionary format.
         
-        return f"""ID: {work_item_data['id']}
+        Args:
+            work_item: Azure DevOps WorkItem object
+            
+        Returns:
+            dict: Dictionary representation of the work item
+        """
+        if isinstance(work_item, dict):
+            return work_item  # Already a dictionary
+        
+        get = work_item.fields.get
+        
+        # Extract AssignedTo properly
+        assigned_to = get('System.AssignedTo', 'Unassigned')
+        if isinstance(assigned_to, dict) and 'displayName' in assigned_to:
+            assigned_to = assigned_to['displayName']
+        elif not assigned_to or assigned_to == 'Unassigned':
+            assigned_to = 'Unassigned'
+        
+        # Extract CreatedBy properly (always a display name string)
+        created_by = ADOWorkItemAnalysisPrompt._created_by_name(get('System.CreatedBy', 'Unknown'))
+        
+        return {
+            'id': work_item.id,
+            'title': get('System.Title', 'No Title'),
+            'work_item_type': get('System.WorkItemType', 'Unknown'),
+            'state': get('System.State', 'Unknown'),
+            'priority': get('Microsoft.VSTS.Common.Priority', 'Not specified'),
+            'severity': get('Microsoft.VSTS.Common.Severity', 'Not specified'),
+            'assigned_to': assigned_to,
+            'created_by': created_by,
+            'created_date': str(get('System.CreatedDate', 'Unknown')),
+            'tags': get('System.Tags', ''),
+            'area_path': get('System.AreaPath', ''),
+            'iteration_path': get('System.IterationPath', ''),
+            'effort': get('Microsoft.VSTS.Scheduling.Effort', ''),
+            'story_points': get('Microsoft.VSTS.Scheduling.StoryPoints', ''),
+            'description': get('System.Description', 'No description available')
+        }
+    
+    @staticmethod
+    def _created_by_name(created_by):
+        """Return the Created By display name from a string or identity dict, or 'Unknown'."""
+        if isinstance(created_by, dict):
+            created_by = created_by.get('displayName')
+        return created_by if isinstance(created_by, str) and created_by else 'Unknown'
+    
+    @staticmethod
+    def create_system_prompt(selected_work_item_data, all_work_items_data):
+        """
+        Create a comprehensive system prompt for LLM analysis of ADO work items.
+        
+        Args:
+            selected_work_item_data (dict or WorkItem): Data of the selected work item to analyze
+            all_work_items_data (list): List of all available work items data (dicts or WorkItem objects)
+            
+        Returns:
+            str: Complete system prompt for the LLM
+        """
+        
+        # Convert WorkItem objects to dictionaries if needed
+        if not isinstance(selected_work_item_data, dict):
+            selected_work_item_data = ADOWorkItemAnalysisPrompt.work_item_to_dict(selected_work_item_data)
+        
+        # Convert all work items to dictionaries if needed
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in all_work_items_data]
+        
+        # Debug: Log the number of work items being processed
+        logger.debug("Processing %d work items for LLM analysis", len(processed_all_work_items))
+        if processed_all_work_items:
+            logger.debug("First work item ID: %s", processed_all_work_items[0].get('id', 'N/A'))
+            logger.debug("Last work item ID: %s", processed_all_work_items[-1].get('id', 'N/A'))
+        
+        prompt = "".join(ADOWorkItemAnalysisPrompt._iter_system_prompt(selected_work_item_data, processed_all_work_items))
+
+        # Debug: Log prompt length
+        logger.debug("Generated prompt length: %d characters", len(prompt))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prompt preview (first 200 chars): %s", prompt[:200])
+
+        return prompt
+    
+    @staticmethod
+    def iter_system_prompt(selected_work_item_data, all_work_items_data):
+        """
+        Yield the system prompt built by create_system_prompt piece by piece.
+        
+        Lets a caller that can send a body in chunks avoid holding the whole prompt
+        as one string; joining the pieces gives exactly create_system_prompt's result.
+        
+        Args:
+            selected_work_item_data (dict or WorkItem): Data of the selected work item to analyze
+            all_work_items_data (list): List of all available work items data (dicts or WorkItem objects)
+            
+        Yields:
+            str: Consecutive pieces of the prompt
+        """
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        if not isinstance(selected_work_item_data, dict):
+            selected_work_item_data = to_dict(selected_work_item_data)
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in all_work_items_data]
+        return ADOWorkItemAnalysisPrompt._iter_system_prompt(selected_work_item_data, processed_all_work_items)
+    
+    @staticmethod
+    def _iter_system_prompt(selected_work_item_data, processed_all_work_items):
+        """Yield the system prompt pieces for an already-converted work item and list of dicts."""
+        # Static instructions first and work items last, so consecutive requests share
+        # a byte-identical prefix that the LLM service can cache
+        yield _SYSTEM_PROMPT_PREFIX
+        yield "\n\nSELECTED WORK ITEM TO ANALYZE\n"
+        yield ADOWorkItemAnalysisPrompt._format_selected_work_item(selected_work_item_data)
+        yield f"\n\nALL AVAILABLE WORK ITEMS ({len(processed_all_work_items)} items)\n"
+        for i, item_block in enumerate(ADOWorkItemAnalysisPrompt._iter_all_work_items(processed_all_work_items)):
+            if i:
+                yield "\n"
+            yield item_block
+    
+    @staticmethod
+    def create_batched_system_prompt(selected_items, all_work_items_data):
+        """
+        Create one system prompt that analyzes several selected work items in a single LLM call.
+        
+        The instructions and the list of all work items are sent once for the whole batch,
+        and the LLM is asked to start each item's analysis with _BATCH_ANALYSIS_HEADER so
+        the response can be split with split_batched_response.
+        
+        Args:
+            selected_items (list): Selected work items to analyze (dicts or WorkItem objects)
+            all_work_items_data (list): List of all available work items data (dicts or WorkItem objects)
+            
+        Returns:
+            str: Complete batched system prompt for the LLM
+        """
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        selected = [item if isinstance(item, dict) else to_dict(item) for item in selected_items]
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in all_work_items_data]
+        
+        format_selected = ADOWorkItemAnalysisPrompt._format_selected_work_item
+        selected_blocks = "\n\n".join(
+            f"Selected Item {i}:\n{format_selected(item)}" for i, item in enumerate(selected, 1)
+        )
+        header_example = _BATCH_ANALYSIS_HEADER.format(id="<ID>")
+        
+        return f"""{_SYSTEM_PROMPT_PREFIX}
+
+BATCHED ANALYSIS
+Produce the complete analysis described above separately for EACH of the {len(selected)} selected work items below, in the order listed.
+Start each item's analysis with a line containing exactly: {header_example}
+(with <ID> replaced by that item's ID) and do not use that line anywhere else.
+
+SELECTED WORK ITEMS TO ANALYZE ({len(selected)})
+{selected_blocks}
+
+ALL AVAILABLE WORK ITEMS ({len(processed_all_work_items)} items)
+{ADOWorkItemAnalysisPrompt._format_all_work_items(processed_all_work_items)}"""
+    
+    @staticmethod
+    def split_batched_response(response_text):
+        """
+        Split an LLM response to create_batched_system_prompt into per-item analyses.
+        
+        Args:
+            response_text (str): Raw LLM response
+            
+        Returns:
+            dict: Work item ID (as a string) -> that item's analysis text
+        """
+        headers = list(_BATCH_ANALYSIS_HEADER_RE.finditer(response_text))
+        analyses = {}
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            end = next_header.start() if next_header else len(response_text)
+            analyses[header.group(1).strip()] = response_text[header.end():end].strip()
+        return analyses
+    
+    @staticmethod
+    def _trunc(text, limit=800):
+        """Return text cut to limit characters, with '...' appended if anything was cut."""
+        return text if len(text) <= limit else f"{text[:limit]}..."
+    
+    @staticmethod
+    def _format_selected_work_item(work_item_data):
+        """Format the selected work item data for the prompt."""
+        # Callers may pass raw field data, so Created By can still be an identity dict here
+        created_by = ADOWorkItemAnalysisPrompt._created_by_name(work_item_data['created_by'])
+        
+        return f"""ID: {work_item_data['id']}
 Title: {work_item_data['title']}
 Type: {work_item_data['work_item_type']}
 State: {work_item_data['state']}
@@ -338,55 +520,64 @@ Effort: {work_item_data['effort']}
 Story Points: {work_item_data['story_points']}
 
 Description:
-{work_item_data['description'][:800]}{'...' if len(work_item_data['description']) > 800 else ''}"""
+{ADOWorkItemAnalysisPrompt._trunc(work_item_data['description'])}"""
     
     @staticmethod
-    def _format_all_work_items(all_items_data):
-        """Format all work items data for the prompt."""
-        formatted_items = []
+    def _all_items_fields(i, item):
+        """Return the values substituted into _ALL_ITEMS_TEMPLATE for one work item."""
+        # Fix Assigned To - ensure it's not always "Unassigned"
+        assigned_to = item['assigned_to']
+        if assigned_to == 'Unassigned' or not assigned_to:
+            assigned_to = 'Not Assigned'
         
-        for i, item in enumerate(all_items_data, 1):
-            # Fix Assigned To - ensure it's not always "Unassigned"
-            assigned_to = item['assigned_to']
-            if assigned_to == 'Unassigned' or not assigned_to:
-                assigned_to = 'Not Assigned'
-            
-            # Fix tags - ensure proper comma-separated values
-            tags = item['tags']
-            if not tags or tags.strip() == '':
-                tags = 'No tags'
+        # Fix tags - ensure proper comma-separated values
+        tags = item['tags']
+        if not tags or tags.strip() == '':
+            tags = 'No tags'
+        elif isinstance(tags, str):
+            # Split by semicolon and join with comma if needed
+            if ';' in tags:
+                tags = ', '.join([tag.strip() for tag in tags.split(';') if tag.strip()])
             else:
-                # Ensure tags are properly formatted as comma-separated
-                if isinstance(tags, str):
-                    # Split by semicolon and join with comma if needed
-                    if ';' in tags:
-                        tags = ', '.join([tag.strip() for tag in tags.split(';') if tag.strip()])
-                    else:
-                        tags = tags.strip()
-            
-            # Ensure description is included and properly formatted
-            description = item.get('description', 'No description available')
-            if not description or description.strip() == '':
-                description = 'No description available'
-            
-            formatted_item = f"""Item {i}:
-- ID: {item['id']}
-- Title: {item['title']}
-- Type: {item['work_item_type']}
-- State: {item['state']}
-- Priority: {item['priority']}
-- Assigned To: {assigned_to}
-- Tags: {tags}
-- Area Path: {item['area_path']}
-- Description: {description[:800]}{'...' if len(description) > 800 else ''}
----"""
-            formatted_items.append(formatted_item)
+                tags = tags.strip()
         
-        return "\n".join(formatted_items)
+        # Ensure description is included and properly formatted
+        description = item.get('description', 'No description available')
+        if not description or description.strip() == '':
+            description = 'No description available'
+        else:
+            description = ADOWorkItemAnalysisPrompt._trunc(description)
+        
+        return {
+            'i': i,
+            'id': item['id'],
+            'title': item['title'],
+            'work_item_type': item['work_item_type'],
+            'state': item['state'],
+            'priority': item['priority'],
+            'assigned_to': assigned_to,
+            'tags': tags,
+            'area_path': item['area_path'],
+            'description': description,
+        }
+    
+    @staticmethod
+    def _iter_all_work_items(all_items_data):
+        """Yield the formatted entry for each work item in the all-items block."""
+        fill = _ALL_ITEMS_TEMPLATE.format_map
+        fields = ADOWorkItemAnalysisPrompt._all_items_fields
+        for i, item in enumerate(all_items_data, 1):
+            yield fill(fields(i, item))
+    
+    @staticmethod
+    def _format_all_work_items(all_items_data):
+        """Format all work items data for the prompt."""
+        return "\n".join(ADOWorkItemAnalysisPrompt._iter_all_work_items(all_items_data))
     
     @staticmethod
     def _format_optimized_work_items(all_items_data):
         """Format work items data for optimized prompt (concise format)."""
+        trunc = ADOWorkItemAnalysisPrompt._trunc
         formatted_items = []
         
         for i, item in enumerate(all_items_data, 1):
@@ -397,18 +588,25 @@ Description:
             # Simplified format for better performance
             formatted_item = f"""Item {i}{similarity_text}:
 - ID: {item['id']}
-- Title: {item['title'][:100]}{'...' if len(item['title']) > 100 else ''}
+- Title: {trunc(item['title'], 100)}
 - Type: {item['work_item_type']}
 - State: {item['state']}
 - Priority: {item['priority']}
 - Assigned To: {item['assigned_to']}
 - Area Path: {item['area_path']}
-- Tags: {item['tags'][:50]}{'...' if len(item['tags']) > 50 else ''}
+- Tags: {trunc(item['tags'], 50)}
 ---"""
             formatted_items.append(formatted_item)
         
         return "\n".join(formatted_items)
     
+    @staticmethod
+    def _similarity_score(item):
+        """Return the semantic similarity score of a work item dict or object, or 0."""
+        if isinstance(item, dict):
+            return item.get('semanticSimilarityScore', 0)
+        return getattr(item, 'semanticSimilarityScore', 0)
+    
     @staticmethod
     def create_optimized_prompt(selected_work_item_data, all_work_items_data, max_items=10):
         """
@@ -428,20 +626,14 @@ Description:
         if not isinstance(selected_work_item_data, dict):
             selected_work_item_data = ADOWorkItemAnalysisPrompt.work_item_to_dict(selected_work_item_data)
         
-        # Convert all work items to dictionaries and limit the number
-        processed_all_work_items = []
-        limited_items = all_work_items_data[:max_items]  # Limit to max_items first
+        # Keep the max_items most semantically similar work items (for AI Deep Dive), then convert
+        # only those; items without a score count as 0 and otherwise keep their original order
+        limited_items = heapq.nlargest(max_items, all_work_items_data,
+                                       key=ADOWorkItemAnalysisPrompt._similarity_score)
         logger.info(f"Optimized prompt: limiting from {len(all_work_items_data)} to {len(limited_items)} work items")
         
-        for item in limited_items:
-            if not isinstance(item, dict):
-                processed_all_work_items.append(ADOWorkItemAnalysisPrompt.work_item_to_dict(item))
-            else:
-                processed_all_work_items.append(item)
-        
-        # Sort by semantic similarity score if available (for AI Deep Dive)
-        if processed_all_work_items and 'semanticSimilarityScore' in processed_all_work_items[0]:
-            processed_all_work_items.sort(key=lambda x: x.get('semanticSimilarityScore', 0), reverse=True)
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in limited_items]
         
         prompt = f"""You are an expert Azure DevOps work item analyst specializing in AI-powered relationship analysis. Your task is to analyze a selected work item and identify the most relevant relationships from a curated set of semantically similar work items.
 
@@ -454,49 +646,7 @@ SELECTED WORK ITEM TO ANALYZE
 SEMANTICALLY SIMILAR WORK ITEMS ({len(processed_all_work_items)} items - Top Results)
 {ADOWorkItemAnalysisPrompt._format_optimized_work_items(processed_all_work_items)}
 
-ANALYSIS OBJECTIVES
-1. Primary Goal: Identify the most relevant work items from the semantically similar set
-2. Secondary Goal: Understand the nature and strength of these relationships
-3. Tertiary Goal: Provide actionable insights for project planning
-
-RELATIONSHIP TYPES TO CONSIDER
-1. FUNCTIONAL DEPENDENCIES - Prerequisites, dependents, blocking relationships
-2. BUSINESS LOGIC RELATIONSHIPS - Process flow, feature groups, user journey
-3. TECHNICAL DEPENDENCIES - Shared components, data dependencies, infrastructure
-4. QUALITY & MAINTENANCE - Bug-fix relationships, technical debt, testing
-5. CROSS-FUNCTIONAL RELATIONSHIPS - UI/UX, backend/frontend, integration
-
-ANALYSIS CRITERIA
-- HIGH CONFIDENCE: Clear, direct relationship with strong evidence
-- MEDIUM CONFIDENCE: Probable relationship with some supporting evidence  
-- LOW CONFIDENCE: Possible relationship with limited evidence
-
-OUTPUT REQUIREMENTS
-Provide a structured analysis with:
-
-RELATED WORK ITEMS ANALYSIS
-- HIGH CONFIDENCE RELATIONSHIPS (with ID, Title, Type, State, Priority, Relationship Type, Description, Evidence, Impact)
-- MEDIUM CONFIDENCE RELATIONSHIPS (same format)
-- LOW CONFIDENCE RELATIONSHIPS (same format)
-
-RELATIONSHIP PATTERNS ANALYSIS
-- Primary Patterns: Most common relationship types
-- Dependency Clusters: Groups forming dependency chains
-- Cross-Team Dependencies: Relationships spanning teams
-- Technical Debt Indicators: Items suggesting refactoring needs
-
-RISK ASSESSMENT
-- High-Risk Dependencies: Items significantly impacting the selected work
-- Blocking Issues: Items preventing progress
-- Resource Conflicts: Potential resource allocation issues
-
-RECOMMENDATIONS
-- Immediate Actions: What should be done next
-- Planning Considerations: How this affects project planning
-- Risk Mitigation: Suggestions for reducing risks
-- Optimization Opportunities: Ways to improve efficiency
-
-Focus on the most impactful relationships and provide concise, actionable insights."""
+""" + _OPTIMIZED_PROMPT_TAIL
 
         return prompt
 
@@ -518,12 +668,8 @@ Focus on the most impactful relationships and provide concise, actionable insigh
             selected_work_item_data = ADOWorkItemAnalysisPrompt.work_item_to_dict(selected_work_item_data)
         
         # Convert all work items to dictionaries if needed
-        processed_all_work_items = []
-        for item in all_work_items_data:
-            if not isinstance(item, dict):
-                processed_all_work_items.append(ADOWorkItemAnalysisPrompt.work_item_to_dict(item))
-            else:
-                processed_all_work_items.append(item)
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in all_work_items_data]
         
         prompt = f"""You are an Azure DevOps work item analyst. Analyze the selected work item and find related items from the available list.
 
@@ -532,133 +678,12 @@ ID: {selected_work_item_data['id']}
 Title: {selected_work_item_data['title']}
 Type: {selected_work_item_data['work_item_type']}
 State: {selected_work_item_data['state']}
-Description: {selected_work_item_data['description'][:800]}{'...' if len(selected_work_item_data['description']) > 800 else ''}
+Description: {ADOWorkItemAnalysisPrompt._trunc(selected_work_item_data['description'])}
 
 AVAILABLE WORK ITEMS ({len(processed_all_work_items)} items):
 {ADOWorkItemAnalysisPrompt._format_simplified_work_items(processed_all_work_items)}
 
-TASK: Find work items related to the selected item. Consider:
-- Functional dependencies
-- Technical relationships  
-- Business logic connections
-- Shared components or data
-- User experience relationships
-
-OUTPUT FORMAT:
-RELATED WORK ITEMS
-
-HIGH CONFIDENCE RELATIONSHIPS
-For each high-confidence relationship, provide:
-- ID: [Work Item ID]
-- Title: [Full Title]
-- Type: [Work Item Type]
-- State: [Current State]
-- Priority: [Priority Level]
-- Relationship Type: [Specific relationship category]
-- Why This Work Item Is Relevant: [2-4 bullet points explaining the relevance in user-friendly language]
-  • [First reason - be specific about the connection]
-  • [Second reason - explain the impact or dependency]
-  • [Third reason - mention shared context or requirements]
-  • [Fourth reason - if applicable, explain timing or priority alignment]
-
-IMPORTANT FORMATTING: Each bullet point must be on a separate line. Use proper line breaks between each bullet point.
-
-MEDIUM CONFIDENCE RELATIONSHIPS
-[Same format as above with 2-4 bullet points explaining relevance]
-
-LOW CONFIDENCE RELATIONSHIPS
-[Same format as above with 2-4 bullet points explaining relevance]
-
-RELATIONSHIP PATTERNS ANALYSIS
-- Primary Patterns: [Most common types of relationships found]
-- Dependency Clusters: [Groups of items that form dependency chains]
-- Cross-Team Dependencies: [Relationships spanning multiple teams]
-- Technical Debt Indicators: [Items suggesting technical debt or refactoring needs]
-
-DETAILED ANALYSIS SECTIONS
-
-CRITICAL REQUIREMENT: You MUST provide AT LEAST 2 points for EACH section below. If you cannot identify 2 distinct points for any section, you must think more deeply about potential risks, dependencies, recommendations, and opportunities. Each section is MANDATORY and requires multiple insights.
-
-IMPORTANT FORMATTING REQUIREMENTS:
-- Do NOT use markdown formatting (no ##, ###, **, or other markdown symbols)
-- Use plain text with clear headings and structure
-- Use simple bullet points with dashes (-) for lists
-- Use clear section headers without markdown symbols
-- Format each point as: "Risk 1", "Risk 2", "Dependency 1", "Dependency 2", etc.
-
-RISK ASSESSMENT (MANDATORY: Minimum 2, Maximum 5 points)
-Analyze the selected work item and related work items to identify potential risks. You MUST find at least 2 different types of risks:
-
-1. Technical Risks: Code quality, architecture, integration, performance, security
-2. Resource Risks: Team capacity, skill gaps, availability, workload distribution
-3. Timeline Risks: Deadlines, dependencies, delays, sprint planning
-4. External Risks: Third-party dependencies, external team coordination, business changes
-5. Process Risks: Workflow bottlenecks, communication gaps, quality assurance
-
-For each risk identified, provide:
-- Risk Category: [Technical/Resource/Timeline/External/Process]
-- Risk Level: [HIGH/MEDIUM/LOW]
-- Risk Description: [Specific, actionable description of the risk]
-- Impact: [Concrete impact on project success]
-- Mitigation: [Specific steps to address this risk]
-
-DEPENDENCIES (MANDATORY: Minimum 2, Maximum 5 points)
-Analyze dependencies that could affect the selected work item. You MUST identify at least 2 different types of dependencies:
-
-1. Technical Dependencies: Code, APIs, infrastructure, tools, libraries
-2. Resource Dependencies: Team members, skills, external teams, vendors
-3. Timeline Dependencies: Sprint schedules, milestone dependencies, release cycles
-4. Process Dependencies: Workflow steps, approvals, testing, deployment
-5. Business Dependencies: Requirements, stakeholders, external factors
-
-For each dependency identified, provide:
-- Dependency Type: [Technical/Resource/Timeline/Process/Business]
-- Dependency Level: [CRITICAL/HIGH/MEDIUM/LOW]
-- Dependency Description: [Specific description of the dependency]
-- Impact: [How this affects the selected work item]
-- Action Required: [Specific actions needed to manage this dependency]
-
-RECOMMENDATIONS (MANDATORY: Minimum 2, Maximum 5 points)
-Provide actionable recommendations based on your analysis. You MUST suggest at least 2 different types of recommendations:
-
-1. Immediate Actions: What should be done right now
-2. Planning Actions: How to improve project planning and coordination
-3. Process Improvements: Workflow, communication, quality processes
-4. Technical Actions: Code quality, architecture, testing improvements
-5. Risk Mitigation: Specific steps to reduce identified risks
-
-For each recommendation, provide:
-- Recommendation Type: [Immediate Action/Planning/Process/Technical/Risk Mitigation]
-- Priority Level: [HIGH/MEDIUM/LOW]
-- Recommendation Description: [Specific, actionable recommendation]
-- Rationale: [Why this recommendation is critical]
-- Implementation: [Step-by-step implementation approach]
-
-OPPORTUNITIES (MANDATORY: Minimum 2, Maximum 5 points)
-Identify opportunities for improvement and optimization. You MUST find at least 2 different types of opportunities:
-
-1. Efficiency Opportunities: Process improvements, automation, optimization
-2. Collaboration Opportunities: Team coordination, knowledge sharing, cross-functional work
-3. Learning Opportunities: Skill development, knowledge transfer, best practices
-4. Innovation Opportunities: New approaches, technologies, methodologies
-5. Business Opportunities: Value creation, customer impact, competitive advantage
-
-For each opportunity identified, provide:
-- Opportunity Type: [Efficiency/Collaboration/Learning/Innovation/Business]
-- Opportunity Level: [HIGH/MEDIUM/LOW]
-- Opportunity Description: [Specific description of the opportunity]
-- Benefits: [Concrete benefits this opportunity provides]
-- Action Required: [Specific steps to capitalize on this opportunity]
-
-IMPORTANT: For the "Why This Work Item Is Relevant" section, write 2-4 clear, user-friendly bullet points that explain:
-1. The specific connection between the work items
-2. How one work item affects or depends on the other
-3. Shared context, requirements, or technical elements
-4. Business impact or timing considerations
-
-Make the reasoning clear and actionable for project managers and developers.
-
-FINAL REMINDER: You MUST provide AT LEAST 2 points for EACH of the four analysis sections (Risk Assessment, Dependencies, Recommendations, Opportunities). This is a MANDATORY requirement. If you cannot identify 2 distinct points for any section, you must think more deeply and creatively about potential issues and opportunities. Your analysis is incomplete if any section has fewer than 2 points."""
+""" + _SIMPLIFIED_PROMPT_TAIL
 
         return prompt
     
@@ -692,12 +717,8 @@ FINAL REMINDER: You MUST provide AT LEAST 2 points for EACH of the four analysis
             selected_work_item_data = ADOWorkItemAnalysisPrompt.work_item_to_dict(selected_work_item_data)
         
         # Convert all work items to dictionaries if needed
-        processed_all_work_items = []
-        for item in all_work_items_data:
-            if not isinstance(item, dict):
-                processed_all_work_items.append(ADOWorkItemAnalysisPrompt.work_item_to_dict(item))
-            else:
-                processed_all_work_items.append(item)
+        to_dict = ADOWorkItemAnalysisPrompt.work_item_to_dict
+        processed_all_work_items = [item if isinstance(item, dict) else to_dict(item) for item in all_work_items_data]
         
         # Apply data fixes to selected work item
         fixed_selected_data = ADOWorkItemAnalysisPrompt._fix_selected_work_item_data(selected_work_item_data)
@@ -720,195 +741,7 @@ SELECTED WORK ITEM TO ANALYZE
 ALL AVAILABLE WORK ITEMS ({len(fixed_all_items_data)} items)
 {ADOWorkItemAnalysisPrompt._format_all_work_items(fixed_all_items_data)}
 
-ANALYSIS OBJECTIVES
-1. Primary Goal: Identify work items that are genuinely related to the selected work item
-2. Secondary Goal: Understand the nature and strength of these relationships
-3. Tertiary Goal: Provide insights that could help with project planning and risk management
-
-RELATIONSHIP TYPES TO CONSIDER
-
-1. FUNCTIONAL DEPENDENCIES
-- Prerequisites: Work items that must be completed before the selected item
-- Dependents: Work items that depend on the selected item
-- Blocking: Work items that block progress on the selected item
-
-2. BUSINESS LOGIC RELATIONSHIPS
-- Process Flow: Items that are part of the same business process
-- Feature Groups: Items that implement related features
-- User Journey: Items that affect the same user experience
-
-3. TECHNICAL DEPENDENCIES
-- Shared Components: Items that use the same libraries, APIs, or services
-- Data Dependencies: Items that share data models, databases, or data flows
-- Infrastructure: Items that depend on the same infrastructure or deployment
-
-4. HIERARCHICAL RELATIONSHIPS
-- Epic-Story: Parent-child relationships in agile planning
-- Story-Task: Breakdown relationships
-- Feature-Component: High-level to detailed implementation
-
-5. QUALITY & MAINTENANCE
-- Bug-Fix: Bugs and their corresponding fixes
-- Technical Debt: Items related to code quality improvements
-- Testing: Items related to testing the selected work
-
-6. CROSS-FUNCTIONAL RELATIONSHIPS
-- UI/UX: Items affecting the same user interface
-- Backend/Frontend: Items in different architectural layers
-- Integration: Items that need to work together
-
-ANALYSIS CRITERIA
-
-RELATIONSHIP STRENGTH ASSESSMENT
-- HIGH CONFIDENCE: Clear, direct relationship with strong evidence
-- MEDIUM CONFIDENCE: Probable relationship with some supporting evidence
-- LOW CONFIDENCE: Possible relationship with limited evidence
-
-EVIDENCE WEIGHTING
-- Title Similarity: Keywords, terminology, and naming conventions
-- Description Content: Shared concepts, requirements, or technical details
-- Tags & Categories: Common tags, area paths, or iteration paths
-- Assigned Teams: Same team or related team assignments
-- Timing: Items created or planned in similar timeframes
-- Priority/Effort: Similar business importance or complexity
-
-OUTPUT REQUIREMENTS
-
-STRUCTURED ANALYSIS FORMAT
-
-RELATED WORK ITEMS ANALYSIS
-
-HIGH CONFIDENCE RELATIONSHIPS
-For each high-confidence relationship, provide:
-- ID: [Work Item ID]
-- Title: [Full Title]
-- Type: [Work Item Type]
-- State: [Current State]
-- Priority: [Priority Level]
-- Relationship Type: [Specific relationship category]
-- Why This Work Item Is Relevant: [2-4 bullet points explaining the relevance in user-friendly language]
-  • [First reason - be specific about the connection]
-  • [Second reason - explain the impact or dependency]
-  • [Third reason - mention shared context or requirements]
-  • [Fourth reason - if applicable, explain timing or priority alignment]
-
-IMPORTANT FORMATTING: Each bullet point must be on a separate line. Use proper line breaks between each bullet point.
-
-MEDIUM CONFIDENCE RELATIONSHIPS
-[Same format as above with 2-4 bullet points explaining relevance]
-
-LOW CONFIDENCE RELATIONSHIPS
-[Same format as above with 2-4 bullet points explaining relevance]
-
-RELATIONSHIP PATTERNS ANALYSIS
-- Primary Patterns: [Most common types of relationships found]
-- Dependency Clusters: [Groups of items that form dependency chains]
-- Cross-Team Dependencies: [Relationships spanning multiple teams]
-- Technical Debt Indicators: [Items suggesting technical debt or refactoring needs]
-
-DETAILED ANALYSIS SECTIONS
-
-CRITICAL REQUIREMENT: You MUST provide AT LEAST 2 points for EACH section below. If you cannot identify 2 distinct points for any section, you must think more deeply about potential risks, dependencies, recommendations, and opportunities. Each section is MANDATORY and requires multiple insights.
-
-IMPORTANT FORMATTING REQUIREMENTS:
-- Do NOT use markdown formatting (no ##, ###, **, or other markdown symbols)
-- Use plain text with clear headings and structure
-- Use simple bullet points with dashes (-) for lists
-- Use clear section headers without markdown symbols
-- Format each point as: "Risk 1", "Risk 2", "Dependency 1", "Dependency 2", etc.
-
-RISK ASSESSMENT (MANDATORY: Minimum 2, Maximum 5 points)
-Analyze the selected work item and related work items to identify potential risks. You MUST find at least 2 different types of risks:
-
-1. Technical Risks: Code quality, architecture, integration, performance, security
-2. Resource Risks: Team capacity, skill gaps, availability, workload distribution
-3. Timeline Risks: Deadlines, dependencies, delays, sprint planning
-4. External Risks: Third-party dependencies, external team coordination, business changes
-5. Process Risks: Workflow bottlenecks, communication gaps, quality assurance
-
-For each risk identified, provide:
-- Risk Category: [Technical/Resource/Timeline/External/Process]
-- Risk Level: [HIGH/MEDIUM/LOW]
-- Risk Description: [Specific, actionable description of the risk]
-- Impact: [Concrete impact on project success]
-- Mitigation: [Specific steps to address this risk]
-
-DEPENDENCIES (MANDATORY: Minimum 2, Maximum 5 points)
-Analyze dependencies that could affect the selected work item. You MUST identify at least 2 different types of dependencies:
-
-1. Technical Dependencies: Code, APIs, infrastructure, tools, libraries
-2. Resource Dependencies: Team members, skills, external teams, vendors
-3. Timeline Dependencies: Sprint schedules, milestone dependencies, release cycles
-4. Process Dependencies: Workflow steps, approvals, testing, deployment
-5. Business Dependencies: Requirements, stakeholders, external factors
-
-For each dependency identified, provide:
-- Dependency Type: [Technical/Resource/Timeline/Process/Business]
-- Dependency Level: [CRITICAL/HIGH/MEDIUM/LOW]
-- Dependency Description: [Specific description of the dependency]
-- Impact: [How this affects the selected work item]
-- Action Required: [Specific actions needed to manage this dependency]
-
-RECOMMENDATIONS (MANDATORY: Minimum 2, Maximum 5 points)
-Provide actionable recommendations based on your analysis. You MUST suggest at least 2 different types of recommendations:
-
-1. Immediate Actions: What should be done right now
-2. Planning Actions: How to improve project planning and coordination
-3. Process Improvements: Workflow, communication, quality processes
-4. Technical Actions: Code quality, architecture, testing improvements
-5. Risk Mitigation: Specific steps to reduce identified risks
-
-For each recommendation, provide:
-- Recommendation Type: [Immediate Action/Planning/Process/Technical/Risk Mitigation]
-- Priority Level: [HIGH/MEDIUM/LOW]
-- Recommendation Description: [Specific, actionable recommendation]
-- Rationale: [Why this recommendation is critical]
-- Implementation: [Step-by-step implementation approach]
-
-OPPORTUNITIES (MANDATORY: Minimum 2, Maximum 5 points)
-Identify opportunities for improvement and optimization. You MUST find at least 2 different types of opportunities:
-
-1. Efficiency Opportunities: Process improvements, automation, optimization
-2. Collaboration Opportunities: Team coordination, knowledge sharing, cross-functional work
-3. Learning Opportunities: Skill development, knowledge transfer, best practices
-4. Innovation Opportunities: New approaches, technologies, methodologies
-5. Business Opportunities: Value creation, customer impact, competitive advantage
-
-For each opportunity identified, provide:
-- Opportunity Type: [Efficiency/Collaboration/Learning/Innovation/Business]
-- Opportunity Level: [HIGH/MEDIUM/LOW]
-- Opportunity Description: [Specific description of the opportunity]
-- Benefits: [Concrete benefits this opportunity provides]
-- Action Required: [Specific steps to capitalize on this opportunity]
-
-ANALYSIS GUIDELINES
-
-1. Be Thorough: Review all work items carefully, don't miss potential relationships
-2. Be Specific: Provide concrete evidence and reasoning for each relationship
-3. Be Practical: Focus on relationships that matter for project execution
-4. Be Objective: Base analysis on evidence, not assumptions
-5. Consider Context: Understand the broader project and business context
-6. Prioritize Impact: Focus on relationships that have the most significant impact
-
-MANDATORY MULTIPLE POINTS REQUIREMENT:
-- You MUST generate AT LEAST 2 distinct points for Risk Assessment
-- You MUST generate AT LEAST 2 distinct points for Dependencies  
-- You MUST generate AT LEAST 2 distinct points for Recommendations
-- You MUST generate AT LEAST 2 distinct points for Opportunities
-- If you only provide 1 point for any section, your analysis is INCOMPLETE
-- Think creatively and deeply about different angles and perspectives
-- Consider both obvious and subtle risks, dependencies, recommendations, and opportunities
-- Look at technical, business, process, and human factors
-- Consider short-term and long-term implications
-
-QUALITY STANDARDS
-- Accuracy: Ensure all relationships are genuinely meaningful
-- Completeness: Cover all significant relationship types
-- Clarity: Make explanations clear and actionable
-- Consistency: Use consistent terminology and format
-- Actionability: Provide insights that teams can act upon
-
-Please conduct a comprehensive analysis following these guidelines and provide detailed, actionable insights that will help the development team make informed decisions about their work items."""
+""" + _SYSTEM_PROMPT_TAIL
         
         return prompt
     
@@ -918,14 +751,7 @@ Please conduct a comprehensive analysis following these guidelines and provide d
         fixed_data = work_item_data.copy()
         
         # Fix Created By mapping - extract displayName from the field
-        created_by = fixed_data.get('created_by', 'Unknown')
-        if isinstance(created_by, dict) and 'displayName' in created_by:
-            fixed_data['created_by'] = created_by['displayName']
-        elif isinstance(created_by, str) and created_by != 'Unknown':
-            # If it's already a string, use it as is
-            pass
-        else:
-            fixed_data['created_by'] = 'Unknown'
+        fixed_data['created_by'] = ADOWorkItemAnalysisPrompt._created_by_name(fixed_data.get('created_by', 'Unknown'))
         
         # Ensure description is included and properly formatted
         description = fixed_data.get('description', 'No description available')
@@ -970,7 +796,7 @@ Please conduct a comprehensive analysis following these guidelines and provide d
         print(f"\n=== DEBUG: {item_name} ===")
         print(f"ID: {work_item_data.get('id', 'MISSING')}")
         print(f"Title: {work_item_data.get('title', 'MISSING')}")
-        print(f"Description: {work_item_data.get('description', 'MISSING')[:100]}{'...' if len(work_item_data.get('description', '')) > 100 else ''}")
+        print(f"Description: {ADOWorkItemAnalysisPrompt._trunc(work_item_data.get('description', 'MISSING'), 100)}")
         print(f"Type: {work_item_data.get('work_item_type', 'MISSING')}")
         print(f"State: {work_item_data.get('state', 'MISSING')}")
         print(f"Assigned To: {work_item_data.get('assigned_to', 'MISSING')}")
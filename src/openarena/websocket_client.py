@@ -7,7 +7,7 @@ Connects to OpenArena via WebSocket for LLM-powered backlog refinement
 import json
 import logging
 import os
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from websockets.sync.client import connect
 import asyncio
 from datetime import datetime
@@ -95,7 +95,8 @@ class OpenArenaWebSocketClient:
             raise e
     
     def _handle_large_message(self, query: str, workflow_id: str, is_persistence_allowed: bool,
-                            current_size: int, max_size: int, safe_size: int) -> Tuple[str, Dict[str, Any]]:
+                            current_size: int, max_size: int, safe_size: int,
+                            on_chunk: Optional[Callable[[str], None]] = None) -> Tuple[str, Dict[str, Any]]:
         """
         Handle messages that are too large by implementing intelligent chunking strategies.
         
@@ -106,6 +107,7 @@ class OpenArenaWebSocketClient:
             current_size: Current message size in bytes
             max_size: Maximum allowed message size
             safe_size: Safe message size limit
+            on_chunk: Optional callback called with each answer fragment as it arrives
             
         Returns:
             Tuple of (answer, cost_tracker) or None if chunking fails
@@ -116,24 +118,25 @@ class OpenArenaWebSocketClient:
         truncated_query = self._truncate_query_intelligently(query, safe_size)
         if truncated_query:
             self.logger.info("Using smart truncation strategy")
-            return self._send_chunked_query(workflow_id, truncated_query, is_persistence_allowed)
+            return self._send_chunked_query(workflow_id, truncated_query, is_persistence_allowed, on_chunk)
         
         # Strategy 2: Summary approach - create a high-level summary
         summary_query = self._create_summary_query(query, safe_size)
         if summary_query:
             self.logger.info("Using summary strategy")
-            return self._send_chunked_query(workflow_id, summary_query, is_persistence_allowed)
+            return self._send_chunked_query(workflow_id, summary_query, is_persistence_allowed, on_chunk)
         
         # Strategy 3: Minimal approach - send only essential information
         minimal_query = self._create_minimal_query(query, safe_size)
         if minimal_query:
             self.logger.info("Using minimal strategy")
-            return self._send_chunked_query(workflow_id, minimal_query, is_persistence_allowed)
+            return self._send_chunked_query(workflow_id, minimal_query, is_persistence_allowed, on_chunk)
         
         self.logger.error("All chunking strategies failed")
         return None
     
-    def _send_chunked_query(self, workflow_id: str, chunked_query: str, is_persistence_allowed: bool) -> Tuple[str, Dict[str, Any]]:
+    def _send_chunked_query(self, workflow_id: str, chunked_query: str, is_persistence_allowed: bool,
+                            on_chunk: Optional[Callable[[str], None]] = None) -> Tuple[str, Dict[str, Any]]:
         """Send a chunked query and return the result."""
         msg = {
             "action": "SendMessage",
@@ -175,6 +178,8 @@ class OpenArenaWebSocketClient:
                         for model, value in message_data.items():
                             if "answer" in value:
                                 answer += value["answer"]
+                                if on_chunk:
+                                    on_chunk(value["answer"])
                             elif "cost_track" in value:
                                 cost_tracker = value['cost_track']
                                 eof = True
@@ -402,7 +407,8 @@ This is a minimal analysis due to message size constraints.
         self.logger.info(f"Created minimal query with {len(minimal_query)} characters, {work_item_count} related items")
         return minimal_query if len(minimal_query) < len(query) else None
 
-    def query_workflow(self, workflow_id: str, query: str, is_persistence_allowed: bool = False) -> Tuple[str, Dict[str, Any]]:
+    def query_workflow(self, workflow_id: str, query: str, is_persistence_allowed: bool = False,
+                       on_chunk: Optional[Callable[[str], None]] = None) -> Tuple[str, Dict[str, Any]]:
         """
         Send query to OpenArena workflow via WebSocket
         
@@ -410,6 +416,8 @@ This is a minimal analysis due to message size constraints.
             workflow_id: Workflow ID to use
             query: Query string to send
             is_persistence_allowed: Whether to allow persistence
+            on_chunk: Optional callback called with each answer fragment as it arrives,
+                so callers can show the response while it streams in
             
         Returns:
             Tuple of (answer, cost_tracker)
@@ -458,7 +466,7 @@ This is a minimal analysis due to message size constraints.
             
             # Try to chunk the message intelligently
             chunked_result = self._handle_large_message(query, workflow_id, is_persistence_allowed, 
-                                                      msg_size, max_frame_size, safe_frame_size)
+                                                      msg_size, max_frame_size, safe_frame_size, on_chunk)
             if chunked_result:
                 return chunked_result
             
@@ -504,6 +512,8 @@ This is a minimal analysis due to message size constraints.
                         for model, value in message_data.items():
                             if "answer" in value:
                                 answer += value["answer"]
+                                if on_chunk:
+                                    on_chunk(value["answer"])
                             elif "cost_track" in value:
                                 cost_tracker = value['cost_track']
                                 eof = True